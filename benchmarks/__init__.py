@@ -0,0 +1,5 @@
+"""
+Benchmark package.
+Reproducible throughput workloads.
+Measures only; never changes system behavior.
+"""
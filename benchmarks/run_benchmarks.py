@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+run_benchmarks.py
+
+Runs the throughput workloads and writes JSON results.
+With --compare, fails when any metric regresses past the threshold
+relative to a stored baseline.
+
+Run with: python benchmarks/run_benchmarks.py --output bench.json
+          python benchmarks/run_benchmarks.py --compare bench.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.workloads import WORKLOADS, measure
+
+# Metrics where a larger value is a regression
+LOWER_IS_BETTER = {"peak_memory_bytes"}
+
+
+def run_suite(sizes: List[int], scale: int, repeats: int) -> Dict[str, Any]:
+    results: Dict[str, Dict[str, float]] = {}
+
+    for name, (factory, sized) in WORKLOADS.items():
+        for n_states in (sizes if sized else sizes[:1]):
+            key = f"{name}[n={n_states}]" if sized else name
+            results[key] = measure(factory, n_states, scale, repeats)
+            print(f"{key}: " + ", ".join(f"{m}={v:,.0f}" for m, v in sorted(results[key].items())))
+
+    return {
+        "config": {"sizes": sizes, "scale": scale, "repeats": repeats},
+        "environment": {"python": platform.python_version(), "machine": platform.machine()},
+        "results": results
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Return one message per metric that regressed beyond threshold.
+    A baseline workload or metric missing from the current results is a
+    regression too: an unmeasured metric must not pass the gate.
+    """
+    regressions = []
+
+    for key, base_metrics in sorted(baseline["results"].items()):
+        metrics = current["results"].get(key)
+        if metrics is None:
+            regressions.append(f"{key}: missing from current results")
+            continue
+
+        for metric, base_value in sorted(base_metrics.items()):
+            if metric not in metrics:
+                regressions.append(f"{key} {metric}: missing from current results")
+                continue
+            if base_value <= 0:
+                continue
+
+            value = metrics[metric]
+            if metric in LOWER_IS_BETTER:
+                change = (value - base_value) / base_value
+            else:
+                change = (base_value - value) / base_value
+
+            if change > threshold:
+                regressions.append(
+                    f"{key} {metric}: {value:,.0f} vs baseline {base_value:,.0f} "
+                    f"({change:.1%} worse, threshold {threshold:.0%})"
+                )
+
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Throughput benchmarks")
+    parser.add_argument("--sizes", default="16,256,4096",
+                        help="comma-separated synthetic state-space sizes")
+    parser.add_argument("--scale", type=int, default=200,
+                        help="episodes per workload (decisions/fusions scale with it)")
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--output", help="write JSON results to this path")
+    parser.add_argument("--compare", help="baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed relative regression before failing")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    current = run_suite(sizes, args.scale, args.repeats)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(current, handle, indent=2, sort_keys=True)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as handle:
+            baseline = json.load(handle)
+
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print("REGRESSIONS:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print("No regressions against baseline")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+"""
+synthetic.py
+
+Parameterized synthetic environment and tabular policy
+for throughput measurement. Fully deterministic.
+"""
+
+import time
+from collections import namedtuple
+from typing import Any, Dict
+
+from core.action import ACTION_LOOKUP, Action
+from core.contracts import ACTION_SET, REWARD_RANGE
+from core.state import State
+
+StepResult = namedtuple('StepResult', ['next_state', 'reward', 'done', 'info'])
+
+
+class SyntheticEnvironment:
+    """
+    Ring of n_states positions.
+    Every step advances one position (EXPLORE advances two),
+    so episodes sweep the state space. COMMIT pays off only
+    at the goal position.
+
+    typed: emit core.state.State records instead of dicts; step()
+    then accepts Action members as well as names.
+    """
+
+    def __init__(self, n_states: int = 16, episode_length: int = 50, typed: bool = False):
+        if n_states <= 0:
+            raise ValueError(f"n_states must be positive, got {n_states}")
+        if episode_length <= 0:
+            raise ValueError(f"episode_length must be positive, got {episode_length}")
+
+        self.n_states = n_states
+        self.episode_length = episode_length
+        self.goal = n_states // 2
+        self.typed = typed
+        self.reset()
+
+    def reset(self) -> Dict[str, Any]:
+        self.step_count = 0
+        self.position = 0
+        self.total_reward = 0.0
+        return self._state(Action.WAIT if self.typed else "WAIT")
+
+    def step(self, action: str) -> StepResult:
+        if self.typed:
+            action = ACTION_LOOKUP[action]
+        self.step_count += 1
+        reward = self._reward(action)
+
+        stride = 2 if action is Action.EXPLORE or action == "EXPLORE" else 1
+        self.position = (self.position + stride) % self.n_states
+
+        min_reward, max_reward = REWARD_RANGE
+        self.total_reward = min(max(self.total_reward + reward, min_reward), max_reward)
+        done = self.step_count >= self.episode_length
+
+        return StepResult(self._state(action), reward, done, {})
+
+    def checkpoint(self) -> Dict[str, Any]:
+        return {"step_count": self.step_count, "position": self.position, "total_reward": self.total_reward}
+
+    def restore(self, checkpoint: Dict[str, Any]) -> None:
+        self.step_count = checkpoint["step_count"]
+        self.position = checkpoint["position"]
+        self.total_reward = checkpoint["total_reward"]
+
+    def _reward(self, action: str) -> float:
+        # Action members compare by code, names by string
+        if action is Action.COMMIT or action == "COMMIT":
+            return 1.0 if self.position == self.goal else -0.1
+        return 0.0
+
+    def _state(self, previous_action: str) -> Dict[str, Any]:
+        if self.typed:
+            return State(self.step_count, self.position / self.n_states, previous_action, self.total_reward)
+        return {
+            "current_step": self.step_count,
+            "observed_signal": self.position / self.n_states,
+            "previous_action": previous_action,
+            "accumulated_reward": self.total_reward
+        }
+
+
+class LatencyEnvironment:
+    """
+    Wraps an environment so every step() also waits latency_seconds,
+    standing in for a slow external simulator. The wait releases the
+    GIL, as a socket or subprocess round trip would.
+    """
+
+    def __init__(self, environment, latency_seconds: float):
+        if latency_seconds < 0:
+            raise ValueError(f"latency_seconds must be non-negative, got {latency_seconds}")
+        self.environment = environment
+        self.latency_seconds = latency_seconds
+
+    def reset(self) -> Dict[str, Any]:
+        return self.environment.reset()
+
+    def step(self, action: str) -> StepResult:
+        time.sleep(self.latency_seconds)
+        return self.environment.step(action)
+
+
+def _encode_key(key: tuple) -> str:
+    signal, previous_action = key
+    return f"{signal!r}|{previous_action}"
+
+
+def _decode_key(encoded: str) -> tuple:
+    signal, previous_action = encoded.split("|")
+    return (float(signal), previous_action)
+
+
+class SyntheticPolicy:
+    """
+    Reward-accumulating table keyed by (observed_signal, previous_action).
+    Table size is bounded by n_states * len(ACTION_SET).
+
+    typed: expect core.state.State records and key the table by
+    Action; snapshots are identical to the untyped form.
+    """
+
+    def __init__(self, typed: bool = False):
+        self.typed = typed
+        self.actions = tuple(Action) if typed else ACTION_SET
+        self.values: Dict[tuple, Dict[str, float]] = {}
+        self.visits: Dict[tuple, int] = {}
+
+    def _key(self, state: Dict[str, Any]) -> tuple:
+        if self.typed:
+            return (state.observed_signal, state.previous_action)
+        return (state["observed_signal"], state["previous_action"])
+
+    def select_action(self, state: Dict[str, Any]) -> str:
+        values = self.values.get(self._key(state))
+        actions = self.actions
+        if not values:
+            return actions[0]
+        return max(actions, key=lambda action: values.get(action, 0.0))
+
+    def update(self, state: Dict[str, Any], action: str, reward: float) -> None:
+        if self.typed:
+            action = ACTION_LOOKUP[action]
+        key = self._key(state)
+        values = self.values.setdefault(key, {})
+        values[action] = values.get(action, 0.0) + reward
+        self.visits[key] = self.visits.get(key, 0) + 1
+
+    def update_batch(self, states, actions, rewards) -> None:
+        for state, action, reward in zip(states, actions, rewards):
+            self.update(state, action, reward)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "values": {
+                _encode_key(key): {str(action): value for action, value in values.items()}
+                for key, values in self.values.items()
+            },
+            "visits": {_encode_key(key): count for key, count in self.visits.items()}
+        }
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        decode = self._decode_action
+        self.values = {
+            self._decode(key): {decode(action): value for action, value in values.items()}
+            for key, values in snapshot["values"].items()
+        }
+        self.visits = {self._decode(key): count for key, count in snapshot["visits"].items()}
+
+    def _decode(self, encoded: str) -> tuple:
+        signal, previous_action = _decode_key(encoded)
+        return (signal, self._decode_action(previous_action))
+
+    def _decode_action(self, name: str):
+        return Action[name] if self.typed else name
+
+    def get_confidence(self, state: Dict[str, Any]) -> float:
+        return min(self.visits.get(self._key(state), 0) / 10.0, 1.0)
@@ -0,0 +1,212 @@
+"""
+workloads.py
+
+Reproducible throughput workloads.
+Each workload factory builds fresh components and returns a
+zero-argument callable that does the work and returns unit counts
+(e.g. {"steps": 10000, "episodes": 200}). The harness turns counts
+into per-second rates and measures peak memory separately.
+"""
+
+import io
+import json
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from execution.decision import DecisionEngine
+from intelligence.fusion.fusion_rules import fuse
+from intelligence.semantics.ingest import SignalReader
+from intelligence.semantics.signals import Provenance, Signal, SignalType
+from learning.episode_runner import EpisodeRunner
+from learning.exploration import ExplorationStrategy
+from learning.learner import Learner
+from learning.learning_loop import LearningLoop
+from learning.replay import ReplayEngine
+from utils.logger import DeterministicLogger
+
+Work = Callable[[], Dict[str, int]]
+
+EPISODE_LENGTH = 50
+
+
+def _exploit_only() -> ExplorationStrategy:
+    # Pure exploitation keeps recorded actions reproducible by the policy
+    return ExplorationStrategy(min_visits_required=0)
+
+
+def episode_runner_workload(n_states: int, scale: int) -> Work:
+    runner = EpisodeRunner(
+        SyntheticEnvironment(n_states, EPISODE_LENGTH), SyntheticPolicy(), _exploit_only()
+    )
+
+    def work():
+        steps = 0
+        for _ in range(scale):
+            steps += runner.run_episode(EPISODE_LENGTH)["episode_length"]
+        return {"steps": steps, "episodes": scale}
+
+    return work
+
+
+def typed_episode_runner_workload(n_states: int, scale: int) -> Work:
+    """episode_runner on core.state.State records and Action codes."""
+    runner = EpisodeRunner(
+        SyntheticEnvironment(n_states, EPISODE_LENGTH, typed=True), SyntheticPolicy(typed=True),
+        _exploit_only()
+    )
+
+    def work():
+        steps = 0
+        for _ in range(scale):
+            steps += runner.run_episode(EPISODE_LENGTH)["episode_length"]
+        return {"steps": steps, "episodes": scale}
+
+    return work
+
+
+def learning_loop_workload(n_states: int, scale: int) -> Work:
+    logger = DeterministicLogger()
+    loop = LearningLoop(
+        SyntheticEnvironment(n_states, EPISODE_LENGTH), SyntheticPolicy(), Learner(),
+        _exploit_only(), logger
+    )
+
+    def work():
+        loop.train(episodes=scale, max_steps_per_episode=EPISODE_LENGTH)
+        return {"steps": sum(len(r["episode_trace"]) for r in logger.records), "episodes": scale}
+
+    return work
+
+
+def replay_workload(n_states: int, scale: int) -> Work:
+    env = SyntheticEnvironment(n_states, EPISODE_LENGTH)
+    logger = DeterministicLogger()
+    LearningLoop(env, SyntheticPolicy(), Learner(), _exploit_only(), logger).train(
+        episodes=scale, max_steps_per_episode=EPISODE_LENGTH
+    )
+    logs = logger.export()
+
+    def work():
+        # Each episode was acted with the policy as of the previous snapshot
+        policy = SyntheticPolicy()
+        engine = ReplayEngine(env, policy)
+        transitions = 0
+        for log in logs:
+            engine.replay(log)
+            policy.restore(log["policy_snapshot"])
+            transitions += len(log["episode_trace"])
+        return {"transitions": transitions, "episodes": len(logs)}
+
+    return work
+
+
+def decision_engine_workload(n_states: int, scale: int) -> Work:
+    env = SyntheticEnvironment(n_states, EPISODE_LENGTH)
+    policy = SyntheticPolicy()
+    LearningLoop(env, policy, Learner(), _exploit_only(), DeterministicLogger()).train(
+        episodes=10, max_steps_per_episode=EPISODE_LENGTH
+    )
+    states = [env.reset()] + [env.step(("EXPLORE", "COMMIT")[i % 2]).next_state for i in range(n_states)]
+    engine = DecisionEngine()
+    decisions = scale * EPISODE_LENGTH
+
+    def work():
+        for i in range(decisions):
+            engine.decide(policy, states[i % len(states)])
+        return {"decisions": decisions}
+
+    return work
+
+
+def fusion_workload(n_states: int, scale: int) -> Work:
+    signal_types = list(SignalType)
+    signals = [
+        Signal(
+            signal_type=signal_types[i % len(signal_types)],
+            provenance=Provenance.SENSOR,
+            severity=i % 11,
+            confidence=(i % 100) / 100,
+            uncertainty=((i * 7) % 100) / 100
+        )
+        for i in range(2 * len(signal_types) * 64)
+    ]
+    # Pairs of equal type: i and i + len(signal_types)
+    stride = len(signal_types)
+    pairs = [(signals[i], signals[i + stride]) for i in range(len(signals) - stride)]
+    fusions = scale * EPISODE_LENGTH
+
+    def work():
+        for i in range(fusions):
+            a, b = pairs[i % len(pairs)]
+            fuse(a, b)
+        return {"fusions": fusions}
+
+    return work
+
+
+def signal_ingest_workload(n_states: int, scale: int) -> Work:
+    signal_types = list(SignalType)
+    records = scale * EPISODE_LENGTH
+    text = "".join(
+        json.dumps({
+            "signal_type": signal_types[i % len(signal_types)].value,
+            "provenance": Provenance.SENSOR.value,
+            "severity": i % 11,
+            "confidence": (i % 100) / 100,
+            "uncertainty": ((i * 7) % 100) / 100
+        }) + "\n"
+        for i in range(records)
+    )
+
+    def work():
+        reader = SignalReader(io.StringIO(text))
+        for _ in reader.iter_signals():
+            pass
+        return {"records": reader.accepted}
+
+    return work
+
+
+# name -> (factory, depends on state-space size)
+WORKLOADS: Dict[str, Any] = {
+    "episode_runner": (episode_runner_workload, True),
+    "episode_runner_typed": (typed_episode_runner_workload, True),
+    "learning_loop": (learning_loop_workload, True),
+    "replay": (replay_workload, True),
+    "decision_engine": (decision_engine_workload, True),
+    "fusion": (fusion_workload, False),
+    "signal_ingest": (signal_ingest_workload, False),
+}
+
+
+def measure(factory: Callable[[int, int], Work], n_states: int, scale: int, repeats: int) -> Dict[str, float]:
+    """
+    Best-of-N throughput on fresh components, then one separate
+    tracemalloc pass for peak memory so tracing never skews timing.
+    """
+    best_seconds = None
+    counts: Dict[str, int] = {}
+
+    for _ in range(repeats):
+        work = factory(n_states, scale)
+        start = time.perf_counter()
+        counts = work()
+        elapsed = time.perf_counter() - start
+        if best_seconds is None or elapsed < best_seconds:
+            best_seconds = elapsed
+
+    tracemalloc.start()
+    try:
+        factory(n_states, scale)()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    metrics: Dict[str, float] = {
+        f"{unit}_per_second": count / best_seconds if best_seconds > 0 else 0.0
+        for unit, count in counts.items()
+    }
+    metrics["peak_memory_bytes"] = float(peak)
+    return metrics
@@ -3,8 +3,42 @@ action.py
 
 Defines the finite action space.
 Actions are explicit and enumerable.
+
+Action is the integer-coded form for hot paths; codes are the
+positions in ACTION_SET, and str() gives the legacy name.
 """
 
+from enum import IntEnum
+
+from core.contracts import ACTION_SET
+
+
+class Action(IntEnum):
+    WAIT = 0
+    EXPLORE = 1
+    COMMIT = 2
+
+    def __str__(self) -> str:
+        return self.name
+
+    @classmethod
+    def parse(cls, value) -> "Action":
+        """Action from an Action, a legacy name or a code."""
+        action = ACTION_LOOKUP.get(value)
+        if action is None:
+            raise ValueError(f"Invalid action: {value}")
+        return action
+
+
+if [action.name for action in Action] != ACTION_SET:
+    raise ImportError("Action codes must follow ACTION_SET order")
+
+# Names, codes and members all map to the member: one dict lookup
+ACTION_LOOKUP = {
+    **{action.name: action for action in Action},
+    **{action: action for action in Action}
+}
+
 ACTIONS = {
     "WAIT",
     "EXPLORE",
@@ -13,5 +47,7 @@ ACTIONS = {
 
 
 def validate_action(action: str) -> None:
+    if isinstance(action, Action):
+        return
     if action not in ACTIONS:
         raise ValueError(f"Invalid action: {action}")
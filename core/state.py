@@ -3,10 +3,18 @@ state.py
 
 Defines the agent-observable state.
 State represents knowledge, not reality.
+
+States are plain dicts by default. State is a compact, validated
+record for hot paths that still reads like the dict form.
+
+json encodes a State as a positional array (it is a tuple), so anything
+written as JSON goes through to_json_value first; State values then
+serialize, and reload, as the legacy dict.
 """
 
-from typing import Dict, Any
-from core.contracts import ACTION_SET, REWARD_RANGE
+from typing import Dict, Any, List, NamedTuple, Tuple
+from core.action import Action
+from core.contracts import ACTION_SET, REWARD_RANGE, STATE_FIELDS
 
 
 def validate_state(state: Dict[str, Any]) -> None:
@@ -21,23 +29,120 @@ def validate_state(state: Dict[str, Any]) -> None:
         if key not in state:
             raise ValueError(f"Missing state field: {key}")
     
-    # Validate field types and values
-    current_step = state["current_step"]
+    _validate_fields(
+        state["current_step"],
+        state["observed_signal"],
+        state["previous_action"],
+        state["accumulated_reward"]
+    )
+
+
+def _validate_fields(current_step, observed_signal, previous_action, accumulated_reward) -> None:
     if not isinstance(current_step, int) or current_step < 0:
         raise ValueError(f"current_step must be non-negative integer, got {current_step}")
-    
-    observed_signal = state["observed_signal"]
+
     if not isinstance(observed_signal, (int, float)):
         raise ValueError(f"observed_signal must be numeric, got {type(observed_signal)}")
-    
-    previous_action = state["previous_action"]
+
     if previous_action not in ACTION_SET:
         raise ValueError(f"previous_action must be one of {ACTION_SET}, got {previous_action}")
-    
-    accumulated_reward = state["accumulated_reward"]
+
     if not isinstance(accumulated_reward, (int, float)):
         raise ValueError(f"accumulated_reward must be numeric, got {type(accumulated_reward)}")
-    
+
     min_reward, max_reward = REWARD_RANGE
     if not (min_reward <= accumulated_reward <= max_reward):
         raise ValueError(f"accumulated_reward must be in range {REWARD_RANGE}, got {accumulated_reward}")
+
+
+class _StateFields(NamedTuple):
+    current_step: int
+    observed_signal: float
+    previous_action: Action
+    accumulated_reward: float
+
+
+class State(_StateFields):
+    """
+    Immutable, slotted state validated once at construction.
+
+    Attribute access gives the typed fields (previous_action is an
+    Action). Mapping access (state["previous_action"], keys(),
+    items(), get(), dict(state)) gives the legacy dict view, with
+    previous_action as its name, so dict-based code keeps working.
+    A State equals the legacy dict with the same fields.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, current_step: int, observed_signal: float, previous_action, accumulated_reward: float):
+        previous_action = Action.parse(previous_action)
+        _validate_fields(current_step, observed_signal, previous_action.name, accumulated_reward)
+        return super().__new__(cls, current_step, observed_signal, previous_action, accumulated_reward)
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "State":
+        return cls(*(state[field] for field in STATE_FIELDS))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "current_step": self.current_step,
+            "observed_signal": self.observed_signal,
+            "previous_action": self.previous_action.name,
+            "accumulated_reward": self.accumulated_reward
+        }
+
+    def __getitem__(self, key):
+        if key.__class__ is str:
+            if key == "previous_action":
+                return self.previous_action.name
+            if key in _FIELD_INDEX:
+                return tuple.__getitem__(self, _FIELD_INDEX[key])
+            raise KeyError(key)
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, key) -> bool:
+        return key in _FIELD_INDEX
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self[key] if key in _FIELD_INDEX else default
+
+    def keys(self) -> List[str]:
+        return list(STATE_FIELDS)
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return list(self.to_dict().items())
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return tuple.__eq__(self, other)
+
+    def __ne__(self, other) -> bool:
+        return not self == other
+
+    __hash__ = tuple.__hash__
+
+
+_FIELD_INDEX = {field: index for index, field in enumerate(STATE_FIELDS)}
+
+
+def to_json_value(value: Any) -> Any:
+    """value with every State replaced by its dict form, ready for json.dumps."""
+    cls = value.__class__
+    if cls is State:
+        return value.to_dict()
+    if cls is dict:
+        return {key: to_json_value(item) for key, item in value.items()}
+    if cls is list or cls is tuple:
+        return [to_json_value(item) for item in value]
+    return value
+
+
+def state_key_from_json(key: Any) -> Any:
+    """Inverse of to_json_value for visit-counter keys: dicts were States, lists were tuples."""
+    if isinstance(key, dict):
+        return State.from_dict(key)
+    if isinstance(key, list):
+        return tuple(key)
+    return key
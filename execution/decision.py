@@ -3,10 +3,137 @@ decision.py
 
 Final decision selection.
 No learning. No exploration.
+
+With a deadline, the policy lookup runs on a worker thread and the
+engine waits at most the deadline. If the lookup is late, it returns a
+precomputed safe fallback (WAIT with confidence 0.0: no evidence within
+budget means no confidence) marked "fallback", and counts an SLO miss.
+A late lookup still finishes in the background and its result is
+discarded, so the policy must tolerate concurrent reads. While every
+worker is still busy with earlier lookups, a new decision returns the
+fallback at once instead of queueing behind them (also an SLO miss).
+
+Lookup threads are daemon threads: a lookup that never returns keeps
+its worker busy but does not hold up interpreter exit.
 """
 
+import queue
+import threading
+from concurrent.futures import Future, TimeoutError
+from typing import Any, Dict, List, Optional
+
+
 class DecisionEngine:
-    def decide(self, policy, state):
+    def __init__(self, deadline_seconds: Optional[float] = None, fallback_action: str = "WAIT",
+                 workers: int = 1):
+        """
+        deadline_seconds: default per-decision budget (None: no deadline)
+        fallback_action: action returned when a decision misses its deadline
+        workers: lookup threads; late lookups occupy one until they finish
+        """
+        if deadline_seconds is not None and deadline_seconds <= 0:
+            raise ValueError(f"deadline_seconds must be positive, got {deadline_seconds}")
+        if workers <= 0:
+            raise ValueError(f"workers must be positive, got {workers}")
+
+        self.deadline_seconds = deadline_seconds
+        self.workers = workers
+        self.fallback = {"action": fallback_action, "confidence": 0.0, "fallback": True}
+        self.deadline_decisions = 0
+        self.slo_misses = 0
+        self._jobs: Optional[queue.SimpleQueue] = None
+        self._threads: List[threading.Thread] = []
+        # Lookups submitted and not yet finished, late ones included
+        self._busy = 0
+        self._lock = threading.Lock()
+
+    def decide(self, policy, state, deadline_seconds: Optional[float] = None):
+        """
+        deadline_seconds: budget for this decision, overriding the default.
+        Decisions made under a deadline carry "fallback": True or False.
+        """
+        if deadline_seconds is None:
+            deadline_seconds = self.deadline_seconds
+            if deadline_seconds is None:
+                return {
+                    "action": policy.select_action(state),
+                    "confidence": policy.get_confidence(state)
+                }
+        if deadline_seconds <= 0:
+            raise ValueError(f"deadline_seconds must be positive, got {deadline_seconds}")
+
+        with self._lock:
+            self.deadline_decisions += 1
+            if self._busy >= self.workers:
+                self.slo_misses += 1
+                return dict(self.fallback)
+            if self._jobs is None:
+                self._start()
+            self._busy += 1
+            future: Future = Future()
+            # Never queued behind another lookup: a worker is idle
+            self._jobs.put((future, policy, state))
+        try:
+            decision = future.result(timeout=deadline_seconds)
+        except TimeoutError:
+            with self._lock:
+                self.slo_misses += 1
+            return dict(self.fallback)
+
+        decision["fallback"] = False
+        return decision
+
+    def slo_report(self) -> Dict[str, Any]:
+        with self._lock:
+            decisions, misses = self.deadline_decisions, self.slo_misses
+        return {
+            "deadline_decisions": decisions,
+            "slo_misses": misses,
+            "miss_rate": misses / decisions if decisions else 0.0
+        }
+
+    def close(self) -> None:
+        """
+        Stop the lookup threads without waiting. A late lookup runs to
+        completion (or until the process exits) and its result is dropped.
+        """
+        with self._lock:
+            jobs, self._jobs = self._jobs, None
+            threads, self._threads = self._threads, []
+        if jobs is not None:
+            for _ in threads:
+                jobs.put(None)
+
+    def _start(self) -> None:
+        self._jobs = queue.SimpleQueue()
+        self._threads = [
+            threading.Thread(target=self._work, args=(self._jobs,), name=f"decision-{index}", daemon=True)
+            for index in range(self.workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _work(self, jobs: queue.SimpleQueue) -> None:
+        while True:
+            job = jobs.get()
+            if job is None:
+                return
+            future, policy, state = job
+            future.set_running_or_notify_cancel()
+            try:
+                try:
+                    decision = self._lookup(policy, state)
+                finally:
+                    # Free the worker before the waiting caller is woken,
+                    # so its next decision sees it idle
+                    with self._lock:
+                        self._busy -= 1
+            except BaseException as error:
+                future.set_exception(error)
+            else:
+                future.set_result(decision)
+
+    def _lookup(self, policy, state) -> Dict[str, Any]:
         action = policy.select_action(state)
         confidence = policy.get_confidence(state)
 
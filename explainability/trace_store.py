@@ -0,0 +1,272 @@
+"""
+trace_store.py
+
+Append-only columnar on-disk store for decision traces.
+
+Each sealed chunk writes one binary file per column
+(step, action code, confidence) plus the full explanations
+as JSON lines. The chunk index (chunks.jsonl) records per-chunk
+min/max statistics so queries only open chunks that can match.
+
+A chunk becomes visible only once its index line is written;
+files of an unindexed chunk are ignored and overwritten.
+
+Given a utils.state_store.StateStore, payloads hold a state_id in
+place of the state, and queries restore the state on the way out.
+"""
+
+import json
+import os
+from array import array
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from core.contracts import ACTION_SET
+from core.state import to_json_value
+from utils.optional import require_numpy
+
+# Column name -> (array typecode, numpy dtype name)
+COLUMNS = {
+    "step": ("q", "int64"),
+    "action": ("b", "int8"),
+    "confidence": ("d", "float64"),
+}
+
+ACTION_CODES = {action: code for code, action in enumerate(ACTION_SET)}
+
+
+def encode_action(action: str) -> int:
+    if action not in ACTION_CODES:
+        raise ValueError(f"Invalid action: {action}")
+    return ACTION_CODES[action]
+
+
+def row_matches(
+    step: int,
+    action_code: int,
+    confidence: float,
+    action: Optional[str] = None,
+    confidence_range: Optional[Tuple[float, float]] = None,
+    step_range: Optional[Tuple[int, int]] = None
+) -> bool:
+    """Inclusive range filter shared by on-disk and in-memory traces."""
+    if action is not None and action_code != ACTION_CODES.get(action, -1):
+        return False
+    if confidence_range is not None:
+        low, high = confidence_range
+        if not (low <= confidence <= high):
+            return False
+    if step_range is not None:
+        low, high = step_range
+        if not (low <= step <= high):
+            return False
+    return True
+
+
+class TraceStore:
+    INDEX_FILE = "chunks.jsonl"
+
+    def __init__(self, path: str, chunk_size: int = 1024, state_store=None):
+        """
+        path: directory holding the chunk files and index
+        chunk_size: rows buffered in memory before a chunk is sealed
+        state_store: optional shared StateStore for explanation states
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        self.path = path
+        self.chunk_size = chunk_size
+        self.state_store = state_store
+        self.chunks: List[Dict[str, Any]] = []
+
+        os.makedirs(path, exist_ok=True)
+        index_path = os.path.join(path, self.INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, "r", encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        self.chunks.append(json.loads(line))
+
+        self._reset_pending()
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def append(self, explanation: Dict[str, Any]) -> None:
+        state = explanation["state"]
+        if "current_step" not in state:
+            raise ValueError("Missing state field: current_step")
+
+        self._pending["step"].append(int(state["current_step"]))
+        self._pending["action"].append(encode_action(explanation["chosen_action"]))
+        self._pending["confidence"].append(float(explanation["confidence"]))
+        if self.state_store is not None:
+            explanation = dict(explanation)
+            explanation["state_id"] = self.state_store.put(explanation.pop("state"))
+        self._pending_payload.append(json.dumps(to_json_value(explanation), sort_keys=True))
+
+        if len(self._pending_payload) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Seal buffered rows into a new chunk, even if it is short."""
+        if not self._pending_payload:
+            return
+
+        chunk_id = len(self.chunks)
+        for name in COLUMNS:
+            with open(self._chunk_file(chunk_id, name), "wb") as handle:
+                self._pending[name].tofile(handle)
+
+        with open(self._chunk_file(chunk_id, "jsonl"), "w", encoding="utf-8") as handle:
+            handle.write("\n".join(self._pending_payload) + "\n")
+
+        steps = self._pending["step"]
+        confidences = self._pending["confidence"]
+        stats = {
+            "chunk_id": chunk_id,
+            "rows": len(self._pending_payload),
+            "step_min": min(steps),
+            "step_max": max(steps),
+            "confidence_min": min(confidences),
+            "confidence_max": max(confidences),
+            "actions": sorted(ACTION_SET[code] for code in set(self._pending["action"]))
+        }
+
+        # Index line is the commit point for the chunk
+        with open(os.path.join(self.path, self.INDEX_FILE), "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(stats, sort_keys=True) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+
+        self.chunks.append(stats)
+        self._reset_pending()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __len__(self) -> int:
+        return sum(chunk["rows"] for chunk in self.chunks) + len(self._pending_payload)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def query(
+        self,
+        action: Optional[str] = None,
+        confidence_range: Optional[Tuple[float, float]] = None,
+        step_range: Optional[Tuple[int, int]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield explanations matching every given filter, in record order.
+        Ranges are inclusive. Chunks whose statistics exclude a match
+        are never opened.
+        """
+        filters = {
+            "action": action,
+            "confidence_range": confidence_range,
+            "step_range": step_range
+        }
+
+        for chunk in self.chunks:
+            if not self._chunk_may_match(chunk, **filters):
+                continue
+
+            columns = self._read_chunk_columns(chunk)
+            rows = [
+                i for i in range(chunk["rows"])
+                if row_matches(
+                    columns["step"][i], columns["action"][i], columns["confidence"][i],
+                    **filters
+                )
+            ]
+            if rows:
+                yield from self._read_payload_rows(chunk["chunk_id"], rows)
+
+        for i, payload in enumerate(self._pending_payload):
+            if row_matches(
+                self._pending["step"][i], self._pending["action"][i],
+                self._pending["confidence"][i], **filters
+            ):
+                yield self._decode(payload)
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        return self.query()
+
+    def numpy_chunks(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield read-only NumPy memory-mapped column views, one dict per
+        sealed chunk. Buffered rows are not included; call flush() first.
+        """
+        np = require_numpy("TraceStore.numpy_chunks")
+        for chunk in self.chunks:
+            yield {
+                name: np.memmap(
+                    self._chunk_file(chunk["chunk_id"], name),
+                    dtype=dtype, mode="r", shape=(chunk["rows"],)
+                )
+                for name, (_, dtype) in COLUMNS.items()
+            }
+
+    def to_numpy(self) -> Dict[str, Any]:
+        """Concatenate all sealed chunks into one NumPy array per column."""
+        np = require_numpy("TraceStore.to_numpy")
+        chunks = list(self.numpy_chunks())
+        return {
+            name: (
+                np.concatenate([chunk[name] for chunk in chunks])
+                if chunks else np.empty(0, dtype=dtype)
+            )
+            for name, (_, dtype) in COLUMNS.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _reset_pending(self) -> None:
+        self._pending = {name: array(typecode) for name, (typecode, _) in COLUMNS.items()}
+        self._pending_payload: List[str] = []
+
+    def _decode(self, payload: str) -> Dict[str, Any]:
+        explanation = json.loads(payload)
+        if "state_id" in explanation:
+            explanation["state"] = self.state_store.get(explanation.pop("state_id"))
+        return explanation
+
+    def _chunk_file(self, chunk_id: int, column: str) -> str:
+        return os.path.join(self.path, f"chunk_{chunk_id:06d}.{column}")
+
+    def _chunk_may_match(self, chunk, action, confidence_range, step_range) -> bool:
+        if action is not None and action not in chunk["actions"]:
+            return False
+        if confidence_range is not None:
+            low, high = confidence_range
+            if chunk["confidence_max"] < low or chunk["confidence_min"] > high:
+                return False
+        if step_range is not None:
+            low, high = step_range
+            if chunk["step_max"] < low or chunk["step_min"] > high:
+                return False
+        return True
+
+    def _read_chunk_columns(self, chunk) -> Dict[str, array]:
+        columns = {}
+        for name, (typecode, _) in COLUMNS.items():
+            values = array(typecode)
+            with open(self._chunk_file(chunk["chunk_id"], name), "rb") as handle:
+                values.fromfile(handle, chunk["rows"])
+            columns[name] = values
+        return columns
+
+    def _read_payload_rows(self, chunk_id: int, rows: List[int]) -> Iterator[Dict[str, Any]]:
+        wanted = set(rows)
+        last = rows[-1]
+        with open(self._chunk_file(chunk_id, "jsonl"), "r", encoding="utf-8") as handle:
+            for i, line in enumerate(handle):
+                if i in wanted:
+                    yield self._decode(line)
+                if i >= last:
+                    break
@@ -3,14 +3,53 @@ traces.py
 
 Decision trace builder.
 Captures step-by-step reasoning for audit.
+
+By default the trace is held in memory. Given a TraceStore,
+explanations stream to disk instead and can be queried
+without loading the whole trace.
 """
 
+from typing import Any, Dict, List, Optional, Tuple
+
+from explainability.trace_store import TraceStore, encode_action, row_matches
+
+
 class DecisionTrace:
-    def __init__(self):
+    def __init__(self, store: Optional[TraceStore] = None):
         self.trace = []
+        self.store = store
 
     def record(self, explanation: dict):
+        if self.store is not None:
+            self.store.append(explanation)
+            return
         self.trace.append(explanation)
 
     def export(self) -> list:
+        if self.store is not None:
+            return list(self.store.iter_records())
         return self.trace
+
+    def query(
+        self,
+        action: Optional[str] = None,
+        confidence_range: Optional[Tuple[float, float]] = None,
+        step_range: Optional[Tuple[int, int]] = None
+    ) -> List[Dict[str, Any]]:
+        """Filter recorded explanations by action, confidence or step (inclusive)."""
+        if self.store is not None:
+            return list(self.store.query(action, confidence_range, step_range))
+
+        return [
+            explanation for explanation in self.trace
+            if row_matches(
+                explanation["state"]["current_step"],
+                encode_action(explanation["chosen_action"]),
+                explanation["confidence"],
+                action, confidence_range, step_range
+            )
+        ]
+
+    def close(self) -> None:
+        if self.store is not None:
+            self.store.close()
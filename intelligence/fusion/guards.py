@@ -0,0 +1,154 @@
+"""
+guards.py
+
+Pre-validation for bulk fusion.
+This module:
+- Checks field ranges for a whole batch in one pass
+- Partitions valid signals by SignalType in the same pass
+- Returns a fusion plan plus a structured rejection report
+- Runs the plan so only compatible signals reach fuse()
+
+fuse() raises FusionError for incompatible types; a plan never asks it
+to fuse across types, so bulk fusion needs no per-pair try/except and
+one bad signal cannot abort a batch. Every rejected signal appears in
+the report with its index, reason and provenance.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from intelligence.fusion.fusion_rules import fuse
+from intelligence.semantics.signals import Signal, SignalType
+
+SEVERITY_RANGE = (0, 10)
+UNIT_RANGE = (0.0, 1.0)
+
+
+def signal_rejection(signal: Any) -> Optional[str]:
+    """Reason a signal may not be fused, or None if it is valid."""
+    if not isinstance(signal, Signal):
+        return "not_a_signal"
+    if not isinstance(signal.signal_type, SignalType):
+        return "unknown_signal_type"
+    if not signal.provenance:
+        return "missing_provenance"
+
+    severity = signal.severity
+    if isinstance(severity, bool) or not isinstance(severity, int) or not (
+        SEVERITY_RANGE[0] <= severity <= SEVERITY_RANGE[1]
+    ):
+        return "severity_out_of_range"
+    # Written so NaN fails too; values that do not compare with floats
+    # (None, strings) raise TypeError and are rejected as well
+    try:
+        if not (UNIT_RANGE[0] <= signal.confidence <= UNIT_RANGE[1]):
+            return "confidence_out_of_range"
+    except TypeError:
+        return "confidence_not_numeric"
+    try:
+        if not (UNIT_RANGE[0] <= signal.uncertainty <= UNIT_RANGE[1]):
+            return "uncertainty_out_of_range"
+    except TypeError:
+        return "uncertainty_not_numeric"
+    return None
+
+
+@dataclass
+class FusionPlan:
+    """Batch indices grouped by type (arrival order) plus rejections."""
+    groups: Dict[SignalType, List[int]] = field(default_factory=dict)
+    rejections: List[Dict[str, Any]] = field(default_factory=list)
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "accepted": sum(len(indices) for indices in self.groups.values()),
+            "rejected": len(self.rejections),
+            "groups": {signal_type.value: len(indices) for signal_type, indices in self.groups.items()},
+            "reasons": _count_reasons(self.rejections),
+            "rejections": list(self.rejections)
+        }
+
+
+def _count_reasons(rejections: List[Dict[str, Any]]) -> Dict[str, int]:
+    reasons: Dict[str, int] = {}
+    for rejection in rejections:
+        reasons[rejection["reason"]] = reasons.get(rejection["reason"], 0) + 1
+    return reasons
+
+
+def _rejection(index: int, signal: Any, reason: str) -> Dict[str, Any]:
+    signal_type = getattr(signal, "signal_type", None)
+    return {
+        "index": index,
+        "reason": reason,
+        "signal_type": signal_type.value if isinstance(signal_type, SignalType) else None,
+        "provenance": str(getattr(signal, "provenance", None))
+    }
+
+
+def plan_fusion(signals: Sequence[Signal]) -> FusionPlan:
+    """Validate and partition a mixed batch in one pass."""
+    plan = FusionPlan()
+    groups = plan.groups
+    for index, signal in enumerate(signals):
+        reason = signal_rejection(signal)
+        if reason is not None:
+            plan.rejections.append(_rejection(index, signal, reason))
+            continue
+        group = groups.get(signal.signal_type)
+        if group is None:
+            groups[signal.signal_type] = group = []
+        group.append(index)
+    return plan
+
+
+def fuse_batch(signals: Sequence[Signal], fuse_fn: Callable[[Signal, Signal], Signal] = fuse
+               ) -> Tuple[Dict[SignalType, Signal], Dict[str, Any]]:
+    """
+    Fuse each type group of a mixed batch into one signal, left to
+    right in arrival order. A group of one is returned unchanged.
+    Returns ({signal_type: fused}, rejection report).
+    """
+    plan = plan_fusion(signals)
+    fused: Dict[SignalType, Signal] = {}
+    for signal_type, indices in plan.groups.items():
+        result = signals[indices[0]]
+        for index in indices[1:]:
+            result = fuse_fn(result, signals[index])
+        fused[signal_type] = result
+    return fused, plan.report()
+
+
+def fuse_pairs(pairs: Sequence[Tuple[Signal, Signal]], fuse_fn: Callable[[Signal, Signal], Signal] = fuse
+               ) -> Tuple[List[Optional[Signal]], Dict[str, Any]]:
+    """
+    Fuse many (a, b) pairs. Results align with pairs; rejected pairs
+    get None and appear in the report with the failing side named.
+    """
+    results: List[Optional[Signal]] = [None] * len(pairs)
+    rejections: List[Dict[str, Any]] = []
+
+    for index, (a, b) in enumerate(pairs):
+        reason = signal_rejection(a)
+        side = "a"
+        if reason is None:
+            reason = signal_rejection(b)
+            side = "b"
+        if reason is None and a.signal_type is not b.signal_type:
+            reason = "incompatible_types"
+            side = "pair"
+        if reason is not None:
+            rejection = _rejection(index, a if side != "b" else b, reason)
+            rejection["side"] = side
+            if side == "pair":
+                rejection["other_signal_type"] = b.signal_type.value
+            rejections.append(rejection)
+            continue
+        results[index] = fuse_fn(a, b)
+
+    return results, {
+        "accepted": len(pairs) - len(rejections),
+        "rejected": len(rejections),
+        "reasons": _count_reasons(rejections),
+        "rejections": rejections
+    }
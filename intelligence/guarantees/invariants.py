@@ -0,0 +1,233 @@
+"""
+invariants.py
+
+Runtime checks of the fusion invariants (docs/fusion_invariants.md)
+on live fusion output.
+This module:
+- Buffers (inputs, output) fusion records and checks them in batches
+- Evaluates every invariant over a whole batch with NumPy array ops
+- Samples a configurable fraction of records to bound overhead
+- Reports each violation with the provenance of inputs and output
+
+Sampling is deterministic: with rate r, record n is checked when
+floor((n + 1) * r) > floor(n * r), i.e. evenly spaced, no randomness.
+In strict mode sampled records are checked within the call that offers
+them, so a violation raises at the offending fusion, not batch_size
+records later. Requires numpy.
+"""
+
+from math import ceil
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from intelligence.semantics.signals import Signal, SignalType
+from utils.optional import require_numpy
+
+np = require_numpy("intelligence.guarantees.invariants")
+
+INVARIANTS = (
+    "confidence_never_increases",
+    "uncertainty_never_decreases",
+    "compatible_types",
+    "severity_is_maximum",
+    "contradiction_increases_uncertainty",
+    "deterministic",
+)
+
+TYPE_CODES = {signal_type: code for code, signal_type in enumerate(SignalType)}
+CONTRADICTION = TYPE_CODES[SignalType.CONTRADICTION]
+
+FusionRecord = Tuple[Sequence[Signal], Signal, Any]
+
+
+class InvariantViolation(Exception):
+    """Raised in strict mode when fused output breaks an invariant."""
+    pass
+
+
+def sample_mask(first_index: int, count: int, rate: float):
+    """Boolean mask over records first_index .. first_index + count - 1."""
+    positions = np.arange(first_index, first_index + count, dtype=np.float64)
+    return np.floor((positions + 1.0) * rate) > np.floor(positions * rate)
+
+
+def check_batch(records: Sequence[FusionRecord], fuse_fn: Optional[Callable] = None) -> Dict[str, Any]:
+    """
+    Evaluate every invariant on every record.
+    Returns {invariant: boolean array (True = violated)}.
+
+    fuse_fn: when given, each record's inputs are fused again
+             (left to right) to check determinism
+    """
+    sizes = np.fromiter((len(inputs) for inputs, _, _ in records), dtype=np.int64, count=len(records))
+    if (sizes < 2).any():
+        raise ValueError("Every fusion record needs at least two inputs")
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+
+    flat = [signal for inputs, _, _ in records for signal in inputs]
+    outputs = [output for _, output, _ in records]
+
+    confidence_in = np.fromiter((s.confidence for s in flat), dtype=np.float64, count=len(flat))
+    uncertainty_in = np.fromiter((s.uncertainty for s in flat), dtype=np.float64, count=len(flat))
+    severity_in = np.fromiter((s.severity for s in flat), dtype=np.int64, count=len(flat))
+    type_in = np.fromiter((TYPE_CODES[s.signal_type] for s in flat), dtype=np.int64, count=len(flat))
+
+    confidence_out = np.fromiter((s.confidence for s in outputs), dtype=np.float64, count=len(outputs))
+    uncertainty_out = np.fromiter((s.uncertainty for s in outputs), dtype=np.float64, count=len(outputs))
+    severity_out = np.fromiter((s.severity for s in outputs), dtype=np.int64, count=len(outputs))
+    type_out = np.fromiter((TYPE_CODES[s.signal_type] for s in outputs), dtype=np.int64, count=len(outputs))
+
+    max_uncertainty = np.maximum.reduceat(uncertainty_in, starts)
+    type_min = np.minimum.reduceat(type_in, starts)
+    type_max = np.maximum.reduceat(type_in, starts)
+
+    violated = {
+        "confidence_never_increases": confidence_out > np.minimum.reduceat(confidence_in, starts),
+        "uncertainty_never_decreases": uncertainty_out < max_uncertainty,
+        "compatible_types": (type_min != type_max) | (type_out != type_min),
+        "severity_is_maximum": severity_out != np.maximum.reduceat(severity_in, starts),
+        # Strictly more uncertain, unless already at the ceiling
+        "contradiction_increases_uncertainty": (
+            (type_out == CONTRADICTION) & (uncertainty_out <= max_uncertainty) & (uncertainty_out < 1.0)
+        ),
+        "deterministic": np.zeros(len(records), dtype=np.bool_),
+    }
+
+    if fuse_fn is not None:
+        for i, (inputs, output, _) in enumerate(records):
+            fused = inputs[0]
+            for signal in inputs[1:]:
+                fused = fuse_fn(fused, signal)
+            violated["deterministic"][i] = fused != output
+
+    return violated
+
+
+class InvariantMonitor:
+    def __init__(self, rate: float = 0.01, batch_size: int = 1024, strict: bool = False,
+                 fuse_fn: Optional[Callable] = None, max_violations: int = 1000):
+        """
+        rate: fraction of observed records that are checked, in (0.0, 1.0]
+        batch_size: sampled records buffered before a vectorized check
+        strict: raise InvariantViolation from the call that offered the
+                offending record, instead of only recording
+        fuse_fn: re-fuse sampled inputs to check determinism
+        max_violations: violation reports kept (counts are always exact)
+        """
+        if not (0.0 < rate <= 1.0):
+            raise ValueError(f"rate must be in (0.0, 1.0], got {rate}")
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        self.rate = rate
+        self.batch_size = batch_size
+        self.strict = strict
+        self.fuse_fn = fuse_fn
+        self.max_violations = max_violations
+
+        self.observed = 0
+        self.checked = 0
+        self.counts: Dict[str, int] = {name: 0 for name in INVARIANTS}
+        self.violations: List[Dict[str, Any]] = []
+        self._pending: List[Tuple[int, FusionRecord]] = []
+        # Next observed index whose sample decision is still open
+        self._next_sample = self._first_sample_from(0)
+
+    def observe(self, inputs: Sequence[Signal], output: Signal, source: Any = None) -> None:
+        """Offer one fusion record; only sampled records are kept."""
+        index = self.observed
+        self.observed += 1
+        if index != self._next_sample:
+            return
+        self._next_sample = self._first_sample_from(index + 1)
+        self._pending.append((index, (tuple(inputs), output, source)))
+        if self.strict or len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def observe_batch(self, records: Sequence[FusionRecord]) -> None:
+        """Offer many (inputs, output, source) records at once."""
+        mask = sample_mask(self.observed, len(records), self.rate)
+        for offset in np.flatnonzero(mask).tolist():
+            self._pending.append((self.observed + offset, records[offset]))
+        self.observed += len(records)
+        self._next_sample = self._first_sample_from(self.observed)
+        if self.strict or len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def monitored(self, fuse_fn: Callable[[Signal, Signal], Signal], source: Any = None) -> Callable:
+        """fuse_fn wrapped so every call is offered to the monitor."""
+        def fuse(a: Signal, b: Signal) -> Signal:
+            output = fuse_fn(a, b)
+            self.observe((a, b), output, source)
+            return output
+        return fuse
+
+    def flush(self) -> None:
+        """Check all buffered sampled records now."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        records = [record for _, record in pending]
+        violated = check_batch(records, self.fuse_fn)
+        self.checked += len(records)
+
+        found = []
+        for name in INVARIANTS:
+            rows = np.flatnonzero(violated[name]).tolist()
+            self.counts[name] += len(rows)
+            for row in rows:
+                found.append(self._report(name, pending[row][0], records[row]))
+
+        found.sort(key=lambda violation: violation["record"])
+        room = max(0, self.max_violations - len(self.violations))
+        self.violations.extend(found[:room])
+
+        if self.strict and found:
+            first = found[0]
+            raise InvariantViolation(
+                f"Fusion invariant '{first['invariant']}' violated by record {first['record']} "
+                f"(provenance {first['output_provenance']})"
+            )
+
+    def report(self) -> Dict[str, Any]:
+        self.flush()
+        return {
+            "observed": self.observed,
+            "checked": self.checked,
+            "rate": self.rate,
+            "counts": dict(self.counts),
+            "violations": list(self.violations)
+        }
+
+    def _first_sample_from(self, index: int) -> int:
+        # Smallest n >= index with floor((n + 1) * rate) > floor(n * rate).
+        # With k = floor(index * rate) that is the first n with
+        # (n + 1) * rate >= k + 1, i.e. ceil((k + 1) / rate) - 1
+        candidate = max(index, ceil((int(index * self.rate) + 1) / self.rate) - 1)
+        # Settle float rounding against the exact rule sample_mask uses
+        while candidate > index and self._sampled(candidate - 1):
+            candidate -= 1
+        while not self._sampled(candidate):
+            candidate += 1
+        return candidate
+
+    def _sampled(self, index: int) -> bool:
+        return int((index + 1) * self.rate) > int(index * self.rate)
+
+    def _report(self, name: str, index: int, record: FusionRecord) -> Dict[str, Any]:
+        inputs, output, source = record
+        return {
+            "invariant": name,
+            "record": index,
+            "source": source,
+            "input_provenance": [str(signal.provenance) for signal in inputs],
+            "output_provenance": str(output.provenance),
+            "inputs": [
+                {"type": signal.signal_type.value, "severity": signal.severity,
+                 "confidence": signal.confidence, "uncertainty": signal.uncertainty}
+                for signal in inputs
+            ],
+            "output": {
+                "type": output.signal_type.value, "severity": output.severity,
+                "confidence": output.confidence, "uncertainty": output.uncertainty
+            }
+        }
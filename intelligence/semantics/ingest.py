@@ -0,0 +1,237 @@
+"""
+ingest.py
+
+Streaming ingest of Signal records from JSON lines.
+This module:
+- Reads a file or pipe in fixed-size chunks of lines
+- Parses every line on its own, so a malformed line can never merge
+  with its neighbours into something valid
+- Maps signal_type / provenance strings to enum codes via lookup tables
+- Validates ranges per chunk: a min/max check, rows only on failure
+- Yields Signal objects or columnar batches (array-module columns)
+
+Memory is bounded by one chunk. Invalid records are skipped and
+reported with their line number and reason; they never stop a stream.
+
+Record format (one per line):
+  {"signal_type": "observation", "provenance": "sensor",
+   "severity": 4, "confidence": 0.9, "uncertainty": 0.1}
+Enum fields accept the value ("observation") or the name ("OBSERVATION").
+"""
+
+import json
+from array import array
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple, Union
+
+from intelligence.semantics.signals import Provenance, Signal, SignalType
+
+SIGNAL_TYPES: Tuple[SignalType, ...] = tuple(SignalType)
+PROVENANCES: Tuple[Provenance, ...] = tuple(Provenance)
+
+SIGNAL_TYPE_CODES: Dict[str, int] = {
+    **{member.value: code for code, member in enumerate(SIGNAL_TYPES)},
+    **{member.name: code for code, member in enumerate(SIGNAL_TYPES)},
+}
+PROVENANCE_CODES: Dict[str, int] = {
+    **{member.value: code for code, member in enumerate(PROVENANCES)},
+    **{member.name: code for code, member in enumerate(PROVENANCES)},
+}
+
+# Column name -> array typecode
+BATCH_COLUMNS = {
+    "line": "q",
+    "signal_type": "b",
+    "provenance": "b",
+    "severity": "q",
+    "confidence": "d",
+    "uncertainty": "d",
+}
+
+RANGES = {
+    "severity": (0, 10),
+    "confidence": (0.0, 1.0),
+    "uncertainty": (0.0, 1.0),
+}
+
+
+@dataclass
+class SignalBatch:
+    """One chunk of valid records as parallel columns."""
+    columns: Dict[str, array]
+
+    def __len__(self) -> int:
+        return len(self.columns["line"])
+
+    def signals(self) -> List[Signal]:
+        columns = self.columns
+        return [
+            Signal(SIGNAL_TYPES[signal_type], PROVENANCES[provenance], severity, confidence, uncertainty)
+            for signal_type, provenance, severity, confidence, uncertainty in zip(
+                columns["signal_type"], columns["provenance"], columns["severity"],
+                columns["confidence"], columns["uncertainty"]
+            )
+        ]
+
+
+class SignalReader:
+    def __init__(self, source: Union[str, IO[str]], chunk_size: int = 4096, max_rejections: int = 1000):
+        """
+        source: path to a JSONL file, or an open text stream (e.g. a pipe)
+        chunk_size: lines read and parsed together
+        max_rejections: rejection reports kept (counts are always exact)
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        self.source = source
+        self.chunk_size = chunk_size
+        self.max_rejections = max_rejections
+        self.records = 0
+        self.accepted = 0
+        self.rejected: Dict[str, int] = {}
+        self.rejections: List[Dict[str, Any]] = []
+
+    def iter_batches(self) -> Iterator[SignalBatch]:
+        """Columnar batches of valid records, one per non-empty chunk."""
+        if isinstance(self.source, str):
+            with open(self.source, "r", encoding="utf-8") as handle:
+                yield from self._batches(handle)
+        else:
+            yield from self._batches(self.source)
+
+    def iter_signals(self) -> Iterator[Signal]:
+        for batch in self.iter_batches():
+            yield from batch.signals()
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "records": self.records,
+            "accepted": self.accepted,
+            "rejected": sum(self.rejected.values()),
+            "reasons": dict(self.rejected),
+            "rejections": list(self.rejections)
+        }
+
+    def _batches(self, handle: IO[str]) -> Iterator[SignalBatch]:
+        line_number = 0
+        while True:
+            lines = list(islice(handle, self.chunk_size))
+            if not lines:
+                return
+            first_line = line_number + 1
+            line_number += len(lines)
+
+            batch = self._parse_chunk(lines, first_line)
+            if len(batch):
+                yield batch
+
+    def _parse_chunk(self, lines: List[str], first_line: int) -> SignalBatch:
+        numbered = [(first_line + i, line) for i, line in enumerate(lines) if line.strip()]
+        self.records += len(numbered)
+
+        records = self._decode(numbered)
+        columns = {name: array(typecode) for name, typecode in BATCH_COLUMNS.items()}
+        line_column = columns["line"]
+        type_column = columns["signal_type"]
+        provenance_column = columns["provenance"]
+        severity_column = columns["severity"]
+        confidence_column = columns["confidence"]
+        uncertainty_column = columns["uncertainty"]
+        type_codes = SIGNAL_TYPE_CODES
+        provenance_codes = PROVENANCE_CODES
+
+        for line, record in records:
+            try:
+                signal_type = type_codes[record["signal_type"]]
+                provenance = provenance_codes[record["provenance"]]
+                severity = record["severity"]
+                confidence = float(record["confidence"])
+                uncertainty = float(record["uncertainty"])
+            except (KeyError, TypeError, ValueError):
+                self._reject(line, "invalid_fields")
+                continue
+            if severity.__class__ is not int:
+                self._reject(line, "invalid_fields")
+                continue
+            if severity.bit_length() > 62:
+                # Would overflow the int64 column; far outside the range anyway
+                self._reject(line, "severity_out_of_range")
+                continue
+            line_column.append(line)
+            type_column.append(signal_type)
+            provenance_column.append(provenance)
+            severity_column.append(severity)
+            confidence_column.append(confidence)
+            uncertainty_column.append(uncertainty)
+
+        return self._validate_ranges(SignalBatch(columns))
+
+    def _decode(self, numbered: List[Tuple[int, str]]) -> List[Tuple[int, Any]]:
+        decode = json.loads
+        decoded = []
+        for line, text in numbered:
+            try:
+                decoded.append((line, decode(text)))
+            except ValueError:
+                self._reject(line, "invalid_json")
+
+        valid = []
+        for line, record in decoded:
+            if isinstance(record, dict):
+                valid.append((line, record))
+            else:
+                self._reject(line, "not_an_object")
+        return valid
+
+    def _validate_ranges(self, batch: SignalBatch) -> SignalBatch:
+        columns = batch.columns
+        if not len(batch):
+            return batch
+
+        # Whole-chunk bounds first; rows are only visited on failure
+        def in_range(name: str) -> bool:
+            low, high = RANGES[name]
+            return low <= min(columns[name]) and max(columns[name]) <= high
+
+        if all(in_range(name) for name in RANGES) and not _has_nan(columns):
+            self.accepted += len(batch)
+            return batch
+
+        keep = []
+        for row in range(len(batch)):
+            reason = None
+            for name, (low, high) in RANGES.items():
+                if not (low <= columns[name][row] <= high):
+                    reason = f"{name}_out_of_range"
+                    break
+            if reason is None:
+                keep.append(row)
+            else:
+                self._reject(columns["line"][row], reason)
+
+        filtered = SignalBatch({
+            name: array(typecode, (columns[name][row] for row in keep))
+            for name, typecode in BATCH_COLUMNS.items()
+        })
+        self.accepted += len(filtered)
+        return filtered
+
+    def _reject(self, line: int, reason: str) -> None:
+        self.rejected[reason] = self.rejected.get(reason, 0) + 1
+        if len(self.rejections) < self.max_rejections:
+            self.rejections.append({"line": line, "reason": reason})
+
+
+def _has_nan(columns: Dict[str, array]) -> bool:
+    # min()/max() may pass over NaN depending on its position; a sum cannot
+    for name in ("confidence", "uncertainty"):
+        total = sum(columns[name])
+        if total != total:
+            return True
+    return False
+
+
+def read_signals(source: Union[str, IO[str]], chunk_size: int = 4096) -> Iterator[Signal]:
+    return SignalReader(source, chunk_size).iter_signals()
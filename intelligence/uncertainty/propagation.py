@@ -0,0 +1,111 @@
+"""
+propagation.py
+
+Incremental uncertainty propagation over a graph of signals.
+This module:
+- Holds leaf signals and fusion nodes that fuse their inputs in order
+- Marks only the descendants of an updated leaf dirty
+- Recomputes a dirty node only when it is read, with fusion_rules.fuse
+
+A dirty node's descendants are always dirty, so marking stops at the
+first node already dirty: an update costs the newly affected subgraph,
+a read costs the dirty nodes it depends on. Inputs must exist before
+the node that fuses them, so the graph cannot contain cycles.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+from intelligence.fusion.fusion_rules import fuse
+from intelligence.semantics.signals import Signal
+
+
+class PropagationGraph:
+    def __init__(self, fuse_fn: Callable[[Signal, Signal], Signal] = fuse):
+        self.fuse_fn = fuse_fn
+        self.inputs: Dict[str, List[str]] = {}
+        self.children: Dict[str, List[str]] = {}
+        self.values: Dict[str, Optional[Signal]] = {}
+        self.dirty: Set[str] = set()
+        self.recomputations = 0
+
+    def add_signal(self, name: str, signal: Signal) -> None:
+        self._add_node(name)
+        self.values[name] = signal
+
+    def add_fusion(self, name: str, inputs: Sequence[str]) -> None:
+        """Node fusing inputs left to right; computed on first read."""
+        if len(inputs) < 2:
+            raise ValueError(f"Fusion node '{name}' needs at least two inputs")
+        for input_name in inputs:
+            if input_name not in self.values:
+                raise ValueError(f"Unknown input '{input_name}' for fusion node '{name}'")
+
+        self._add_node(name)
+        self.inputs[name] = list(inputs)
+        self.values[name] = None
+        self.dirty.add(name)
+        for input_name in inputs:
+            self.children[input_name].append(name)
+
+    def update(self, name: str, signal: Signal) -> int:
+        """Replace a leaf signal; return how many nodes became dirty."""
+        if name not in self.values:
+            raise ValueError(f"Unknown signal '{name}'")
+        if name in self.inputs:
+            raise ValueError(f"'{name}' is a fusion node; only leaf signals can be updated")
+
+        self.values[name] = signal
+        marked = 0
+        stack = list(self.children[name])
+        while stack:
+            node = stack.pop()
+            if node in self.dirty:
+                continue
+            self.dirty.add(node)
+            marked += 1
+            stack.extend(self.children[node])
+        return marked
+
+    def get(self, name: str) -> Signal:
+        """Current value of a node, recomputing only dirty dependencies."""
+        if name not in self.values:
+            raise ValueError(f"Unknown signal '{name}'")
+        if name not in self.dirty:
+            return self.values[name]
+
+        # Iterative post-order over dirty nodes only
+        stack = [(name, False)]
+        while stack:
+            node, inputs_ready = stack.pop()
+            if node not in self.dirty:
+                continue
+            if inputs_ready:
+                self._recompute(node)
+                continue
+            stack.append((node, True))
+            stack.extend((input_name, False) for input_name in self.inputs[node] if input_name in self.dirty)
+
+        return self.values[name]
+
+    def is_dirty(self, name: str) -> bool:
+        return name in self.dirty
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.values
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def _add_node(self, name: str) -> None:
+        if name in self.values:
+            raise ValueError(f"Signal '{name}' already exists")
+        self.children[name] = []
+
+    def _recompute(self, node: str) -> None:
+        input_names = self.inputs[node]
+        fused = self.values[input_names[0]]
+        for input_name in input_names[1:]:
+            fused = self.fuse_fn(fused, self.values[input_name])
+        self.values[node] = fused
+        self.dirty.discard(node)
+        self.recomputations += 1
@@ -0,0 +1,191 @@
+"""
+actor_learner.py
+
+Actor-learner training across processes.
+This module:
+- Runs several actor processes, each with its own EpisodeRunner
+- Sends actors policy snapshots, refreshed every few episodes
+- Feeds traces to the learner through one bounded queue
+- Records how many updates behind each trace's policy version was
+
+The learner runs in the calling process and is the only writer of the
+policy. Actors receive commands ("run n episodes with policy version
+v") and block when the trace queue is full, so nothing is buffered
+without bound. An actor gets its next command when the learner has
+consumed the last trace of its previous one.
+
+In deterministic mode traces are consumed in command-issue order, not
+arrival order, so the policy versions handed out, the update order and
+the log are identical on every run. Out-of-order traces wait in a
+reorder buffer of at most actors * refresh_every traces.
+
+Factories must be picklable (module-level callables) when the
+multiprocessing start method is not fork.
+"""
+
+import traceback
+from collections import deque
+from multiprocessing import get_context
+from queue import Empty
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from learning.episode_runner import EpisodeRunner
+
+
+def _actor_main(actor_id: int, make_environment: Callable, make_policy: Callable,
+                make_exploration: Callable, max_steps: int, commands, traces) -> None:
+    try:
+        runner = EpisodeRunner(make_environment(actor_id), make_policy(), make_exploration())
+        sequence = 0
+        while True:
+            command = commands.get()
+            if command is None:
+                return
+            version, snapshot, episodes = command
+            runner.policy.restore(snapshot)
+            for _ in range(episodes):
+                trace = runner.run_episode(max_steps)["trace"]
+                # Blocks while the queue is full: backpressure on this actor
+                traces.put(("trace", actor_id, sequence, version, trace))
+                sequence += 1
+    except BaseException:
+        traces.put(("error", actor_id, traceback.format_exc()))
+
+
+class ActorLearner:
+    def __init__(self, make_environment: Callable[[int], Any], make_policy: Callable[[], Any],
+                 make_exploration: Callable[[], Any], learner, replay_logger, actors: int = 2,
+                 max_queued: int = 8, refresh_every: int = 4, deterministic: bool = False,
+                 start_method: Optional[str] = None, poll_seconds: float = 1.0):
+        """
+        make_environment: builds one environment per actor, given its id
+        make_policy: builds a policy; it must implement snapshot/restore
+        make_exploration: builds one exploration strategy per actor
+        max_queued: capacity of the trace queue
+        refresh_every: episodes an actor runs per policy snapshot
+        deterministic: consume traces in command-issue order
+        poll_seconds: how often the learner checks for dead actors
+        """
+        if actors <= 0:
+            raise ValueError(f"actors must be positive, got {actors}")
+        if max_queued <= 0:
+            raise ValueError(f"max_queued must be positive, got {max_queued}")
+        if refresh_every <= 0:
+            raise ValueError(f"refresh_every must be positive, got {refresh_every}")
+
+        self.make_environment = make_environment
+        self.make_policy = make_policy
+        self.make_exploration = make_exploration
+        self.learner = learner
+        self.replay_logger = replay_logger
+        self.actors = actors
+        self.max_queued = max_queued
+        self.refresh_every = refresh_every
+        self.deterministic = deterministic
+        self.poll_seconds = poll_seconds
+        self.context = get_context(start_method)
+
+        self.policy = make_policy()
+        self.version = 0
+
+    def train(self, episodes: int, max_steps_per_episode: int) -> Dict[str, Any]:
+        """Run episodes across the actors; return staleness statistics."""
+        self.version = 0
+        traces = self.context.Queue(self.max_queued)
+        commands = [self.context.Queue() for _ in range(self.actors)]
+        processes = [
+            self.context.Process(
+                target=_actor_main,
+                args=(actor_id, self.make_environment, self.make_policy, self.make_exploration,
+                      max_steps_per_episode, commands[actor_id], traces),
+                daemon=True
+            )
+            for actor_id in range(self.actors)
+        ]
+        for process in processes:
+            process.start()
+
+        # (actor_id, sequence) of every trace still owed, in issue order
+        expected: Deque[Tuple[int, int]] = deque()
+        last_of_command: Dict[int, int] = {}
+        next_sequence = [0] * self.actors
+        assigned = 0
+        staleness: List[int] = []
+
+        def issue(actor_id: int) -> None:
+            nonlocal assigned
+            count = min(self.refresh_every, episodes - assigned)
+            if count <= 0:
+                return
+            assigned += count
+            expected.extend((actor_id, next_sequence[actor_id] + i) for i in range(count))
+            next_sequence[actor_id] += count
+            last_of_command[actor_id] = next_sequence[actor_id] - 1
+            commands[actor_id].put((self.version, self.policy.snapshot(), count))
+
+        try:
+            for actor_id in range(self.actors):
+                issue(actor_id)
+
+            reorder: Dict[Tuple[int, int], Tuple[int, List[Dict[str, Any]]]] = {}
+            for episode_id in range(episodes):
+                if self.deterministic:
+                    key = expected.popleft()
+                    while key not in reorder:
+                        actor_id, sequence, version, trace = self._receive(traces, processes)
+                        reorder[(actor_id, sequence)] = (version, trace)
+                    actor_id, sequence = key
+                    version, trace = reorder.pop(key)
+                else:
+                    actor_id, sequence, version, trace = self._receive(traces, processes)
+                    expected.remove((actor_id, sequence))
+
+                staleness.append(self.version - version)
+                self.learner.update_policy(policy=self.policy, episode_trace=trace)
+                self.version += 1
+
+                self.replay_logger.log({
+                    "episode_id": episode_id,
+                    "actor_id": actor_id,
+                    "policy_version": version,
+                    "staleness": staleness[-1],
+                    "policy_snapshot": self.policy.snapshot(),
+                    "episode_trace": trace
+                })
+
+                if sequence == last_of_command[actor_id]:
+                    issue(actor_id)
+        finally:
+            self._shutdown(processes, commands)
+
+        return {
+            "episodes": episodes,
+            "policy_version": self.version,
+            "staleness": {
+                "max": max(staleness, default=0),
+                "mean": sum(staleness) / len(staleness) if staleness else 0.0
+            }
+        }
+
+    def _receive(self, traces, processes) -> Tuple[int, int, int, List[Dict[str, Any]]]:
+        while True:
+            try:
+                message = traces.get(timeout=self.poll_seconds)
+            except Empty:
+                for actor_id, process in enumerate(processes):
+                    if not process.is_alive() and process.exitcode != 0:
+                        raise RuntimeError(f"Actor {actor_id} exited with code {process.exitcode}")
+                continue
+            if message[0] == "error":
+                raise RuntimeError(f"Actor {message[1]} failed:\n{message[2]}")
+            return message[1], message[2], message[3], message[4]
+
+    def _shutdown(self, processes, commands) -> None:
+        for queue in commands:
+            queue.put(None)
+        for process in processes:
+            process.join(timeout=self.poll_seconds)
+            if process.is_alive():
+                # Still blocked on a full trace queue after a learner error
+                process.terminate()
+                process.join()
@@ -0,0 +1,247 @@
+"""
+checkpoints.py
+
+Joint environment / policy / exploration checkpoints.
+This module:
+- Captures everything needed to resume training at an episode boundary
+- Stores checkpoints in memory or as JSON lines on disk
+- Replays an episode range by resuming from the nearest checkpoint
+
+Episode ids count up across a loop's train() / train_online() calls, so
+a store and a log hold one loop's run, possibly trained in phases and
+in both modes. A second, different checkpoint for an episode id, or an
+episode id logged twice, comes from another run and is rejected rather
+than mixed in. Replay re-runs each episode in the mode it was logged in.
+
+Each checkpoint repeats every exploration visit key seen so far; given
+a utils.state_store.StateStore, those keys are stored once and
+checkpoints refer to them by id.
+
+Optional protocols:
+- environment.checkpoint() -> dict and environment.restore(dict);
+  environments without them must be fully reset by reset()
+- policy.restore(snapshot) inverting policy.snapshot()
+- exploration.checkpoint() / exploration.restore(dict), as on
+  ExplorationStrategy; stateless strategies may omit them
+"""
+
+import copy
+import json
+import os
+from bisect import bisect_right
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.state import to_json_value
+from learning.replay import ReplayDivergenceError, first_difference, join_frames
+
+
+class CheckpointStore:
+    def __init__(self, path: Optional[str] = None, state_store=None):
+        """
+        path: optional JSON-lines file; existing checkpoints are loaded
+        state_store: optional shared StateStore for exploration visit keys
+        """
+        self.path = path
+        self.state_store = state_store
+        self.checkpoints: Dict[int, Dict[str, Any]] = {}
+        self._episode_ids: List[int] = []
+
+        if path is not None and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as handle:
+                for line in handle:
+                    if line.strip():
+                        self._insert(json.loads(line))
+
+    def save(self, checkpoint: Dict[str, Any]) -> None:
+        if self.state_store is not None:
+            checkpoint = self._compact(checkpoint)
+        if self.path is not None:
+            with open(self.path, "a", encoding="utf-8") as handle:
+                handle.write(json.dumps(to_json_value(checkpoint), sort_keys=True) + "\n")
+            # Stored copy goes through the same serialization as a reload
+            checkpoint = json.loads(json.dumps(to_json_value(checkpoint), sort_keys=True))
+        else:
+            checkpoint = copy.deepcopy(checkpoint)
+        self._insert(checkpoint)
+
+    def nearest(self, episode_id: int) -> Optional[Dict[str, Any]]:
+        """Latest checkpoint taken at or before episode_id."""
+        position = bisect_right(self._episode_ids, episode_id)
+        if position == 0:
+            return None
+        checkpoint = self.checkpoints[self._episode_ids[position - 1]]
+        if self.state_store is not None:
+            return self._expand(checkpoint)
+        return checkpoint
+
+    def __len__(self) -> int:
+        return len(self.checkpoints)
+
+    def _compact(self, checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+        exploration = checkpoint["exploration"]
+        if not exploration or "state_visit_counter" not in exploration:
+            return checkpoint
+        pairs = [[self.state_store.put(key), count] for key, count in exploration["state_visit_counter"]]
+        return {**checkpoint, "exploration": {**exploration, "state_visit_counter": pairs, "key_ids": True}}
+
+    def _expand(self, checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+        exploration = checkpoint["exploration"]
+        if not exploration or not exploration.get("key_ids"):
+            return checkpoint
+        pairs = [[self.state_store.get(key_id), count] for key_id, count in exploration["state_visit_counter"]]
+        exploration = {name: value for name, value in exploration.items() if name != "key_ids"}
+        return {**checkpoint, "exploration": {**exploration, "state_visit_counter": pairs}}
+
+    def _insert(self, checkpoint: Dict[str, Any]) -> None:
+        episode_id = checkpoint["episode_id"]
+        if episode_id in self.checkpoints:
+            if self.checkpoints[episode_id] != checkpoint:
+                raise ValueError(
+                    f"A different checkpoint for episode {episode_id} is already stored; "
+                    "use one CheckpointStore per LearningLoop"
+                )
+            return
+        self._episode_ids.insert(bisect_right(self._episode_ids, episode_id), episode_id)
+        self.checkpoints[episode_id] = checkpoint
+
+
+def episode_logs(records: Iterable[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    """Joined replay records by episode id; an id logged twice is an error."""
+    logs: Dict[int, Dict[str, Any]] = {}
+    for record in join_frames(records):
+        episode_id = record["episode_id"]
+        if episode_id in logs:
+            raise ValueError(
+                f"Episode {episode_id} appears more than once in the replay log; "
+                "log one LearningLoop per file"
+            )
+        logs[episode_id] = record
+    return logs
+
+
+def episode_modes(records: Iterable[Dict[str, Any]]) -> Dict[int, str]:
+    """How each logged episode trained: framed records come from train_online()."""
+    return {record["episode_id"]: "online" if "frame" in record else "batch" for record in records}
+
+
+def capture_checkpoint(loop, episode_id: int, max_steps_per_episode: int, mode: str) -> Dict[str, Any]:
+    """State of the loop components before episode_id runs."""
+    environment_checkpoint = getattr(loop.environment, "checkpoint", None)
+    exploration_checkpoint = getattr(loop.exploration, "checkpoint", None)
+    return {
+        "episode_id": episode_id,
+        "max_steps_per_episode": max_steps_per_episode,
+        "mode": mode,
+        "environment": environment_checkpoint() if environment_checkpoint is not None else None,
+        "policy": loop.policy.snapshot(),
+        "exploration": exploration_checkpoint() if exploration_checkpoint is not None else None
+    }
+
+
+def restore_checkpoint(loop, checkpoint: Dict[str, Any]) -> None:
+    if not hasattr(loop.policy, "restore"):
+        raise ValueError("Policy must implement restore(snapshot) to resume from a checkpoint")
+
+    loop.next_episode_id = checkpoint["episode_id"]
+    if checkpoint["environment"] is not None:
+        loop.environment.restore(copy.deepcopy(checkpoint["environment"]))
+    loop.policy.restore(copy.deepcopy(checkpoint["policy"]))
+    if checkpoint["exploration"] is not None:
+        loop.exploration.restore(copy.deepcopy(checkpoint["exploration"]))
+
+
+def _compare_traces(episode_id: int, expected: List[Dict[str, Any]], actual: List[Dict[str, Any]]) -> None:
+    difference = first_difference(expected, actual)
+    if difference is None:
+        return
+    if difference["field"] == "length":
+        raise ReplayDivergenceError(
+            f"Replay divergence in episode {episode_id}: expected {difference['expected']} steps, "
+            f"got {difference['actual']}"
+        )
+    raise ReplayDivergenceError(
+        f"Replay divergence in episode {episode_id} at step {difference['step']}: "
+        f"expected {difference['field']} {difference['expected']!r}, got {difference['actual']!r}"
+    )
+
+
+def resume(loop, store: CheckpointStore, episode_id: int,
+           max_steps_per_episode: Optional[int] = None, mode: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Restore the loop to the nearest checkpoint at or before episode_id.
+    Returns where re-execution starts and how episodes were run.
+    Without a preceding checkpoint the loop's components must be fresh,
+    and max_steps_per_episode and mode ("batch" or "online") are required.
+    """
+    checkpoint = store.nearest(episode_id)
+
+    if checkpoint is not None:
+        restore_checkpoint(loop, checkpoint)
+        return {
+            "checkpoint_episode": checkpoint["episode_id"],
+            "first": checkpoint["episode_id"],
+            "max_steps_per_episode": checkpoint["max_steps_per_episode"],
+            "mode": checkpoint["mode"]
+        }
+
+    # Fresh components are the state before episode 0
+    if max_steps_per_episode is None:
+        raise ValueError("No checkpoint precedes start; max_steps_per_episode is required")
+    if mode not in ("batch", "online"):
+        raise ValueError(f"No checkpoint precedes start; mode must be 'batch' or 'online', got {mode!r}")
+    return {
+        "checkpoint_episode": None,
+        "first": 0,
+        "max_steps_per_episode": max_steps_per_episode,
+        "mode": mode
+    }
+
+
+def rerun_episode(loop, max_steps: int, mode: str) -> List[Dict[str, Any]]:
+    """Run and learn one episode exactly as train() or train_online() would."""
+    if mode == "online":
+        trace = []
+        for transition in loop.episode_runner.iter_transitions(max_steps):
+            loop.learner.update_transition(loop.policy, transition)
+            trace.append(transition)
+        return trace
+
+    trace = loop.episode_runner.run_episode(max_steps)["trace"]
+    loop.learner.update_policy(policy=loop.policy, episode_trace=trace)
+    return trace
+
+
+def replay_range(loop, store: CheckpointStore, records: Iterable[Dict[str, Any]],
+                 start: int, end: int, max_steps_per_episode: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Re-run episodes start..end (inclusive) with the loop's components,
+    resuming from the nearest checkpoint at or before start, and verify
+    each re-run episode against the logged trace.
+
+    loop: a LearningLoop built from fresh components of the same types
+    records: replay log records (batch or framed online records)
+    """
+    if end < start:
+        raise ValueError(f"end ({end}) must not precede start ({start})")
+
+    records = list(records)
+    logs = episode_logs(records)
+    modes = episode_modes(records)
+    resumed = resume(loop, store, start, max_steps_per_episode, modes.get(0, "batch"))
+    first = resumed["first"]
+
+    replayed = []
+    for episode_id in range(first, end + 1):
+        trace = rerun_episode(loop, resumed["max_steps_per_episode"], modes.get(episode_id, resumed["mode"]))
+
+        if episode_id >= start:
+            if episode_id not in logs:
+                raise ValueError(f"Episode {episode_id} is not in the replay log")
+            _compare_traces(episode_id, logs[episode_id]["episode_trace"], trace)
+            replayed.append(episode_id)
+
+    return {
+        "checkpoint_episode": resumed["checkpoint_episode"],
+        "episodes_run": end + 1 - first,
+        "replayed": replayed
+    }
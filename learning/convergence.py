@@ -0,0 +1,116 @@
+"""
+convergence.py
+
+Convergence detection for early stopping.
+This module:
+- Compares consecutive policy tables (snapshot()["values"]) in one pass
+- Measures the largest absolute value change and how many states
+  changed their greedy action
+- Reports convergence once both stay within tolerance for a window
+  of consecutive episodes
+
+The monitor reads the snapshot LearningLoop already takes for the
+replay log, so it costs one pass over the table per episode and never
+touches the policy itself. A value missing from a table counts as 0.0;
+a state first seen in an episode counts as a greedy-action change.
+Snapshots must carry the table under "values" ({state: {action: value}});
+any other shape is an error rather than an empty, never-changing table.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+
+def greedy_action(values: Dict[str, float]) -> Optional[str]:
+    """Highest-valued action; ties go to the lexicographically first name."""
+    if not values:
+        return None
+    return min(values, key=lambda action: (-values[action], action))
+
+
+def table_distance(previous: Dict[Any, Dict[str, float]],
+                   current: Dict[Any, Dict[str, float]]) -> Tuple[float, int]:
+    """(max absolute value change, greedy-action flips) between two tables."""
+    max_change = 0.0
+    flips = 0
+    empty: Dict[str, float] = {}
+
+    for key, values in current.items():
+        old = previous.get(key, empty)
+        for action, value in values.items():
+            change = abs(value - old.get(action, 0.0))
+            if change > max_change:
+                max_change = change
+        for action in old.keys() - values.keys():
+            change = abs(old[action])
+            if change > max_change:
+                max_change = change
+        if greedy_action(values) != greedy_action(old):
+            flips += 1
+
+    for key in previous.keys() - current.keys():
+        for value in previous[key].values():
+            if abs(value) > max_change:
+                max_change = abs(value)
+        flips += 1
+
+    return max_change, flips
+
+
+class ConvergenceMonitor:
+    def __init__(self, tolerance: float = 1e-6, window: int = 5, max_flips: int = 0):
+        """
+        tolerance: largest value change still treated as "unchanged"
+        window: consecutive unchanged episodes required to stop
+        max_flips: greedy-action changes still treated as "unchanged"
+        """
+        if tolerance < 0:
+            raise ValueError(f"tolerance must be non-negative, got {tolerance}")
+        if window <= 0:
+            raise ValueError(f"window must be positive, got {window}")
+        if max_flips < 0:
+            raise ValueError(f"max_flips must be non-negative, got {max_flips}")
+
+        self.tolerance = tolerance
+        self.window = window
+        self.max_flips = max_flips
+        self.reset()
+
+    def reset(self) -> None:
+        self.previous: Optional[Dict[Any, Dict[str, float]]] = None
+        self.stable = 0
+        self.last: Dict[str, Any] = {}
+
+    def observe(self, snapshot: Dict[str, Any]) -> bool:
+        """Record the policy after one episode; True once converged."""
+        current = snapshot.get("values") if isinstance(snapshot, dict) else None
+        if not isinstance(current, dict):
+            raise ValueError(
+                "ConvergenceMonitor needs policy snapshots with a 'values' table "
+                "({state: {action: value}})"
+            )
+        if self.previous is None:
+            # No earlier table to compare with: nothing is known to be stable
+            self.previous = current
+            self.last = {"max_abs_change": None, "argmax_flips": None, "stable_episodes": 0}
+            return False
+
+        max_change, flips = table_distance(self.previous, current)
+        self.previous = current
+        if max_change <= self.tolerance and flips <= self.max_flips:
+            self.stable += 1
+        else:
+            self.stable = 0
+
+        self.last = {"max_abs_change": max_change, "argmax_flips": flips, "stable_episodes": self.stable}
+        return self.stable >= self.window
+
+    def decision(self, episode_id: int) -> Dict[str, Any]:
+        """Loggable record of a stop after episode_id."""
+        return {
+            "reason": "converged",
+            "episode_id": episode_id,
+            "tolerance": self.tolerance,
+            "window": self.window,
+            "max_flips": self.max_flips,
+            **self.last
+        }
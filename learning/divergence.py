@@ -0,0 +1,117 @@
+"""
+divergence.py
+
+Locates the first episode where a build stops reproducing a stored log.
+This module:
+- Probes one episode at a time from stored state, never from episode 0
+- Binary-searches episode ids: O(log n) probes for n logged episodes
+- Reports the first divergent step with the logged and replayed actions
+
+With a CheckpointStore, a probe restores the nearest checkpoint and
+re-runs forward to the probed episode. Without one, it restores the
+policy snapshot logged after the previous episode and checks exploit
+steps through ReplayEngine (batch-mode logs only: online-mode policies
+change within an episode).
+
+Bisection assumes divergence persists: once an episode diverges, every
+later one does too. Episodes before the reported one that were never
+probed are not verified.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from learning.checkpoints import CheckpointStore, episode_logs, episode_modes, rerun_episode, resume
+from learning.replay import ReplayEngine, first_difference
+
+
+class DivergenceBisector:
+    def __init__(self, make_loop: Callable[[], Any], records: Iterable[Dict[str, Any]],
+                 store: Optional[CheckpointStore] = None):
+        """
+        make_loop: builds a LearningLoop from fresh components of the
+                   build under test; called once per probe
+        records: replay log records (batch or framed online records)
+        store: optional checkpoints recorded alongside the log
+        """
+        records = list(records)
+        self.make_loop = make_loop
+        self.store = store
+        self.logs = episode_logs(records)
+        self.modes = episode_modes(records)
+        self.episode_ids: List[int] = sorted(self.logs)
+        self.probes: List[int] = []
+        self._results: Dict[int, Optional[Dict[str, Any]]] = {}
+
+        if store is None and "online" in self.modes.values():
+            raise ValueError("Online-mode logs can only be bisected with a CheckpointStore")
+
+    def probe(self, episode_id: int) -> Optional[Dict[str, Any]]:
+        """First difference in episode_id, or None if it reproduces."""
+        if episode_id not in self.logs:
+            raise ValueError(f"Episode {episode_id} is not in the replay log")
+        if episode_id not in self._results:
+            self.probes.append(episode_id)
+            if self.store is not None:
+                self._results[episode_id] = self._probe_checkpoint(episode_id)
+            else:
+                self._results[episode_id] = self._probe_snapshot(episode_id)
+        return self._results[episode_id]
+
+    def bisect(self, start: Optional[int] = None, end: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Earliest divergent episode in start..end (default: whole log),
+        or None when end itself reproduces.
+        """
+        candidates = [
+            episode_id for episode_id in self.episode_ids
+            if (start is None or episode_id >= start) and (end is None or episode_id <= end)
+        ]
+        if not candidates or self.probe(candidates[-1]) is None:
+            return None
+
+        low, high = 0, len(candidates) - 1
+        while low < high:
+            middle = (low + high) // 2
+            if self.probe(candidates[middle]) is None:
+                low = middle + 1
+            else:
+                high = middle
+
+        episode_id = candidates[high]
+        return {"episode_id": episode_id, **self._results[episode_id], "probes": list(self.probes)}
+
+    def _probe_checkpoint(self, episode_id: int) -> Optional[Dict[str, Any]]:
+        loop = self.make_loop()
+        resumed = resume(loop, self.store, episode_id, mode=self.modes.get(0, "batch"))
+        trace: List[Dict[str, Any]] = []
+        for rerun_id in range(resumed["first"], episode_id + 1):
+            trace = rerun_episode(loop, resumed["max_steps_per_episode"], self.modes.get(rerun_id, resumed["mode"]))
+        return first_difference(self.logs[episode_id]["episode_trace"], trace)
+
+    def _probe_snapshot(self, episode_id: int) -> Optional[Dict[str, Any]]:
+        loop = self.make_loop()
+        # Episode k was acted with the policy as of episode k-1's snapshot
+        if episode_id > 0:
+            if episode_id - 1 not in self.logs:
+                raise ValueError(f"Probing episode {episode_id} needs the snapshot of episode {episode_id - 1}")
+            if not hasattr(loop.policy, "restore"):
+                raise ValueError("Policy must implement restore(snapshot) to probe from snapshots")
+            loop.policy.restore(self.logs[episode_id - 1]["policy_snapshot"])
+
+        divergence = ReplayEngine(loop.environment, loop.policy).find_divergence(self.logs[episode_id])
+        if divergence is None:
+            return None
+        return {
+            "step": divergence["step"],
+            "field": "action",
+            "expected": divergence["expected_action"],
+            "actual": divergence["actual_action"],
+            "expected_action": divergence["expected_action"],
+            "actual_action": divergence["actual_action"]
+        }
+
+
+def bisect_divergence(make_loop: Callable[[], Any], records: Iterable[Dict[str, Any]],
+                      store: Optional[CheckpointStore] = None, start: Optional[int] = None,
+                      end: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    return DivergenceBisector(make_loop, records, store).bisect(start, end)
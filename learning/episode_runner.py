@@ -5,40 +5,69 @@ Runs a single deterministic episode.
 This module:
 - Uses the current policy
 - Applies exploration rules
-- Collects a full transition trace
+- Collects a full transition trace, or yields transitions one by one
 - NEVER updates the policy
 """
 
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any
 
 
 class EpisodeRunner:
-    def __init__(self, environment, policy, exploration_strategy):
+    def __init__(self, environment, policy, exploration_strategy, instrumentation=None):
         """
         environment: object exposing reset() and step(action)
         policy: deterministic policy object
         exploration_strategy: explicit exploration controller
+        instrumentation: optional learning.instrumentation.Instrumentation
         """
         self.environment = environment
         self.policy = policy
         self.exploration = exploration_strategy
+        self.instrumentation = instrumentation
 
     def run_episode(self, max_steps: int) -> Dict[str, Any]:
+        episode_trace: List[Dict[str, Any]] = list(self.iter_transitions(max_steps))
+
+        return {
+            "episode_length": len(episode_trace),
+            "trace": episode_trace
+        }
+
+    def iter_transitions(self, max_steps: int) -> Iterator[Dict[str, Any]]:
+        """
+        Yield transitions as they happen. Nothing is buffered, so a
+        consumer that updates the policy between yields sees the next
+        action chosen by the updated policy.
+        """
+        decide = self.exploration.decide
+        explore_action = self.exploration.explore_action
+        select_action = self.policy.select_action
+        env_step = self.environment.step
+        # Optional: strategies that count every executed action
+        record_action = getattr(self.exploration, "record_action", None)
+
+        if self.instrumentation is not None:
+            decide = self.instrumentation.wrap("exploration.decide", decide)
+            explore_action = self.instrumentation.wrap("exploration.explore_action", explore_action)
+            select_action = self.instrumentation.wrap("policy.select_action", select_action)
+            env_step = self.instrumentation.wrap("environment.step", env_step)
+
         state = self.environment.reset()
-        episode_trace: List[Dict[str, Any]] = []
 
         for step in range(max_steps):
             # Decide whether to explore or exploit (explicit rule)
-            mode = self.exploration.decide(state, step)
+            mode = decide(state, step)
 
             if mode == "EXPLORE":
-                action = self.exploration.explore_action(state)
+                action = explore_action(state)
             else:
-                action = self.policy.select_action(state)
+                action = select_action(state)
+            if record_action is not None:
+                record_action(state, action)
 
-            next_state, reward, done, info = self.environment.step(action)
+            next_state, reward, done, info = env_step(action)
 
-            transition = {
+            yield {
                 "step": step,
                 "state": state,
                 "action": action,
@@ -47,14 +76,7 @@ class EpisodeRunner:
                 "mode": mode
             }
 
-            episode_trace.append(transition)
-
             state = next_state
 
             if done:
                 break
-
-        return {
-            "episode_length": len(episode_trace),
-            "trace": episode_trace
-        }
@@ -4,12 +4,31 @@ exploration.py
 Explicit exploration vs exploitation logic.
 No randomness.
 All decisions are rule-based and explainable.
+
+ExplorationStrategy explores each state a fixed number of times with
+WAIT. CountBasedExploration keeps per-(state, action) counts and tries
+the least-tried action while its UCB-style bonus is large.
+
+Optional hook: record_action(state, action) is called by EpisodeRunner
+with every executed action, explored or exploited.
 """
 
+from array import array
+from math import log
+
+from core.contracts import ACTION_SET
+from core.state import State, state_key_from_json
+
 class ExplorationStrategy:
-    def __init__(self, min_visits_required: int = 2):
+    def __init__(self, min_visits_required: int = 2, state_encoder=None):
+        """
+        state_encoder: optional learning.state_encoding encoder; when set,
+        visits are counted per encoded state, so the counter is bounded
+        by the encoder size instead of growing with every distinct float
+        """
         self.state_visit_counter = {}
         self.min_visits_required = min_visits_required
+        self.state_encoder = state_encoder
 
     def decide(self, state, step: int) -> str:
         """
@@ -38,5 +57,105 @@ class ExplorationStrategy:
             self.state_visit_counter[key] = 0
         self.state_visit_counter[key] += 1
 
+    def checkpoint(self) -> dict:
+        # Pairs, not a mapping: encoded keys may be ints or tuples,
+        # which JSON objects cannot hold
+        return {"state_visit_counter": [[key, count] for key, count in self.state_visit_counter.items()]}
+
+    def restore(self, checkpoint: dict) -> None:
+        self.state_visit_counter = {
+            state_key_from_json(key): count for key, count in checkpoint["state_visit_counter"]
+        }
+
+    def _state_key(self, state):
+        if self.state_encoder is not None:
+            return self.state_encoder.encode(state)
+        if state.__class__ is State:
+            # Already hashable and immutable
+            return state
+        return str(state)
+
+
+class CountBasedExploration:
+    def __init__(self, exploration_bonus: float = 1.0, state_encoder=None, actions=tuple(ACTION_SET)):
+        """
+        exploration_bonus: c in the bonus c * sqrt(ln N / n), where N counts
+        visits to the state and n tries of its least-tried action. A state
+        is explored while the bonus is at least 1, i.e. n <= c^2 ln N, so
+        every action is tried once and retries thin out logarithmically.
+        state_encoder: as for ExplorationStrategy; bounds the count tables
+        actions: candidates in tie-break order
+        """
+        if exploration_bonus < 0:
+            raise ValueError(f"exploration_bonus must be non-negative, got {exploration_bonus}")
+
+        self.exploration_bonus = exploration_bonus
+        self.state_encoder = state_encoder
+        self.actions = tuple(actions)
+        self.state_visits = {}
+        self.action_counts = {}
+        self._action_index = {action: index for index, action in enumerate(self.actions)}
+        self._bonus_squared = exploration_bonus * exploration_bonus
+        self._last_state = None
+        self._last_counts = None
+
+    def decide(self, state, step: int) -> str:
+        key = self._state_key(state)
+        visits = self.state_visits.get(key, 0) + 1
+        self.state_visits[key] = visits
+        counts = self._counts(key)
+
+        # explore_action / record_action follow with the same state
+        self._last_state = state
+        self._last_counts = counts
+
+        if min(counts) <= self._bonus_squared * log(visits):
+            return "EXPLORE"
+        return "EXPLOIT"
+
+    def explore_action(self, state):
+        """Least-tried action for this state; ties go to the earliest action."""
+        counts = self._current_counts(state)
+        return self.actions[counts.index(min(counts))]
+
+    def record_action(self, state, action) -> None:
+        """Count an executed action, whether it was explored or exploited."""
+        index = self._action_index.get(action)
+        if index is None:
+            # Typed actions count under their name
+            index = self._action_index.get(str(action))
+            if index is None:
+                raise ValueError(f"Invalid action: {action}")
+        self._current_counts(state)[index] += 1
+
+    def checkpoint(self) -> dict:
+        return {
+            "state_visits": [[key, visits] for key, visits in self.state_visits.items()],
+            "action_counts": [[key, counts.tolist()] for key, counts in self.action_counts.items()]
+        }
+
+    def restore(self, checkpoint: dict) -> None:
+        self.state_visits = {state_key_from_json(key): visits for key, visits in checkpoint["state_visits"]}
+        self.action_counts = {
+            state_key_from_json(key): array("q", counts) for key, counts in checkpoint["action_counts"]
+        }
+        self._last_state = None
+        self._last_counts = None
+
+    def _current_counts(self, state) -> array:
+        if state is self._last_state:
+            return self._last_counts
+        return self._counts(self._state_key(state))
+
+    def _counts(self, key) -> array:
+        counts = self.action_counts.get(key)
+        if counts is None:
+            counts = self.action_counts[key] = array("q", bytes(8 * len(self.actions)))
+        return counts
+
     def _state_key(self, state):
+        if self.state_encoder is not None:
+            return self.state_encoder.encode(state)
+        if state.__class__ is State:
+            return state
         return str(state)
@@ -0,0 +1,207 @@
+"""
+instrumentation.py
+
+Per-stage timing for the learning loop.
+This module:
+- Accumulates monotonic-clock time and call counts per stage
+- Reports steps/s, time share per stage and episode percentiles
+- Forwards per-episode records to external hooks
+- NEVER feeds timings back into learning, logs or decisions
+
+When no Instrumentation is given, the runner and loop call the
+wrapped methods directly, so disabled instrumentation costs nothing.
+"""
+
+import time
+import tracemalloc
+from math import ceil
+from typing import Any, Callable, Dict, List, Protocol, Sequence
+
+STAGES = (
+    "exploration.decide",
+    "exploration.explore_action",
+    "policy.select_action",
+    "environment.step",
+    "learner.update_policy",
+    "policy.snapshot",
+    "replay_logger.log",
+)
+
+
+class InstrumentationHook(Protocol):
+    def on_episode(self, record: Dict[str, Any]) -> None:
+        ...
+
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sequence: the ceil(p * n)-th value."""
+    if not sorted_values:
+        return 0.0
+    # Rounded first so float noise (0.7 * 10 = 7.000000000000001) does not add a rank
+    rank = max(0, min(len(sorted_values) - 1, ceil(round(fraction * len(sorted_values), 9)) - 1))
+    return sorted_values[rank]
+
+
+class Instrumentation:
+    def __init__(self, hooks: Sequence[InstrumentationHook] = (), clock: Callable[[], float] = time.perf_counter):
+        self.hooks = list(hooks)
+        self.clock = clock
+        self.seconds: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        self.calls: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self.episode_seconds: List[float] = []
+        self.episode_steps: List[int] = []
+
+        self._episode_start = 0.0
+        self._episode_stage_start: Dict[str, float] = {}
+
+    def wrap(self, stage: str, fn: Callable) -> Callable:
+        """Return fn timed under the given stage name."""
+        if stage not in self.seconds:
+            raise ValueError(f"Unknown instrumentation stage: {stage}")
+
+        seconds = self.seconds
+        calls = self.calls
+        clock = self.clock
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                seconds[stage] += clock() - start
+                calls[stage] += 1
+
+        return timed
+
+    def begin_episode(self) -> None:
+        self._episode_stage_start = dict(self.seconds)
+        self._episode_start = self.clock()
+
+    def end_episode(self, episode_id: int, steps: int) -> None:
+        duration = self.clock() - self._episode_start
+        self.episode_seconds.append(duration)
+        self.episode_steps.append(steps)
+
+        if not self.hooks:
+            return
+
+        record = self._episode_record(episode_id, steps, duration)
+        for hook in self.hooks:
+            hook.on_episode(record)
+
+    def _episode_record(self, episode_id: int, steps: int, duration: float) -> Dict[str, Any]:
+        return {
+            "episode_id": episode_id,
+            "steps": steps,
+            "seconds": duration,
+            "stage_seconds": {
+                stage: self.seconds[stage] - self._episode_stage_start.get(stage, 0.0)
+                for stage in STAGES
+            }
+        }
+
+    def report(self) -> Dict[str, Any]:
+        total_seconds = sum(self.episode_seconds)
+        total_steps = sum(self.episode_steps)
+        staged_seconds = sum(self.seconds.values())
+        durations = sorted(self.episode_seconds)
+
+        return {
+            "episodes": len(self.episode_seconds),
+            "steps": total_steps,
+            "seconds": total_seconds,
+            "steps_per_second": total_steps / total_seconds if total_seconds > 0 else 0.0,
+            "stages": {
+                stage: {
+                    "seconds": self.seconds[stage],
+                    "calls": self.calls[stage],
+                    "share": self.seconds[stage] / staged_seconds if staged_seconds > 0 else 0.0
+                }
+                for stage in STAGES
+            },
+            "episode_seconds": {
+                "p50": percentile(durations, 0.50),
+                "p90": percentile(durations, 0.90),
+                "p99": percentile(durations, 0.99),
+                "max": durations[-1] if durations else 0.0
+            }
+        }
+
+
+class AllocationProfiler(Instrumentation):
+    """
+    Instrumentation that also attributes net traced allocations
+    (tracemalloc) to each stage, per episode. Much slower than plain
+    timing; intended for diagnosing growth, not for routine runs.
+    """
+
+    def __init__(self, hooks: Sequence[InstrumentationHook] = (), clock: Callable[[], float] = time.perf_counter):
+        super().__init__(hooks=hooks, clock=clock)
+        self.allocated: Dict[str, int] = {stage: 0 for stage in STAGES}
+        self.episode_allocations: List[Dict[str, Any]] = []
+        self._episode_alloc_start: Dict[str, int] = {}
+        self._started_tracing = False
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def wrap(self, stage: str, fn: Callable) -> Callable:
+        if stage not in self.seconds:
+            raise ValueError(f"Unknown instrumentation stage: {stage}")
+
+        seconds = self.seconds
+        calls = self.calls
+        allocated = self.allocated
+        clock = self.clock
+        traced = tracemalloc.get_traced_memory
+
+        def profiled(*args, **kwargs):
+            before = traced()[0]
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                seconds[stage] += clock() - start
+                calls[stage] += 1
+                allocated[stage] += traced()[0] - before
+
+        return profiled
+
+    def begin_episode(self) -> None:
+        self.start()
+        self._episode_alloc_start = dict(self.allocated)
+        super().begin_episode()
+
+    def end_episode(self, episode_id: int, steps: int) -> None:
+        current, peak = tracemalloc.get_traced_memory()
+        self.episode_allocations.append({
+            "episode_id": episode_id,
+            "steps": steps,
+            "stage_bytes": {
+                stage: self.allocated[stage] - self._episode_alloc_start.get(stage, 0)
+                for stage in STAGES
+            },
+            "traced_bytes": current,
+            "traced_peak_bytes": peak
+        })
+        super().end_episode(episode_id, steps)
+
+    def _episode_record(self, episode_id: int, steps: int, duration: float) -> Dict[str, Any]:
+        record = super()._episode_record(episode_id, steps, duration)
+        record["allocations"] = self.episode_allocations[-1]
+        return record
+
+    def report(self) -> Dict[str, Any]:
+        report = super().report()
+        report["allocations"] = {
+            "stage_bytes": dict(self.allocated),
+            "episodes": self.episode_allocations
+        }
+        return report
@@ -3,8 +3,9 @@ learner.py
 
 Deterministic policy update logic.
 This module:
-- Takes a completed episode trace
+- Takes a completed episode trace, or single transitions as they stream
 - Updates the policy deterministically
+- Optionally feeds every transition to a contradiction detector
 - Contains NO environment interaction
 """
 
@@ -17,6 +18,16 @@ class Policy(Protocol):
 
 
 class Learner:
+    # Class default so subclasses that skip __init__ still work
+    contradiction_detector = None
+
+    def __init__(self, contradiction_detector=None):
+        """
+        contradiction_detector: optional uncertainty.contradictions.ContradictionDetector;
+        it observes transitions and never affects the policy update
+        """
+        self.contradiction_detector = contradiction_detector
+
     def update_policy(self, policy: Policy, episode_trace: List[Dict[str, Any]]) -> None:
         """
         policy: mutable policy object
@@ -26,16 +37,27 @@ class Learner:
             return
 
         for transition in episode_trace:
-            # Validate transition structure
-            required_keys = ["state", "action", "reward"]
-            for key in required_keys:
-                if key not in transition:
-                    raise ValueError(f"Missing required key '{key}' in transition")
-            
-            state = transition["state"]
-            action = transition["action"]
-            reward = transition["reward"]
-
-            # Deterministic update rule:
-            # Accumulate reward per (state, action) pair
-            policy.update(state, action, reward)
+            self.update_transition(policy, transition)
+
+    def update_transition(self, policy: Policy, transition: Dict[str, Any]) -> None:
+        """
+        Apply a single transition. update_policy is a left fold of this
+        over the trace, so feeding the same transitions one at a time
+        yields the same policy.
+        """
+        # Validate transition structure
+        required_keys = ["state", "action", "reward"]
+        for key in required_keys:
+            if key not in transition:
+                raise ValueError(f"Missing required key '{key}' in transition")
+
+        state = transition["state"]
+        action = transition["action"]
+        reward = transition["reward"]
+
+        # Deterministic update rule:
+        # Accumulate reward per (state, action) pair
+        policy.update(state, action, reward)
+
+        if self.contradiction_detector is not None:
+            self.contradiction_detector.observe(state, action, reward)
@@ -6,40 +6,92 @@ This module:
 - Runs episodes
 - Updates policy deterministically
 - Logs everything needed for replay
+
+train() buffers each episode and updates once it ends.
+train_online() updates per transition and logs framed chunks,
+so memory is bounded by the chunk size, not the episode length.
+See docs/policy_updates.md for how the two modes relate.
+
+Episode ids continue across train() / train_online() calls on the same
+loop, so a run trained in phases logs and checkpoints each episode under
+a unique id.
+
+With a learning.convergence.ConvergenceMonitor both modes stop early
+once the policy has stopped changing; the last logged record then
+carries the decision under "early_stop".
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
+from learning.checkpoints import capture_checkpoint
 from learning.episode_runner import EpisodeRunner
 
 
 class LearningLoop:
-    def __init__(self, environment, policy, learner, exploration_strategy, replay_logger):
+    def __init__(self, environment, policy, learner, exploration_strategy, replay_logger,
+                 instrumentation=None, checkpoint_store=None, checkpoint_every=None,
+                 convergence_monitor=None):
         """
         environment: deterministic environment
         policy: policy object (mutable only by learner)
         learner: policy update logic
         exploration_strategy: exploration controller
         replay_logger: deterministic logger
+        instrumentation: optional per-stage timer; never affects outputs
+        checkpoint_store: optional learning.checkpoints.CheckpointStore
+        checkpoint_every: record a checkpoint before every K-th episode
+        convergence_monitor: optional learning.convergence.ConvergenceMonitor;
+        training stops once it reports convergence
         """
         self.environment = environment
         self.policy = policy
         self.learner = learner
         self.exploration = exploration_strategy
         self.replay_logger = replay_logger
+        self.instrumentation = instrumentation
+        self.checkpoint_store = checkpoint_store
+        self.checkpoint_every = checkpoint_every
+        self.convergence_monitor = convergence_monitor
+        self.stop_decision = None
+        # Id of the next episode, across every train call on this loop
+        self.next_episode_id = 0
+
+        if (checkpoint_store is None) != (checkpoint_every is None):
+            raise ValueError("checkpoint_store and checkpoint_every must be given together")
+        if checkpoint_every is not None and checkpoint_every <= 0:
+            raise ValueError(f"checkpoint_every must be positive, got {checkpoint_every}")
         
         # Create episode runner once for efficiency
         self.episode_runner = EpisodeRunner(
             environment=self.environment,
             policy=self.policy,
-            exploration_strategy=self.exploration
+            exploration_strategy=self.exploration,
+            instrumentation=self.instrumentation
         )
 
     def train(self, episodes: int, max_steps_per_episode: int) -> None:
-        for episode_id in range(episodes):
+        instrumentation = self.instrumentation
+        update_policy = self.learner.update_policy
+        snapshot = self.policy.snapshot
+        log = self.replay_logger.log
+
+        if instrumentation is not None:
+            update_policy = instrumentation.wrap("learner.update_policy", update_policy)
+            snapshot = instrumentation.wrap("policy.snapshot", snapshot)
+            log = instrumentation.wrap("replay_logger.log", log)
+
+        self._reset_convergence()
+        for _ in range(episodes):
+            episode_id = self.next_episode_id
+            self.next_episode_id += 1
+            self._maybe_checkpoint(episode_id, max_steps_per_episode, "batch")
+
+            if instrumentation is not None:
+                instrumentation.begin_episode()
+
             episode_result = self.episode_runner.run_episode(max_steps_per_episode)
 
             # Deterministic policy update
-            self.learner.update_policy(
+            update_policy(
                 policy=self.policy,
                 episode_trace=episode_result["trace"]
             )
@@ -47,8 +99,99 @@ class LearningLoop:
             # Log everything needed for replay
             log_record: Dict[str, Any] = {
                 "episode_id": episode_id,
-                "policy_snapshot": self.policy.snapshot(),
+                "policy_snapshot": snapshot(),
                 "episode_trace": episode_result["trace"]
             }
+            stop = self._check_convergence(episode_id, log_record)
+
+            log(log_record)
+
+            if instrumentation is not None:
+                instrumentation.end_episode(episode_id, episode_result["episode_length"])
+            if stop:
+                return
+
+    def train_online(self, episodes: int, max_steps_per_episode: int, chunk_size: int = 64) -> None:
+        """
+        Per-step learning. Each episode is logged as consecutive frames
+        {"episode_id", "frame", "final", "episode_trace"}; the final frame
+        also carries "policy_snapshot". Concatenating an episode's frames
+        gives the trace batch mode would log for the same transitions.
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        instrumentation = self.instrumentation
+        update_transition = self.learner.update_transition
+        snapshot = self.policy.snapshot
+        log = self.replay_logger.log
+
+        if instrumentation is not None:
+            update_transition = instrumentation.wrap("learner.update_policy", update_transition)
+            snapshot = instrumentation.wrap("policy.snapshot", snapshot)
+            log = instrumentation.wrap("replay_logger.log", log)
+
+        self._reset_convergence()
+        for _ in range(episodes):
+            episode_id = self.next_episode_id
+            self.next_episode_id += 1
+            self._maybe_checkpoint(episode_id, max_steps_per_episode, "online")
+
+            if instrumentation is not None:
+                instrumentation.begin_episode()
+
+            chunk: List[Dict[str, Any]] = []
+            frame = 0
+            steps = 0
+
+            for transition in self.episode_runner.iter_transitions(max_steps_per_episode):
+                update_transition(self.policy, transition)
+                chunk.append(transition)
+                steps += 1
+
+                if len(chunk) == chunk_size:
+                    log({
+                        "episode_id": episode_id,
+                        "frame": frame,
+                        "final": False,
+                        "episode_trace": chunk
+                    })
+                    chunk = []
+                    frame += 1
+
+            final_record = {
+                "episode_id": episode_id,
+                "frame": frame,
+                "final": True,
+                "policy_snapshot": snapshot(),
+                "episode_trace": chunk
+            }
+            stop = self._check_convergence(episode_id, final_record)
+
+            log(final_record)
+
+            if instrumentation is not None:
+                instrumentation.end_episode(episode_id, steps)
+            if stop:
+                return
 
-            self.replay_logger.log(log_record)
+    def _reset_convergence(self) -> None:
+        self.stop_decision = None
+        if self.convergence_monitor is not None:
+            self.convergence_monitor.reset()
+
+    def _check_convergence(self, episode_id: int, record: Dict[str, Any]) -> bool:
+        """Feed the episode's snapshot to the monitor; mark the record on a stop."""
+        monitor = self.convergence_monitor
+        if monitor is None or not monitor.observe(record["policy_snapshot"]):
+            return False
+        self.stop_decision = monitor.decision(episode_id)
+        record["early_stop"] = self.stop_decision
+        return True
+
+    def _maybe_checkpoint(self, episode_id: int, max_steps_per_episode: int, mode: str) -> None:
+        if self.checkpoint_every is None or episode_id % self.checkpoint_every != 0:
+            return
+        self.checkpoint_store.save(
+            capture_checkpoint(self, episode_id, max_steps_per_episode, mode)
+        )
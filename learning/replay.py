@@ -3,8 +3,85 @@ replay.py
 
 Deterministic replay engine.
 Replays logged episodes and verifies identical behavior.
+
+Logs reloaded from JSON hold states as dicts. When the environment
+produces core.state.State records, logged states are turned back into
+State before the policy sees them, and actions are compared as Action
+members: a typed run logs exploration actions by name, policy actions
+as Action, and Action codes once reloaded.
 """
 
+from typing import Any, Dict, Iterable, List, Optional
+
+from core.action import ACTION_LOOKUP
+from core.state import State
+
+TRANSITION_FIELDS = ("state", "action", "reward", "next_state")
+
+
+def join_frames(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Reassemble framed online-mode records into one log per episode
+    ({"episode_id", "policy_snapshot", "episode_trace"}). Unframed
+    batch-mode records pass through unchanged.
+    """
+    episodes: List[Dict[str, Any]] = []
+    pending: List[Dict[str, Any]] = []
+
+    for record in records:
+        if "frame" not in record:
+            episodes.append(record)
+            continue
+
+        if record["frame"] != len(pending):
+            raise ValueError(
+                f"Frame {record['frame']} of episode {record['episode_id']} out of order"
+            )
+        pending.append(record)
+
+        if record["final"]:
+            episodes.append({
+                "episode_id": record["episode_id"],
+                "policy_snapshot": record["policy_snapshot"],
+                "episode_trace": [t for frame in pending for t in frame["episode_trace"]]
+            })
+            pending = []
+
+    if pending:
+        raise ValueError(f"Episode {pending[0]['episode_id']} has no final frame")
+    return episodes
+
+
+def first_difference(expected: List[Dict[str, Any]], actual: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    First step where two traces disagree on any transition field,
+    with both actions at that step; None when they are identical.
+    A length mismatch is reported at the first missing step.
+    """
+    for step, (logged, replayed) in enumerate(zip(expected, actual)):
+        for field in TRANSITION_FIELDS:
+            if logged[field] != replayed[field]:
+                return {
+                    "step": step,
+                    "field": field,
+                    "expected": logged[field],
+                    "actual": replayed[field],
+                    "expected_action": logged["action"],
+                    "actual_action": replayed["action"]
+                }
+    if len(expected) != len(actual):
+        step = min(len(expected), len(actual))
+        return {
+            "step": step,
+            "field": "length",
+            "expected": len(expected),
+            "actual": len(actual),
+            "expected_action": expected[step]["action"] if step < len(expected) else None,
+            "actual_action": actual[step]["action"] if step < len(actual) else None
+        }
+    return None
+
+
 class ReplayDivergenceError(Exception):
     """Raised when replay produces different results than original run."""
     pass
@@ -15,20 +92,46 @@ class ReplayEngine:
         self.policy = policy
 
     def replay(self, replay_log: dict) -> None:
-        self.environment.reset()
+        divergence = self.find_divergence(replay_log, exploit_only=False)
+
+        if divergence is not None:
+            error_msg = (
+                f"Replay divergence at step {divergence['step']}: "
+                f"expected action '{divergence['expected_action']}', "
+                f"got '{divergence['actual_action']}' for state {divergence['state']}"
+            )
+            raise ReplayDivergenceError(error_msg)
+
+    def find_divergence(self, replay_log: dict, exploit_only: bool = True) -> Optional[Dict[str, Any]]:
+        """
+        First step whose logged action the policy does not reproduce,
+        or None. With exploit_only, steps logged with mode EXPLORE are
+        skipped: their action came from the exploration strategy.
+        """
+        typed = self.environment.reset().__class__ is State
 
         for i, transition in enumerate(replay_log["episode_trace"]):
             expected_action = transition["action"]
             state = transition["state"]
+            if typed:
+                expected_action = ACTION_LOOKUP[expected_action]
+                if state.__class__ is dict:
+                    state = State.from_dict(state)
+
+            if exploit_only and transition.get("mode") == "EXPLORE":
+                self.environment.step(expected_action)
+                continue
 
             actual_action = self.policy.select_action(state)
 
             if actual_action != expected_action:
-                error_msg = (
-                    f"Replay divergence at step {i}: "
-                    f"expected action '{expected_action}', "
-                    f"got '{actual_action}' for state {state}"
-                )
-                raise ReplayDivergenceError(error_msg)
+                return {
+                    "step": i,
+                    "state": state,
+                    "expected_action": expected_action,
+                    "actual_action": actual_action
+                }
 
             self.environment.step(actual_action)
+
+        return None
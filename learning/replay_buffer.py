@@ -0,0 +1,292 @@
+"""
+replay_buffer.py
+
+Deterministic experience replay.
+This module:
+- Stores transitions in preallocated NumPy ring arrays
+- Samples uniformly or by priority through a sum-tree
+- Derives every draw from an explicit, logged seed stream
+- Lets a Learner reuse stored transitions several times per episode
+
+Draw i uses SeedSequence(seed, spawn_key=(i,)), so any draw can be
+reproduced from the base seed and its index alone; only the most recent
+draws are kept in seed_log. Requires numpy.
+"""
+
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from core.contracts import ACTION_SET
+from learning.learner import Learner, Policy
+from utils.optional import require_numpy
+
+np = require_numpy("learning.replay_buffer")
+
+ACTION_CODES = {action: code for code, action in enumerate(ACTION_SET)}
+
+
+class StateInterner:
+    """
+    Maps state dicts to dense integer ids and back.
+    Ids are reference counted: each intern() takes a reference and
+    release() drops one. A state with no references left is forgotten
+    and its id reused, so memory follows what the buffer still holds.
+    """
+
+    def __init__(self):
+        self.ids: Dict[Tuple, int] = {}
+        self.states: List[Optional[Dict[str, Any]]] = []
+        self.keys: List[Optional[Tuple]] = []
+        self.counts: List[int] = []
+        self.free: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def intern(self, state: Dict[str, Any]) -> int:
+        key = tuple(sorted(state.items()))
+        state_id = self.ids.get(key)
+        if state_id is not None:
+            self.counts[state_id] += 1
+            return state_id
+
+        if self.free:
+            state_id = self.free.pop()
+            self.states[state_id] = dict(state)
+            self.keys[state_id] = key
+            self.counts[state_id] = 1
+        else:
+            state_id = len(self.states)
+            self.states.append(dict(state))
+            self.keys.append(key)
+            self.counts.append(1)
+        self.ids[key] = state_id
+        return state_id
+
+    def release(self, state_id: int) -> None:
+        if self.counts[state_id] <= 0:
+            raise ValueError(f"State id {state_id} is not interned")
+        self.counts[state_id] -= 1
+        if self.counts[state_id] == 0:
+            del self.ids[self.keys[state_id]]
+            self.states[state_id] = None
+            self.keys[state_id] = None
+            self.free.append(state_id)
+
+    def lookup(self, state_id: int) -> Dict[str, Any]:
+        state = self.states[state_id]
+        if state is None:
+            raise KeyError(f"State id {state_id} was released")
+        return state
+
+
+class SumTree:
+    """
+    Binary sum-tree over a power-of-two number of leaves.
+    Leaf updates and prefix-sum searches are O(log n) and vectorized
+    over batches: one NumPy operation per tree level.
+    """
+
+    def __init__(self, capacity: int):
+        leaves = 1
+        while leaves < capacity:
+            leaves *= 2
+        self.leaves = leaves
+        self.depth = leaves.bit_length() - 1
+        self.tree = np.zeros(2 * leaves, dtype=np.float64)
+
+    @property
+    def total(self) -> float:
+        return float(self.tree[1])
+
+    def update(self, indices, values) -> None:
+        nodes = np.asarray(indices, dtype=np.int64) + self.leaves
+        self.tree[nodes] = values
+        for _ in range(self.depth):
+            nodes = np.unique(nodes // 2)
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def find(self, targets):
+        """Leaf index whose cumulative range contains each target."""
+        targets = np.array(targets, dtype=np.float64)
+        nodes = np.ones(len(targets), dtype=np.int64)
+        for _ in range(self.depth):
+            left = 2 * nodes
+            left_sum = self.tree[left]
+            go_right = targets >= left_sum
+            targets = np.where(go_right, targets - left_sum, targets)
+            nodes = np.where(go_right, left + 1, left)
+        return nodes - self.leaves
+
+    def get(self, indices):
+        return self.tree[np.asarray(indices, dtype=np.int64) + self.leaves]
+
+
+class ReplayBuffer:
+    def __init__(self, capacity: int, seed: int, alpha: float = 0.6, beta: float = 0.4,
+                 epsilon: float = 1e-6, seed_log_size: int = 1024):
+        """
+        capacity: ring size; oldest transitions are overwritten
+        seed: base of the seed stream for all draws
+        alpha: priority exponent (0 = uniform)
+        beta: importance-weight exponent
+        seed_log_size: most recent draws kept in seed_log
+        """
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        if seed_log_size < 0:
+            raise ValueError(f"seed_log_size must be non-negative, got {seed_log_size}")
+
+        self.capacity = capacity
+        self.seed = seed
+        self.alpha = alpha
+        self.beta = beta
+        self.epsilon = epsilon
+
+        self.state_id = np.zeros(capacity, dtype=np.int64)
+        self.action = np.zeros(capacity, dtype=np.int8)
+        self.reward = np.zeros(capacity, dtype=np.float64)
+        self.next_state_id = np.zeros(capacity, dtype=np.int64)
+        self.done = np.zeros(capacity, dtype=np.bool_)
+
+        self.tree = SumTree(capacity)
+        self.max_priority = 1.0
+        self.added = 0
+        self.draws = 0
+        self.seed_log: Deque[Dict[str, Any]] = deque(maxlen=seed_log_size)
+
+    def __len__(self) -> int:
+        return min(self.added, self.capacity)
+
+    def add(self, state_id: int, action: str, reward: float, next_state_id: int, done: bool) -> int:
+        """Store one transition with the current max priority; return its slot."""
+        if action not in ACTION_CODES:
+            raise ValueError(f"Invalid action: {action}")
+
+        slot = self.added % self.capacity
+        self.state_id[slot] = state_id
+        self.action[slot] = ACTION_CODES[action]
+        self.reward[slot] = reward
+        self.next_state_id[slot] = next_state_id
+        self.done[slot] = done
+        self.tree.update([slot], self.max_priority ** self.alpha)
+        self.added += 1
+        return slot
+
+    def add_trace(self, episode_trace: List[Dict[str, Any]], interner: StateInterner) -> None:
+        """
+        Store a trace with states interned. A buffer filled this way holds
+        one interner reference per stored id and releases it on overwrite.
+        """
+        last = len(episode_trace) - 1
+        for i, transition in enumerate(episode_trace):
+            state_id = interner.intern(transition["state"])
+            next_state_id = interner.intern(transition["next_state"])
+            if self.added >= self.capacity:
+                slot = self.added % self.capacity
+                interner.release(int(self.state_id[slot]))
+                interner.release(int(self.next_state_id[slot]))
+            self.add(state_id, transition["action"], transition["reward"], next_state_id, i == last)
+
+    def _generator(self):
+        draw = self.draws
+        self.draws += 1
+        self.seed_log.append({"draw": draw, "seed": self.seed, "spawn_key": [draw]})
+        return np.random.Generator(np.random.PCG64(np.random.SeedSequence(self.seed, spawn_key=(draw,))))
+
+    def sample_uniform(self, batch_size: int) -> Dict[str, Any]:
+        if len(self) == 0:
+            raise ValueError("Cannot sample from an empty replay buffer")
+        rng = self._generator()
+        indices = rng.integers(0, len(self), size=batch_size)
+        return self._gather(indices, np.ones(batch_size, dtype=np.float64))
+
+    def sample_prioritized(self, batch_size: int) -> Dict[str, Any]:
+        """
+        Stratified proportional sampling: one draw per equal slice of
+        the total priority mass, with normalized importance weights.
+        """
+        if len(self) == 0:
+            raise ValueError("Cannot sample from an empty replay buffer")
+        rng = self._generator()
+        total = self.tree.total
+        segment = total / batch_size
+        targets = (np.arange(batch_size) + rng.random(batch_size)) * segment
+        indices = np.minimum(self.tree.find(np.minimum(targets, np.nextafter(total, 0))), len(self) - 1)
+
+        probabilities = self.tree.get(indices) / total
+        weights = (len(self) * probabilities) ** (-self.beta)
+        weights /= weights.max()
+        return self._gather(indices, weights)
+
+    def update_priorities(self, indices, priorities) -> None:
+        priorities = np.abs(np.asarray(priorities, dtype=np.float64)) + self.epsilon
+        self.max_priority = max(self.max_priority, float(priorities.max()))
+        self.tree.update(indices, priorities ** self.alpha)
+
+    def _gather(self, indices, weights) -> Dict[str, Any]:
+        return {
+            "indices": indices,
+            "state_id": self.state_id[indices],
+            "action": self.action[indices],
+            "reward": self.reward[indices],
+            "next_state_id": self.next_state_id[indices],
+            "done": self.done[indices],
+            "weights": weights
+        }
+
+
+def reward_errors(policy: Policy, batch: Dict[str, Any]):
+    """
+    Update size of each transition under the accumulate-reward rule,
+    which adds the reward with no bootstrap term: the reward itself.
+    """
+    return batch["reward"]
+
+
+class ReplayLearner(Learner):
+    """
+    Applies each episode as usual, then replays sampled stored
+    transitions through the same update rule. After each replayed
+    batch the sampled transitions are re-prioritized from error_fn.
+    """
+
+    def __init__(self, buffer: ReplayBuffer, batch_size: int = 32, replay_batches: int = 1,
+                 prioritized: bool = False, error_fn: Callable[[Policy, Dict[str, Any]], Any] = reward_errors,
+                 min_priority: float = 0.1):
+        """
+        error_fn: (policy, batch) -> per-transition error whose magnitude
+                  becomes the priority; learners with a bootstrapped rule
+                  pass their TD error here
+        min_priority: floor on written-back priorities, so transitions
+                      with no error (zero rewards, under the default)
+                      keep a share of prioritized draws instead of
+                      vanishing from replay
+        """
+        if min_priority < 0:
+            raise ValueError(f"min_priority must be non-negative, got {min_priority}")
+
+        self.buffer = buffer
+        self.interner = StateInterner()
+        self.batch_size = batch_size
+        self.replay_batches = replay_batches
+        self.prioritized = prioritized
+        self.error_fn = error_fn
+        self.min_priority = min_priority
+
+    def update_policy(self, policy: Policy, episode_trace: List[Dict[str, Any]]) -> None:
+        super().update_policy(policy, episode_trace)
+        if not episode_trace:
+            return
+
+        self.buffer.add_trace(episode_trace, self.interner)
+
+        sample = self.buffer.sample_prioritized if self.prioritized else self.buffer.sample_uniform
+        for _ in range(self.replay_batches):
+            batch = sample(self.batch_size)
+            for state_id, action, reward in zip(
+                batch["state_id"].tolist(), batch["action"].tolist(), batch["reward"].tolist()
+            ):
+                policy.update(self.interner.lookup(state_id), ACTION_SET[action], reward)
+            errors = np.abs(np.asarray(self.error_fn(policy, batch), dtype=np.float64))
+            self.buffer.update_priorities(batch["indices"], np.maximum(errors, self.min_priority))
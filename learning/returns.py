@@ -0,0 +1,173 @@
+"""
+returns.py
+
+Vectorized return computation for credit assignment.
+This module:
+- Computes discounted n-step and lambda-returns with NumPy
+- Works on one trace or a padded batch of traces at once
+- Uses reverse cumulative sums and sliding windows, no per-step loop
+- Provides a Learner variant applying returns in one batched update
+
+Episodes end at the last recorded transition; nothing is bootstrapped
+past it. Requires numpy.
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+from learning.learner import Learner, Policy
+from utils.optional import require_numpy
+
+np = require_numpy("learning.returns")
+
+# Smallest discount power kept within one block before rescaling
+_MIN_SCALE = 1e-200
+
+
+def pad_traces(traces: List[List[Dict[str, Any]]]) -> Tuple[Any, Any]:
+    """Rewards as a [batch, max_length] array plus a validity mask."""
+    length = max((len(trace) for trace in traces), default=0)
+    rewards = np.zeros((len(traces), length), dtype=np.float64)
+    mask = np.zeros((len(traces), length), dtype=np.bool_)
+    for row, trace in enumerate(traces):
+        rewards[row, :len(trace)] = [transition["reward"] for transition in trace]
+        mask[row, :len(trace)] = True
+    return rewards, mask
+
+
+def discounted_reverse_cumsum(values, factor: float):
+    """
+    y[:, t] = sum_k factor**k * values[:, t + k] along the last axis.
+
+    Computed as a reverse cumsum of values * factor**t, divided back
+    by factor**t. Long axes are split into blocks short enough that
+    factor**t never underflows; each block is carried into the one
+    before it, so the loop runs once per block, not per step.
+    """
+    values = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    length = values.shape[-1]
+    if length == 0 or factor == 0.0:
+        return values.copy()
+    if not (0.0 < factor <= 1.0):
+        raise ValueError(f"factor must be in (0.0, 1.0], got {factor}")
+    if factor == 1.0:
+        return np.flip(np.cumsum(np.flip(values, -1), axis=-1), -1)
+
+    block = max(1, min(length, int(math.log(_MIN_SCALE) / math.log(factor))))
+    result = np.empty_like(values)
+    carry = np.zeros(values.shape[:-1], dtype=np.float64)
+
+    for end in range(length, 0, -block):
+        start = max(0, end - block)
+        powers = factor ** np.arange(end - start, dtype=np.float64)
+        scaled = values[..., start:end] * powers
+        segment = np.flip(np.cumsum(np.flip(scaled, -1), axis=-1), -1) / powers
+        # Returns beyond this block, discounted back to each position
+        segment += carry[..., None] * factor ** np.arange(end - start, 0, -1, dtype=np.float64)
+        result[..., start:end] = segment
+        carry = segment[..., 0]
+
+    return result
+
+
+def n_step_returns(rewards, gamma: float, n: int, values=None, mask=None):
+    """
+    G[t] = sum_{k<n} gamma**k * r[t+k] (+ gamma**n * values[t+n] when
+    t+n is still inside the episode). rewards/values: [batch, T].
+    """
+    if n <= 0:
+        raise ValueError(f"n must be positive, got {n}")
+
+    rewards = np.atleast_2d(np.asarray(rewards, dtype=np.float64))
+    batch, length = rewards.shape
+    if mask is None:
+        mask = np.ones_like(rewards, dtype=np.bool_)
+    rewards = np.where(mask, rewards, 0.0)
+
+    padded = np.concatenate([rewards, np.zeros((batch, n), dtype=np.float64)], axis=1)
+    windows = np.lib.stride_tricks.sliding_window_view(padded, n, axis=1)[:, :length]
+    returns = windows @ (gamma ** np.arange(n, dtype=np.float64))
+
+    if values is not None:
+        values = np.where(mask, np.asarray(values, dtype=np.float64), 0.0)
+        shifted = np.concatenate([values, np.zeros((batch, n), dtype=np.float64)], axis=1)[:, n:n + length]
+        shifted_mask = np.concatenate([mask, np.zeros((batch, n), dtype=np.bool_)], axis=1)[:, n:n + length]
+        returns = returns + (gamma ** n) * np.where(shifted_mask, shifted, 0.0)
+
+    return np.where(mask, returns, 0.0)
+
+
+def lambda_returns(rewards, gamma: float, lam: float, values=None, mask=None):
+    """
+    G[t] = r[t] + gamma * ((1 - lam) * values[t+1] + lam * G[t+1]),
+    solved in closed form as a discounted reverse cumsum with factor
+    gamma * lam. Without values this is the discounted Monte-Carlo
+    return for lam = 1.
+    """
+    if not (0.0 <= lam <= 1.0):
+        raise ValueError(f"lam must be in [0.0, 1.0], got {lam}")
+
+    rewards = np.atleast_2d(np.asarray(rewards, dtype=np.float64))
+    batch = rewards.shape[0]
+    if mask is None:
+        mask = np.ones_like(rewards, dtype=np.bool_)
+    targets = np.where(mask, rewards, 0.0)
+
+    if values is not None:
+        values = np.where(mask, np.asarray(values, dtype=np.float64), 0.0)
+        next_values = np.concatenate([values[:, 1:], np.zeros((batch, 1), dtype=np.float64)], axis=1)
+        targets = targets + gamma * (1.0 - lam) * next_values
+
+    return np.where(mask, discounted_reverse_cumsum(targets, gamma * lam), 0.0)
+
+
+class ReturnLearner(Learner):
+    """
+    Replaces the immediate reward of each transition with its n-step
+    or lambda-return, then applies the whole episode (or batch of
+    episodes) in one policy.update_batch call when available.
+    """
+
+    def __init__(self, gamma: float = 0.9, n: Optional[int] = None, lam: float = 1.0):
+        """
+        n: use n-step returns when set, otherwise lambda-returns
+        """
+        if not (0.0 <= gamma <= 1.0):
+            raise ValueError(f"gamma must be in [0.0, 1.0], got {gamma}")
+        self.gamma = gamma
+        self.n = n
+        self.lam = lam
+
+    def compute_returns(self, traces: List[List[Dict[str, Any]]]):
+        rewards, mask = pad_traces(traces)
+        if self.n is not None:
+            return n_step_returns(rewards, self.gamma, self.n, mask=mask), mask
+        return lambda_returns(rewards, self.gamma, self.lam, mask=mask), mask
+
+    def update_policy(self, policy: Policy, episode_trace: List[Dict[str, Any]]) -> None:
+        self.update_policy_batch(policy, [episode_trace])
+
+    def update_policy_batch(self, policy: Policy, traces: List[List[Dict[str, Any]]]) -> None:
+        traces = [trace for trace in traces if trace]
+        if not traces:
+            return
+
+        for trace in traces:
+            for transition in trace:
+                for key in ("state", "action", "reward"):
+                    if key not in transition:
+                        raise ValueError(f"Missing required key '{key}' in transition")
+
+        returns, mask = self.compute_returns(traces)
+        states = [transition["state"] for trace in traces for transition in trace]
+        actions = [transition["action"] for trace in traces for transition in trace]
+        # Row-major boolean indexing keeps trace order
+        targets = returns[mask].tolist()
+
+        update_batch = getattr(policy, "update_batch", None)
+        if update_batch is not None:
+            update_batch(states, actions, targets)
+            return
+
+        for state, action, target in zip(states, actions, targets):
+            policy.update(state, action, target)
@@ -0,0 +1,194 @@
+"""
+state_encoding.py
+
+Bounded state encoding for tabular learning.
+This module:
+- Bins continuous state fields (uniform or quantile edges)
+- Maps a state to one integer id, or to a small set of tile-coding ids
+- Keeps table size bounded by bin counts, not by run length
+
+Fields without a binner are ignored by the encoding (current_step
+is unbinned by default). Encoding costs O(fields * tilings) per state.
+"""
+
+from bisect import bisect_right
+from typing import Any, Dict, List, Sequence, Tuple
+
+from core.contracts import ACTION_SET, REWARD_RANGE
+
+
+class UniformBins:
+    def __init__(self, low: float, high: float, bins: int):
+        if bins <= 0:
+            raise ValueError(f"bins must be positive, got {bins}")
+        if not high > low:
+            raise ValueError(f"high must exceed low, got [{low}, {high}]")
+        self.low = low
+        self.high = high
+        self.bins = bins
+        self.width = (high - low) / bins
+
+    def index(self, value: float, offset: float = 0.0) -> int:
+        """Bin of value shifted by offset (a fraction of one bin width)."""
+        position = int((value - self.low) / self.width + offset)
+        return min(max(position, 0), self.bins - 1 if offset == 0.0 else self.bins)
+
+    def tiles(self) -> int:
+        return self.bins
+
+
+class QuantileBins:
+    """Bins with precomputed edges; values on an edge go to the upper bin."""
+
+    def __init__(self, edges: Sequence[float]):
+        if list(edges) != sorted(edges):
+            raise ValueError("Quantile edges must be sorted")
+        self.edges = list(edges)
+        self.bins = len(self.edges) + 1
+
+    @classmethod
+    def fit(cls, samples: Sequence[float], bins: int) -> "QuantileBins":
+        """Edges at the 1/bins, 2/bins, ... empirical quantiles of samples."""
+        if bins <= 0:
+            raise ValueError(f"bins must be positive, got {bins}")
+        ordered = sorted(samples)
+        if not ordered:
+            raise ValueError("Cannot fit quantile bins without samples")
+        edges = [ordered[min(len(ordered) - 1, (len(ordered) * k) // bins)] for k in range(1, bins)]
+        # Repeated edges would create empty bins
+        return cls(sorted(set(edges)))
+
+    def index(self, value: float, offset: float = 0.0) -> int:
+        # Quantile bins are not shifted between tilings
+        return bisect_right(self.edges, value)
+
+    def tiles(self) -> int:
+        return self.bins
+
+
+class CategoricalBins:
+    """Exact mapping for enumerable fields such as previous_action."""
+
+    def __init__(self, categories: Sequence[Any] = tuple(ACTION_SET)):
+        self.codes = {category: code for code, category in enumerate(categories)}
+        self.bins = len(self.codes)
+
+    def index(self, value: Any, offset: float = 0.0) -> int:
+        if value not in self.codes:
+            raise ValueError(f"Unknown category: {value}")
+        return self.codes[value]
+
+    def tiles(self) -> int:
+        return self.bins
+
+
+def default_binners(signal_range: Tuple[float, float] = (0.0, 1.0), bins: int = 8) -> Dict[str, Any]:
+    """observed_signal and accumulated_reward binned uniformly; previous_action exact."""
+    return {
+        "observed_signal": UniformBins(signal_range[0], signal_range[1], bins),
+        "previous_action": CategoricalBins(),
+        "accumulated_reward": UniformBins(REWARD_RANGE[0], REWARD_RANGE[1], bins),
+    }
+
+
+class StateEncoder:
+    """Single integer id per state (mixed-radix over field bins)."""
+
+    def __init__(self, binners: Dict[str, Any]):
+        if not binners:
+            raise ValueError("StateEncoder needs at least one field")
+        self.fields: List[Tuple[str, Any]] = list(binners.items())
+        self.size = 1
+        for _, binner in self.fields:
+            self.size *= binner.tiles()
+
+    def encode(self, state: Dict[str, Any]) -> int:
+        code = 0
+        for field, binner in self.fields:
+            code = code * binner.tiles() + binner.index(state[field])
+        return code
+
+    def features(self, state: Dict[str, Any]) -> Tuple[int, ...]:
+        return (self.encode(state),)
+
+
+class TileCoder:
+    """
+    Multi-tiling coder. Tiling k shifts every uniform field by k/tilings
+    of a bin, so nearby values share some but not all features.
+    Returns one feature id per tiling, each in its own id range.
+    """
+
+    def __init__(self, binners: Dict[str, Any], tilings: int = 4):
+        if tilings <= 0:
+            raise ValueError(f"tilings must be positive, got {tilings}")
+        if not binners:
+            raise ValueError("TileCoder needs at least one field")
+        self.fields: List[Tuple[str, Any]] = list(binners.items())
+        self.tilings = tilings
+        # Shifted uniform tilings need one extra tile per field
+        self._radix = [
+            binner.tiles() + (1 if isinstance(binner, UniformBins) and tilings > 1 else 0)
+            for _, binner in self.fields
+        ]
+        self.tiles_per_tiling = 1
+        for radix in self._radix:
+            self.tiles_per_tiling *= radix
+        self.size = self.tiles_per_tiling * tilings
+
+    def features(self, state: Dict[str, Any]) -> Tuple[int, ...]:
+        values = [state[field] for field, _ in self.fields]
+        features = []
+        for tiling in range(self.tilings):
+            offset = tiling / self.tilings
+            code = 0
+            for (field, binner), radix, value in zip(self.fields, self._radix, values):
+                code = code * radix + binner.index(value, offset)
+            features.append(tiling * self.tiles_per_tiling + code)
+        return tuple(features)
+
+    def encode(self, state: Dict[str, Any]) -> Tuple[int, ...]:
+        return self.features(state)
+
+
+class EncodedTablePolicy:
+    """
+    Reward-accumulating policy over encoded features.
+    An action's value is the sum of its totals across the state's
+    features; the table never holds more than size * actions entries.
+    """
+
+    def __init__(self, encoder):
+        self.encoder = encoder
+        self.values: Dict[int, Dict[str, float]] = {}
+        self.visits: Dict[int, int] = {}
+
+    def select_action(self, state: Dict[str, Any]) -> str:
+        features = self.encoder.features(state)
+        totals = {action: 0.0 for action in ACTION_SET}
+        for feature in features:
+            for action, value in self.values.get(feature, {}).items():
+                totals[action] += value
+        return max(ACTION_SET, key=lambda action: totals[action])
+
+    def update(self, state: Dict[str, Any], action: str, reward: float) -> None:
+        for feature in self.encoder.features(state):
+            values = self.values.setdefault(feature, {})
+            values[action] = values.get(action, 0.0) + reward
+            self.visits[feature] = self.visits.get(feature, 0) + 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "values": {feature: dict(values) for feature, values in self.values.items()},
+            "visits": dict(self.visits)
+        }
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        # Feature ids come back as strings after a JSON round trip
+        self.values = {int(feature): dict(values) for feature, values in snapshot["values"].items()}
+        self.visits = {int(feature): count for feature, count in snapshot["visits"].items()}
+
+    def get_confidence(self, state: Dict[str, Any]) -> float:
+        features = self.encoder.features(state)
+        visits = min(self.visits.get(feature, 0) for feature in features)
+        return min(visits / 10.0, 1.0)
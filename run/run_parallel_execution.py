@@ -0,0 +1,109 @@
+"""
+run_parallel_execution.py
+
+Runs policy execution without learning on many environments at once.
+One thread per environment (up to workers) drives its own Executor;
+all of them share one read-only policy and one DecisionEngine (pass one
+to apply per-decision deadlines; it must be safe to share). Suited
+to environments whose step() waits on something external (a simulator
+subprocess, a socket), where a single thread would leave the CPU idle.
+
+Each environment has its own step cap. The report lists every
+environment in input order, with aggregate steps/s.
+
+Run with:
+  python run/run_parallel_execution.py --environments 16 --latency-ms 2
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import LatencyEnvironment, SyntheticEnvironment, SyntheticPolicy
+from execution.decision import DecisionEngine
+from execution.executor import Executor
+
+
+def run_environment(executor: Executor, max_steps: int) -> Dict[str, Any]:
+    """Drive one environment until it is done or max_steps is reached."""
+    state = executor.environment.reset()
+    steps = 0
+    total_reward = 0.0
+    done = False
+
+    while steps < max_steps:
+        result = executor.run_step(state)
+        state = result["next_state"]
+        total_reward += result["reward"]
+        steps += 1
+        done = result["done"]
+        if done:
+            break
+
+    return {"steps": steps, "total_reward": total_reward, "done": done, "capped": not done and steps >= max_steps}
+
+
+def run(environments: Sequence[Any], policy, max_steps: Union[int, Sequence[int]] = 1000,
+        workers: Optional[int] = None, decision_engine: Optional[DecisionEngine] = None) -> Dict[str, Any]:
+    """
+    environments: environments to drive; the policy is only read
+    max_steps: one cap for all, or one per environment
+    workers: concurrent environments (default: all of them)
+    decision_engine: shared by every environment (default: a plain DecisionEngine)
+    """
+    caps: List[int] = [max_steps] * len(environments) if isinstance(max_steps, int) else list(max_steps)
+    if len(caps) != len(environments):
+        raise ValueError(f"Expected {len(environments)} step caps, got {len(caps)}")
+    if any(cap <= 0 for cap in caps):
+        raise ValueError("Step caps must be positive")
+
+    if decision_engine is None:
+        decision_engine = DecisionEngine()
+    executors = [Executor(environment, decision_engine, policy) for environment in environments]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers or max(1, len(environments))) as pool:
+        results = list(pool.map(run_environment, executors, caps))
+    elapsed = time.perf_counter() - start
+
+    for index, result in enumerate(results):
+        result["environment"] = index
+        if result["capped"]:
+            print(f"Warning: environment {index} stopped after {caps[index]} steps to prevent infinite loop")
+
+    steps = sum(result["steps"] for result in results)
+    return {
+        "environments": results,
+        "steps": steps,
+        "seconds": elapsed,
+        "steps_per_second": steps / elapsed if elapsed > 0 else 0.0
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Execute a policy on many synthetic environments at once")
+    parser.add_argument("--environments", type=int, default=8)
+    parser.add_argument("--n-states", type=int, default=16)
+    parser.add_argument("--episode-length", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="simulated wait per step")
+    parser.add_argument("--max-steps", type=int, default=1000, help="step cap per environment")
+    parser.add_argument("--workers", type=int, help="concurrent environments (default: all)")
+    args = parser.parse_args(argv)
+
+    environments = [
+        LatencyEnvironment(SyntheticEnvironment(args.n_states, args.episode_length), args.latency_ms / 1000.0)
+        for _ in range(args.environments)
+    ]
+    report = run(environments, SyntheticPolicy(), args.max_steps, args.workers)
+    print(f"{report['steps']:,} steps across {args.environments} environments in {report['seconds']:.2f}s "
+          f"({report['steps_per_second']:,.0f} steps/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
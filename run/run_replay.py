@@ -0,0 +1,131 @@
+"""
+run_replay.py
+
+Replays an arbitrary episode range from a JSON-lines replay log,
+resuming from the nearest stored checkpoint instead of episode 0,
+or bisects the log for the first episode the current build does not
+reproduce.
+
+Run with:
+  python run/run_replay.py --log log.jsonl --checkpoints ckpt.jsonl \\
+      --environment benchmarks.synthetic:SyntheticEnvironment \\
+      --policy benchmarks.synthetic:SyntheticPolicy --start 500 --end 510
+
+  python run/run_replay.py --bisect --log log.jsonl [--checkpoints ckpt.jsonl] \\
+      --environment benchmarks.synthetic:SyntheticEnvironment \\
+      --policy benchmarks.synthetic:SyntheticPolicy
+"""
+
+import argparse
+import importlib
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from learning.checkpoints import CheckpointStore, replay_range
+from learning.divergence import bisect_divergence
+from learning.exploration import ExplorationStrategy
+from learning.learning_loop import LearningLoop
+from learning.replay import ReplayDivergenceError
+from utils.logger import DeterministicLogger, load_jsonl
+from utils.state_store import StateStore, expand_records
+
+
+def load_factory(spec: str):
+    """Resolve 'package.module:attribute' to a callable."""
+    module_name, _, attribute = spec.partition(":")
+    if not attribute:
+        raise ValueError(f"Expected 'module:callable', got '{spec}'")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def load_stores(log_path: str, checkpoint_path=None, states_path=None):
+    """Replay records and checkpoints, with state ids resolved when states_path is given."""
+    records = load_jsonl(log_path)
+    state_store = StateStore(states_path) if states_path is not None else None
+    if state_store is not None:
+        records = expand_records(records, state_store)
+    checkpoints = CheckpointStore(checkpoint_path, state_store) if checkpoint_path is not None else None
+    return records, checkpoints
+
+
+def run(environment, policy, learner, exploration, log_path: str, checkpoint_path: str,
+        start: int, end: int, max_steps_per_episode=None, states_path=None):
+    loop = LearningLoop(environment, policy, learner, exploration, DeterministicLogger())
+    records, checkpoints = load_stores(log_path, checkpoint_path, states_path)
+    return replay_range(
+        loop, checkpoints, records, start, end,
+        max_steps_per_episode=max_steps_per_episode
+    )
+
+
+def bisect(make_loop, log_path: str, checkpoint_path=None, start=None, end=None, states_path=None):
+    records, checkpoints = load_stores(log_path, checkpoint_path, states_path)
+    return bisect_divergence(make_loop, records, checkpoints, start, end)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Replay an episode range from checkpoints")
+    parser.add_argument("--log", required=True, help="JSON-lines replay log")
+    parser.add_argument("--checkpoints", help="JSON-lines checkpoint file (required unless --bisect)")
+    parser.add_argument("--states", help="StateStore directory, if the run logged state ids")
+    parser.add_argument("--environment", required=True, help="module:callable building the environment")
+    parser.add_argument("--policy", required=True, help="module:callable building the policy")
+    parser.add_argument("--learner", default="learning.learner:Learner")
+    parser.add_argument("--min-visits", type=int, default=2,
+                        help="ExplorationStrategy min_visits_required used in training")
+    parser.add_argument("--start", type=int, help="first episode (required unless --bisect)")
+    parser.add_argument("--end", type=int, help="last episode (default: start; log end with --bisect)")
+    parser.add_argument("--bisect", action="store_true",
+                        help="search for the first episode this build does not reproduce")
+    parser.add_argument("--max-steps", type=int,
+                        help="steps per episode when no checkpoint precedes --start")
+    args = parser.parse_args(argv)
+
+    def make_loop():
+        return LearningLoop(
+            load_factory(args.environment)(),
+            load_factory(args.policy)(),
+            load_factory(args.learner)(),
+            ExplorationStrategy(min_visits_required=args.min_visits),
+            DeterministicLogger()
+        )
+
+    if args.bisect:
+        divergence = bisect(make_loop, args.log, args.checkpoints, args.start, args.end, args.states)
+        if divergence is None:
+            print("✓ No divergence: the last episode in range replays identically")
+            return 0
+        print(f"✗ First divergent episode {divergence['episode_id']} at step {divergence['step']}: "
+              f"logged action '{divergence['expected_action']}', "
+              f"replayed action '{divergence['actual_action']}' "
+              f"({len(divergence['probes'])} probes)")
+        return 1
+
+    if args.checkpoints is None or args.start is None:
+        parser.error("--checkpoints and --start are required unless --bisect is given")
+
+    try:
+        result = run(
+            load_factory(args.environment)(),
+            load_factory(args.policy)(),
+            load_factory(args.learner)(),
+            ExplorationStrategy(min_visits_required=args.min_visits),
+            args.log, args.checkpoints, args.start,
+            args.end if args.end is not None else args.start,
+            args.max_steps,
+            args.states
+        )
+    except ReplayDivergenceError as error:
+        print(f"✗ {error}")
+        return 1
+
+    print(f"Resumed from checkpoint at episode {result['checkpoint_episode']}, "
+          f"ran {result['episodes_run']} episodes")
+    print(f"✓ Episodes {result['replayed'][0]}..{result['replayed'][-1]} replayed identically")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
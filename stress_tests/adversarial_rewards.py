@@ -6,18 +6,19 @@ Rewards flip, oscillate, or collapse to zero.
 The system must remain deterministic and stable.
 """
 
-def run_adversarial_rewards(environment, learning_loop):
+def run_adversarial_rewards(environment, learning_loop, episodes_per_case: int = 3,
+                            max_steps_per_episode: int = 10):
     # Case 1: Reward sign flip
     environment.set_reward_mode("flip")
-    learning_loop.train(episodes=3, max_steps_per_episode=10)
+    learning_loop.train(episodes=episodes_per_case, max_steps_per_episode=max_steps_per_episode)
 
     # Case 2: Oscillating reward
     environment.set_reward_mode("oscillate")
-    learning_loop.train(episodes=3, max_steps_per_episode=10)
+    learning_loop.train(episodes=episodes_per_case, max_steps_per_episode=max_steps_per_episode)
 
     # Case 3: Zero reward
     environment.set_reward_mode("zero")
-    learning_loop.train(episodes=3, max_steps_per_episode=10)
+    learning_loop.train(episodes=episodes_per_case, max_steps_per_episode=max_steps_per_episode)
 
     return {
         "status": "completed",
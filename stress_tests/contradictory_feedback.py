@@ -3,14 +3,21 @@ contradictory_feedback.py
 
 Stress test: identical states produce conflicting rewards.
 System must acknowledge uncertainty instead of overfitting.
+When the loop's learner has a contradiction detector, its report
+shows the conflicts it flagged.
 """
 
-def run_contradictory_feedback(environment, learning_loop):
+def run_contradictory_feedback(environment, learning_loop, episodes: int = 5,
+                               max_steps_per_episode: int = 8):
     environment.set_reward_mode("contradictory")
 
-    learning_loop.train(episodes=5, max_steps_per_episode=8)
+    learning_loop.train(episodes=episodes, max_steps_per_episode=max_steps_per_episode)
 
-    return {
+    result = {
         "status": "completed",
         "expectation": "Uncertainty increases; confidence remains bounded"
     }
+    detector = getattr(learning_loop.learner, "contradiction_detector", None)
+    if detector is not None:
+        result["contradictions"] = detector.report()
+    return result
@@ -0,0 +1,145 @@
+"""
+parallel.py
+
+Concurrent stress scenarios.
+This module:
+- Runs each scenario of a tier in its own worker process, with its
+  own environment, policy and loop (scale.run_scenario builds them)
+- Enforces a per-scenario wall-clock timeout and address-space cap
+- Merges results into one report in the requested scenario order,
+  whatever order workers finish in
+
+A worker that times out is terminated; one that exceeds its memory cap
+fails with MemoryError. Either way the scenario is reported as failed
+and the others keep running. Memory caps use resource.RLIMIT_AS and are
+not enforced where the resource module is unavailable.
+
+Run with: python stress_tests/scale.py --tier smoke --parallel
+"""
+
+import time
+import traceback
+from dataclasses import asdict
+from multiprocessing import get_context
+from multiprocessing.connection import wait
+from typing import Any, Dict, List, Optional
+
+from stress_tests.scale import ScaleTier, run_scenario, _scenario_calls
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+def _cap_memory(limit_bytes: int) -> None:
+    resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+
+
+def _worker(tier: ScaleTier, scenario: str, memory_cap_bytes: Optional[int], connection) -> None:
+    try:
+        if memory_cap_bytes is not None and resource is not None:
+            _cap_memory(memory_cap_bytes)
+        message = ("completed", run_scenario(tier, scenario))
+    except MemoryError:
+        message = ("memory", "exceeded memory cap")
+    except BaseException:
+        message = ("error", traceback.format_exc())
+    connection.send(message)
+    connection.close()
+
+
+def _failure(scenario: str, status: str, detail: str, seconds: float) -> Dict[str, Any]:
+    return {
+        "scenario": scenario,
+        "status": status,
+        "seconds": seconds,
+        "violations": [detail],
+        "passed": False,
+    }
+
+
+def run_tier_parallel(tier: ScaleTier, scenarios: Optional[List[str]] = None, workers: Optional[int] = None,
+                      timeout_seconds: Optional[float] = None, memory_cap_bytes: Optional[int] = None,
+                      start_method: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Same report as scale.run_tier, plus each scenario's "status"
+    (completed, timeout, memory, error or crashed) and the suite wall time.
+
+    workers: concurrent scenarios (default: all of them)
+    timeout_seconds: per-scenario limit (default: twice the tier time budget,
+                     since each scenario also reruns its determinism prefix)
+    memory_cap_bytes: per-worker address-space limit (default: none)
+    """
+    names = scenarios or list(_scenario_calls(tier))
+    if workers is None:
+        workers = len(names)
+    if workers <= 0:
+        raise ValueError(f"workers must be positive, got {workers}")
+    if timeout_seconds is None:
+        timeout_seconds = 2 * tier.time_budget_seconds
+    if timeout_seconds <= 0:
+        raise ValueError(f"timeout_seconds must be positive, got {timeout_seconds}")
+
+    context = get_context(start_method)
+    waiting = list(range(len(names)))
+    # index -> (process, receiving end, start time)
+    running: Dict[int, Any] = {}
+    results: Dict[int, Dict[str, Any]] = {}
+    suite_start = time.perf_counter()
+
+    def finish(index: int, result: Dict[str, Any]) -> None:
+        process, connection, _ = running.pop(index)
+        connection.close()
+        process.join()
+        results[index] = result
+
+    while waiting or running:
+        while waiting and len(running) < workers:
+            index = waiting.pop(0)
+            receiver, sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=_worker, args=(tier, names[index], memory_cap_bytes, sender), daemon=True
+            )
+            process.start()
+            sender.close()
+            running[index] = (process, receiver, time.perf_counter())
+
+        now = time.perf_counter()
+        next_deadline = min(started + timeout_seconds for _, _, started in running.values())
+        ready = set(wait(
+            [connection for _, connection, _ in running.values()]
+            + [process.sentinel for process, _, _ in running.values()],
+            timeout=max(0.0, next_deadline - now)
+        ))
+
+        now = time.perf_counter()
+        for index in sorted(running):
+            process, connection, started = running[index]
+            elapsed = now - started
+            if connection in ready or process.sentinel in ready:
+                # A sentinel without data means the worker died before sending
+                if connection.poll():
+                    status, payload = connection.recv()
+                    if status == "completed":
+                        payload["status"] = status
+                        finish(index, payload)
+                    else:
+                        finish(index, _failure(names[index], status, payload, elapsed))
+                else:
+                    finish(index, _failure(
+                        names[index], "crashed", f"worker exited with code {process.exitcode}", elapsed
+                    ))
+            elif elapsed >= timeout_seconds:
+                process.terminate()
+                finish(index, _failure(
+                    names[index], "timeout", f"timed out after {timeout_seconds:.1f}s", elapsed
+                ))
+
+    ordered = [results[index] for index in range(len(names))]
+    return {
+        "tier": asdict(tier),
+        "scenarios": ordered,
+        "passed": all(result["passed"] for result in ordered),
+        "wall_seconds": time.perf_counter() - suite_start,
+    }
@@ -5,10 +5,11 @@ Stress test: hide parts of the environment state.
 System must not invent missing information.
 """
 
-def run_partial_observability(environment, learning_loop):
+def run_partial_observability(environment, learning_loop, episodes: int = 5,
+                              max_steps_per_episode: int = 10):
     environment.enable_partial_observability(True)
 
-    learning_loop.train(episodes=5, max_steps_per_episode=10)
+    learning_loop.train(episodes=episodes, max_steps_per_episode=max_steps_per_episode)
 
     return {
         "status": "completed",
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+scale.py
+
+Large-scale stress mode.
+Runs the adversarial, contradictory and partial-observability
+scenarios at parameterized step counts (up to 10^6+) and checks:
+- wall-time and peak-memory budgets per tier
+- determinism (a short rerun reproduces the log prefix digest, or the
+  whole log's digest when the run is shorter than the prefix)
+- boundedness (rewards, accumulated reward and confidence in range)
+It also samples how the unbounded structures grow with step count:
+the replay log (streamed and retained), exploration visit keys, the
+policy table and a DecisionTrace fed one exploit decision per episode.
+
+Run with: python stress_tests/scale.py --tier smoke
+Add --parallel to run the scenarios concurrently (see parallel.py).
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from core.contracts import REWARD_RANGE
+from core.state import validate_state
+from execution.decision import DecisionEngine
+from explainability.explain import Explainer
+from explainability.traces import DecisionTrace
+from learning.exploration import ExplorationStrategy
+from learning.instrumentation import Instrumentation
+from learning.learner import Learner
+from learning.learning_loop import LearningLoop
+from stress_tests.adversarial_rewards import run_adversarial_rewards
+from stress_tests.contradictory_feedback import run_contradictory_feedback
+from stress_tests.partial_observability import run_partial_observability
+
+MB = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ScaleTier:
+    name: str
+    total_steps: int
+    max_steps_per_episode: int
+    time_budget_seconds: float
+    memory_budget_bytes: int
+    retain_logs: bool
+    samples: int = 10
+
+
+TIERS = {
+    "smoke": ScaleTier("smoke", 10_000, 100, 60.0, 64 * MB, True),
+    "medium": ScaleTier("medium", 100_000, 100, 300.0, 512 * MB, True),
+    "large": ScaleTier("large", 1_000_000, 1_000, 1_800.0, 256 * MB, False),
+    "xlarge": ScaleTier("xlarge", 5_000_000, 1_000, 9_000.0, 1_024 * MB, False),
+}
+
+DETERMINISM_PREFIX_EPISODES = 20
+
+
+class StressEnvironment(SyntheticEnvironment):
+    """Synthetic ring with the reward modes and masking the scenarios expect."""
+
+    REWARD_MODES = ("normal", "flip", "oscillate", "zero", "contradictory")
+
+    def __init__(self, n_states: int = 64, episode_length: int = 100):
+        self.reward_mode = "normal"
+        self.partially_observable = False
+        self.reward_calls = 0
+        super().__init__(n_states, episode_length)
+
+    def set_reward_mode(self, mode: str) -> None:
+        if mode not in self.REWARD_MODES:
+            raise ValueError(f"Unknown reward mode: {mode}")
+        self.reward_mode = mode
+
+    def enable_partial_observability(self, enabled: bool) -> None:
+        self.partially_observable = enabled
+
+    def checkpoint(self) -> Dict[str, Any]:
+        checkpoint = super().checkpoint()
+        checkpoint.update({
+            "reward_mode": self.reward_mode,
+            "partially_observable": self.partially_observable,
+            "reward_calls": self.reward_calls
+        })
+        return checkpoint
+
+    def restore(self, checkpoint: Dict[str, Any]) -> None:
+        super().restore(checkpoint)
+        self.reward_mode = checkpoint["reward_mode"]
+        self.partially_observable = checkpoint["partially_observable"]
+        self.reward_calls = checkpoint["reward_calls"]
+
+    def _reward(self, action: str) -> float:
+        self.reward_calls += 1
+        base = super()._reward(action)
+
+        if self.reward_mode == "flip":
+            return -base
+        if self.reward_mode == "oscillate":
+            return base if self.reward_calls % 2 == 0 else -base
+        if self.reward_mode == "zero":
+            return 0.0
+        if self.reward_mode == "contradictory":
+            # Same state, same action, opposite sign on alternate visits
+            return 1.0 if self.reward_calls % 2 == 0 else -1.0
+        return base
+
+    def _state(self, previous_action: str) -> Dict[str, Any]:
+        state = super()._state(previous_action)
+        if self.partially_observable:
+            # The signal is withheld, not guessed
+            state["observed_signal"] = 0.0
+        return state
+
+
+class PrefixComplete(Exception):
+    """Raised by a DigestLogger once its stop_after record count is reached."""
+    pass
+
+
+class DigestLogger:
+    """
+    Replay logger that hashes records instead of (or as well as)
+    retaining them, so 10^6-step runs stay within memory budgets.
+    """
+
+    def __init__(self, retain: bool, prefix_records: int = DETERMINISM_PREFIX_EPISODES,
+                 stop_after: Optional[int] = None):
+        self.retain = retain
+        self.stop_after = stop_after
+        self.records: List[Dict[str, Any]] = []
+        self.count = 0
+        self.transitions = 0
+        self.last_state: Optional[Dict[str, Any]] = None
+        self.prefix_records = prefix_records
+        self.prefix_digest: Optional[str] = None
+        self.reward_min = float("inf")
+        self.reward_max = float("-inf")
+        self.invalid_states: List[str] = []
+        self._hash = hashlib.sha256()
+
+    def log(self, record: Dict[str, Any]) -> None:
+        self._hash.update(json.dumps(record, sort_keys=True).encode())
+        self.count += 1
+        if self.count == self.prefix_records:
+            self.prefix_digest = self._hash.hexdigest()
+
+        # Boundedness is checked while streaming, so it holds for
+        # unretained tiers too
+        trace = record["episode_trace"]
+        self.transitions += len(trace)
+        if trace:
+            self.last_state = trace[-1]["next_state"]
+        for transition in trace:
+            reward = transition["reward"]
+            if reward < self.reward_min:
+                self.reward_min = reward
+            if reward > self.reward_max:
+                self.reward_max = reward
+            try:
+                validate_state(transition["next_state"])
+            except ValueError as error:
+                self.invalid_states.append(str(error))
+
+        if self.retain:
+            self.records.append(record)
+        if self.stop_after is not None and self.count >= self.stop_after:
+            raise PrefixComplete()
+
+    def export(self) -> List[Dict[str, Any]]:
+        return self.records.copy()
+
+    def digest(self) -> str:
+        return self._hash.hexdigest()
+
+
+class GrowthSampler:
+    """Instrumentation hook sampling unbounded-structure sizes as steps accumulate."""
+
+    def __init__(self, components: Dict[str, Callable[[], int]], every_episodes: int):
+        self.components = components
+        self.every_episodes = max(1, every_episodes)
+        self.steps = 0
+        self.episodes = 0
+        self.samples: List[Dict[str, Any]] = []
+
+    def on_episode(self, record: Dict[str, Any]) -> None:
+        self.steps += record["steps"]
+        self.episodes += 1
+        if self.episodes % self.every_episodes == 0:
+            self.samples.append(self.sample())
+
+    def sample(self) -> Dict[str, Any]:
+        current, _ = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        point = {"steps": self.steps, "traced_bytes": current}
+        point.update({name: size() for name, size in self.components.items()})
+        return point
+
+
+class DecisionTraceHook:
+    """Instrumentation hook recording one explained exploit decision per episode."""
+
+    def __init__(self, policy, logger: DigestLogger, trace: DecisionTrace):
+        self.policy = policy
+        self.logger = logger
+        self.trace = trace
+        self.engine = DecisionEngine()
+        self.explainer = Explainer()
+
+    def on_episode(self, record: Dict[str, Any]) -> None:
+        state = self.logger.last_state
+        if state is None:
+            return
+        decision = self.engine.decide(self.policy, state)
+        self.trace.record(self.explainer.explain_decision(
+            state, decision["action"], decision["confidence"], {"episode_id": record["episode_id"]}
+        ))
+
+
+def _scenario_calls(tier: ScaleTier):
+    episodes = max(1, tier.total_steps // tier.max_steps_per_episode)
+    steps = tier.max_steps_per_episode
+    return {
+        "adversarial_rewards": lambda env, loop, n=episodes: run_adversarial_rewards(
+            env, loop, episodes_per_case=max(1, n // 3), max_steps_per_episode=steps),
+        "contradictory_feedback": lambda env, loop, n=episodes: run_contradictory_feedback(
+            env, loop, episodes=n, max_steps_per_episode=steps),
+        "partial_observability": lambda env, loop, n=episodes: run_partial_observability(
+            env, loop, episodes=n, max_steps_per_episode=steps),
+    }
+
+
+def _build(tier: ScaleTier, retain: bool, hooks=(), stop_after: Optional[int] = None):
+    env = StressEnvironment(episode_length=tier.max_steps_per_episode)
+    policy = SyntheticPolicy()
+    exploration = ExplorationStrategy()
+    logger = DigestLogger(retain=retain, stop_after=stop_after)
+    instrumentation = Instrumentation(hooks=hooks)
+    loop = LearningLoop(env, policy, Learner(), exploration, logger, instrumentation=instrumentation)
+    return env, policy, exploration, logger, loop
+
+
+def _bounded(policy: SyntheticPolicy, logger: DigestLogger) -> List[str]:
+    problems = []
+    for key in policy.values:
+        state = {"current_step": 0, "observed_signal": key[0],
+                 "previous_action": key[1], "accumulated_reward": 0.0}
+        confidence = policy.get_confidence(state)
+        if not (0.0 <= confidence <= 1.0):
+            problems.append(f"confidence out of range for {key}: {confidence}")
+
+    min_reward, max_reward = REWARD_RANGE
+    if logger.count and not (min_reward <= logger.reward_min and logger.reward_max <= max_reward):
+        problems.append(f"reward out of range: [{logger.reward_min}, {logger.reward_max}]")
+    problems.extend(logger.invalid_states[:10])
+    return problems
+
+
+def run_scenario(tier: ScaleTier, scenario: str) -> Dict[str, Any]:
+    call = _scenario_calls(tier)[scenario]
+    episodes = max(1, tier.total_steps // tier.max_steps_per_episode)
+
+    sampler = GrowthSampler({}, every_episodes=episodes // tier.samples)
+    tracer = DecisionTraceHook(None, None, DecisionTrace())
+    # The tracer runs first so each sample includes that episode's decision
+    env, policy, exploration, logger, loop = _build(tier, tier.retain_logs, hooks=[tracer, sampler])
+    tracer.policy, tracer.logger = policy, logger
+    sampler.components = {
+        # Streamed counts grow whether or not the tier retains its log
+        "replay_log_records": lambda: logger.count,
+        "replay_log_transitions": lambda: logger.transitions,
+        "replay_log_retained_records": lambda: len(logger.records),
+        "exploration_visit_keys": lambda: len(exploration.state_visit_counter),
+        "policy_table_keys": lambda: len(policy.values),
+        "decision_trace_entries": lambda: len(tracer.trace.trace),
+    }
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        call(env, loop)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Determinism: a fresh run of the same schedule, stopped after
+    # the prefix, must reproduce the logged prefix digest
+    rerun_env, _, _, rerun_logger, rerun_loop = _build(
+        tier, retain=False, stop_after=DETERMINISM_PREFIX_EPISODES
+    )
+    try:
+        call(rerun_env, rerun_loop)
+    except PrefixComplete:
+        pass
+
+    violations = []
+    if elapsed > tier.time_budget_seconds:
+        violations.append(f"wall time {elapsed:.1f}s exceeds budget {tier.time_budget_seconds:.1f}s")
+    if peak > tier.memory_budget_bytes:
+        violations.append(f"peak memory {peak / MB:.1f}MB exceeds budget {tier.memory_budget_bytes / MB:.1f}MB")
+    if logger.prefix_digest is not None:
+        determinism = "prefix"
+        if logger.prefix_digest != rerun_logger.prefix_digest:
+            violations.append("determinism: rerun log prefix digest differs")
+    elif logger.count:
+        # Shorter than the prefix: the rerun covered the whole run
+        determinism = "full_log"
+        if logger.digest() != rerun_logger.digest():
+            violations.append("determinism: rerun log digest differs")
+    else:
+        determinism = "skipped"
+    violations.extend(_bounded(policy, logger))
+
+    return {
+        "scenario": scenario,
+        "steps": sampler.steps,
+        "episodes": sampler.episodes,
+        "seconds": elapsed,
+        "steps_per_second": sampler.steps / elapsed if elapsed > 0 else 0.0,
+        "peak_memory_bytes": peak,
+        "log_digest": logger.digest(),
+        "determinism": determinism,
+        "growth": sampler.samples,
+        "violations": violations,
+        "passed": not violations,
+    }
+
+
+def run_tier(tier: ScaleTier, scenarios: Optional[List[str]] = None) -> Dict[str, Any]:
+    names = scenarios or list(_scenario_calls(tier))
+    results = [run_scenario(tier, name) for name in names]
+    return {
+        "tier": asdict(tier),
+        "scenarios": results,
+        "passed": all(result["passed"] for result in results),
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Large-scale stress tiers")
+    parser.add_argument("--tier", choices=sorted(TIERS), default="smoke")
+    parser.add_argument("--scenario", action="append",
+                        help="limit to one scenario (repeatable)")
+    parser.add_argument("--output", help="write JSON report to this path")
+    parser.add_argument("--parallel", action="store_true",
+                        help="run each scenario in its own worker process, concurrently")
+    parser.add_argument("--workers", type=int, help="concurrent scenarios with --parallel")
+    parser.add_argument("--timeout", type=float, help="per-scenario timeout in seconds with --parallel")
+    parser.add_argument("--memory-cap-mb", type=int, help="per-scenario memory cap with --parallel")
+    args = parser.parse_args(argv)
+
+    if args.parallel:
+        # Imported here: parallel.py builds on this module
+        from stress_tests.parallel import run_tier_parallel
+        report = run_tier_parallel(
+            TIERS[args.tier], args.scenario, workers=args.workers, timeout_seconds=args.timeout,
+            memory_cap_bytes=args.memory_cap_mb * MB if args.memory_cap_mb else None
+        )
+    else:
+        report = run_tier(TIERS[args.tier], args.scenario)
+
+    for result in report["scenarios"]:
+        status = "PASSED" if result["passed"] else "FAILED"
+        if "steps" in result:
+            print(f"{result['scenario']}: {status} - {result['steps']:,} steps in "
+                  f"{result['seconds']:.1f}s, peak {result['peak_memory_bytes'] / MB:.1f}MB")
+        else:
+            print(f"{result['scenario']}: {status} ({result['status']}) after {result['seconds']:.1f}s")
+        for violation in result["violations"]:
+            print(f"  ✗ {violation}")
+        if result.get("growth"):
+            last = result["growth"][-1]
+            print("  growth at end: " + ", ".join(
+                f"{name}={value:,}" for name, value in last.items() if name != "steps"))
+
+    if "wall_seconds" in report:
+        print(f"suite wall time: {report['wall_seconds']:.1f}s")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2, sort_keys=True)
+
+    return 0 if report["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from learning.actor_learner import ActorLearner
+from learning.exploration import ExplorationStrategy
+from learning.learner import Learner
+from utils.logger import DeterministicLogger
+
+
+def make_environment(actor_id):
+    # Different ring sizes, so actors visit different states
+    return SyntheticEnvironment(16 + 4 * actor_id, 20)
+
+
+def broken_environment(actor_id):
+    raise RuntimeError("environment unavailable")
+
+
+def _train(deterministic, make_env=make_environment, episodes=24):
+    logger = DeterministicLogger()
+    pipeline = ActorLearner(make_env, SyntheticPolicy, ExplorationStrategy, Learner(), logger,
+                            actors=3, max_queued=2, refresh_every=2, deterministic=deterministic)
+    report = pipeline.train(episodes=episodes, max_steps_per_episode=20)
+    return report, logger.export(), pipeline.policy
+
+
+def test_deterministic_mode_reproduces_log_and_policy():
+    first_report, first_log, first_policy = _train(deterministic=True)
+    second_report, second_log, second_policy = _train(deterministic=True)
+
+    assert first_log == second_log
+    assert first_policy.snapshot() == second_policy.snapshot()
+    assert first_report == second_report
+    assert [record["actor_id"] for record in first_log[:6]] == [0, 0, 1, 1, 2, 2]
+    assert first_report["staleness"]["max"] > 0
+
+
+def test_async_mode_consumes_every_trace_once_with_staleness():
+    report, log, policy = _train(deterministic=False)
+
+    assert [record["episode_id"] for record in log] == list(range(24))
+    counts = [sum(record["actor_id"] == actor_id for record in log) for actor_id in range(3)]
+    assert all(count > 0 and count % 2 == 0 for count in counts)
+    assert all(record["staleness"] == record["episode_id"] - record["policy_version"] for record in log)
+    assert report["policy_version"] == 24
+
+
+def test_actor_failure_is_raised_in_learner():
+    with pytest.raises(RuntimeError, match="environment unavailable"):
+        _train(deterministic=True, make_env=broken_environment, episodes=4)
@@ -0,0 +1,42 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.run_benchmarks import compare, run_suite
+
+
+def test_suite_reports_throughput_and_memory():
+    report = run_suite(sizes=[8], scale=2, repeats=1)
+
+    assert set(report["results"]) == {
+        "episode_runner[n=8]", "episode_runner_typed[n=8]", "learning_loop[n=8]", "replay[n=8]",
+        "decision_engine[n=8]", "fusion", "signal_ingest",
+    }
+    assert report["results"]["replay[n=8]"]["transitions_per_second"] > 0
+    assert all(m["peak_memory_bytes"] > 0 for m in report["results"].values())
+
+
+def test_compare_flags_regressions_in_both_directions():
+    baseline = {"results": {"fusion": {"fusions_per_second": 1000.0, "peak_memory_bytes": 100.0}}}
+    slower = {"results": {"fusion": {"fusions_per_second": 700.0, "peak_memory_bytes": 100.0}}}
+    bigger = {"results": {"fusion": {"fusions_per_second": 1000.0, "peak_memory_bytes": 200.0}}}
+
+    assert compare(baseline, baseline, 0.25) == []
+    assert len(compare(slower, baseline, 0.25)) == 1
+    assert len(compare(bigger, baseline, 0.25)) == 1
+    assert compare(slower, baseline, 0.5) == []
+
+
+def test_compare_reports_missing_workloads_and_metrics():
+    baseline = {"results": {
+        "fusion": {"fusions_per_second": 1000.0, "peak_memory_bytes": 100.0},
+        "replay[n=8]": {"transitions_per_second": 500.0},
+    }}
+    current = {"results": {"fusion": {"peak_memory_bytes": 100.0}}}
+
+    assert compare(current, baseline, 0.25) == [
+        "fusion fusions_per_second: missing from current results",
+        "replay[n=8]: missing from current results",
+    ]
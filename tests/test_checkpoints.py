@@ -0,0 +1,98 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from learning.checkpoints import CheckpointStore, replay_range
+from learning.exploration import ExplorationStrategy
+from learning.learner import Learner
+from learning.learning_loop import LearningLoop
+from learning.replay import ReplayDivergenceError
+from run import run_replay
+from stress_tests.adversarial_rewards import run_adversarial_rewards
+from stress_tests.scale import StressEnvironment
+from utils.logger import DeterministicLogger, JsonLinesLogger
+
+
+def _loop(logger, store=None, every=None):
+    env = StressEnvironment(n_states=16, episode_length=12)
+    env.set_reward_mode("oscillate")
+    return LearningLoop(env, SyntheticPolicy(), Learner(), ExplorationStrategy(), logger,
+                        checkpoint_store=store, checkpoint_every=every)
+
+
+def test_replay_resumes_from_nearest_checkpoint():
+    logger, store = DeterministicLogger(), CheckpointStore()
+    _loop(logger, store, 10).train(episodes=40, max_steps_per_episode=12)
+
+    result = replay_range(_loop(DeterministicLogger()), store, logger.export(), 33, 35)
+
+    assert len(store) == 4
+    assert result == {"checkpoint_episode": 30, "episodes_run": 6, "replayed": [33, 34, 35]}
+
+
+def test_divergence_is_reported_with_episode_and_step():
+    logger, store = DeterministicLogger(), CheckpointStore()
+    _loop(logger, store, 5).train(episodes=10, max_steps_per_episode=12)
+    records = logger.export()
+    records[7]["episode_trace"][3]["reward"] = 99.0
+
+    with pytest.raises(ReplayDivergenceError, match="episode 7 at step 3"):
+        replay_range(_loop(DeterministicLogger()), store, records, 6, 8)
+
+
+def test_online_log_without_checkpoints_replays_online():
+    logger = DeterministicLogger()
+    _loop(logger).train_online(episodes=6, max_steps_per_episode=12, chunk_size=5)
+
+    result = replay_range(_loop(DeterministicLogger()), CheckpointStore(), logger.export(), 3, 5,
+                          max_steps_per_episode=12)
+
+    assert result == {"checkpoint_episode": None, "episodes_run": 6, "replayed": [3, 4, 5]}
+
+
+def test_phased_training_continues_episode_ids():
+    logger, store = DeterministicLogger(), CheckpointStore()
+    loop = _loop(logger, store, 3)
+    run_adversarial_rewards(loop.environment, loop, episodes_per_case=3, max_steps_per_episode=12)
+    loop.train_online(episodes=3, max_steps_per_episode=12, chunk_size=5)
+
+    records = logger.export()
+    assert [record["episode_id"] for record in records if record.get("final", True)] == list(range(12))
+    assert sorted(store.checkpoints) == [0, 3, 6, 9]
+    # Each phase starts at a checkpoint that holds its reward mode;
+    # the last one re-runs in online mode
+    assert replay_range(_loop(DeterministicLogger()), store, records, 7, 8)["replayed"] == [7, 8]
+    assert replay_range(_loop(DeterministicLogger()), store, records, 10, 11)["checkpoint_episode"] == 9
+
+
+def test_second_run_into_same_store_or_log_is_rejected():
+    logger, store = DeterministicLogger(), CheckpointStore()
+    _loop(logger, store, 5).train(episodes=10, max_steps_per_episode=12)
+
+    # Episode ids restart at 0: a different run would overwrite this one's checkpoints
+    with pytest.raises(ValueError, match="episode 0"):
+        _loop(DeterministicLogger(), store, 5).train(episodes=10, max_steps_per_episode=8)
+    with pytest.raises(ValueError, match="more than once"):
+        replay_range(_loop(DeterministicLogger()), store, logger.export() * 2, 6, 8)
+
+
+def test_cli_replays_persisted_online_run(tmp_path):
+    log_path, checkpoint_path = str(tmp_path / "log.jsonl"), str(tmp_path / "ckpt.jsonl")
+    loop = LearningLoop(SyntheticEnvironment(), SyntheticPolicy(), Learner(), ExplorationStrategy(),
+                        JsonLinesLogger(log_path), checkpoint_store=CheckpointStore(checkpoint_path),
+                        checkpoint_every=8)
+    loop.train_online(episodes=20, max_steps_per_episode=12, chunk_size=5)
+
+    exit_code = run_replay.main([
+        "--log", log_path, "--checkpoints", checkpoint_path,
+        "--environment", "benchmarks.synthetic:SyntheticEnvironment",
+        "--policy", "benchmarks.synthetic:SyntheticPolicy",
+        "--start", "17", "--end", "19",
+    ])
+
+    assert exit_code == 0
@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticPolicy
+from intelligence.semantics.signals import SignalType
+from learning.exploration import ExplorationStrategy
+from learning.learner import Learner
+from learning.learning_loop import LearningLoop
+from learning.state_encoding import CategoricalBins, StateEncoder, UniformBins
+from stress_tests.contradictory_feedback import run_contradictory_feedback
+from stress_tests.scale import StressEnvironment
+from uncertainty.contradictions import ContradictionDetector
+from uncertainty.uncertainty import UncertaintyModel
+from utils.logger import DeterministicLogger
+
+STATE = {"current_step": 0, "observed_signal": 0.5, "previous_action": "WAIT", "accumulated_reward": 0.0}
+
+
+def _encoder():
+    # "Identical" = same observation and previous action, whatever was accumulated
+    return StateEncoder({"observed_signal": UniformBins(0.0, 1.0, 8), "previous_action": CategoricalBins()})
+
+
+def test_sign_changes_are_flagged_and_zero_rewards_ignored():
+    model = UncertaintyModel()
+    detector = ContradictionDetector(uncertainty_model=model)
+
+    signals = [detector.observe(STATE, "COMMIT", reward) for reward in (0.5, 0.2, 0.0, -0.3, -0.1, 0.4)]
+
+    assert [signal is not None for signal in signals] == [False, False, False, True, False, True]
+    assert all(signal.signal_type is SignalType.CONTRADICTION for signal in detector.signals)
+    assert detector.pair_stats(STATE, "COMMIT") == {"count": 6, "min": -0.3, "max": 0.5, "sign_changes": 2}
+    assert signals[-1].uncertainty == 2 / 5
+    assert detector.report()["contradictions"] == 2
+    # The model hears about the pair once
+    assert model.snapshot()["contradiction_count"] == 1
+    assert model.snapshot()["contradicted_state_count"] == 1
+
+
+def test_actions_are_tracked_separately():
+    detector = ContradictionDetector()
+    detector.observe(STATE, "COMMIT", 1.0)
+    detector.observe(STATE, "WAIT", -1.0)
+
+    assert detector.report()["contradictions"] == 0
+    assert detector.report()["tracked_pairs"] == 2
+
+
+def test_learner_feeds_detector_without_changing_policy():
+    def train(detector):
+        env = StressEnvironment(n_states=16, episode_length=40)
+        policy = SyntheticPolicy()
+        loop = LearningLoop(env, policy, Learner(detector), ExplorationStrategy(), DeterministicLogger())
+        result = run_contradictory_feedback(env, loop, episodes=10, max_steps_per_episode=40)
+        return policy.snapshot(), result
+
+    model = UncertaintyModel()
+    detector = ContradictionDetector(uncertainty_model=model, state_encoder=_encoder(), max_signals=5)
+    plain_snapshot, plain_result = train(None)
+    snapshot, result = train(detector)
+
+    assert snapshot == plain_snapshot
+    assert "contradictions" not in plain_result
+    assert result["contradictions"]["transitions"] == 400
+    assert result["contradictions"]["contradictions"] > 0
+    assert result["contradictions"]["tracked_pairs"] <= _encoder().size * 3
+    assert len(detector.signals) == 5
+    assert model.snapshot()["contradiction_count"] == result["contradictions"]["contradicted_pairs"]
+
+
+def test_consistent_rewards_raise_nothing():
+    env = StressEnvironment(n_states=16, episode_length=40)
+    detector = ContradictionDetector(state_encoder=_encoder())
+    loop = LearningLoop(env, SyntheticPolicy(), Learner(detector), ExplorationStrategy(), DeterministicLogger())
+    loop.train(episodes=10, max_steps_per_episode=40)
+
+    assert detector.report()["contradictions"] == 0
@@ -0,0 +1,133 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from learning.convergence import ConvergenceMonitor, table_distance
+from learning.exploration import ExplorationStrategy
+from learning.learner import Learner
+from learning.learning_loop import LearningLoop
+from learning.replay import first_difference
+from stress_tests.scale import StressEnvironment
+from utils.logger import DeterministicLogger
+
+
+class FadingRewardEnvironment(SyntheticEnvironment):
+    """Rewards every step for the first rewarded_episodes episodes, then nothing."""
+
+    def __init__(self, rewarded_episodes, n_states=8, episode_length=20):
+        self.rewarded_episodes = rewarded_episodes
+        self.episodes = 0
+        super().__init__(n_states, episode_length)
+        # The constructor's own reset() starts no episode
+        self.episodes = 0
+
+    def reset(self):
+        self.episodes += 1
+        return super().reset()
+
+    def _reward(self, action):
+        return 0.1 if self.episodes <= self.rewarded_episodes else 0.0
+
+
+def _loop(environment, logger, monitor):
+    return LearningLoop(environment, SyntheticPolicy(), Learner(), ExplorationStrategy(), logger,
+                        convergence_monitor=monitor)
+
+
+def test_table_distance_counts_changes_and_flips():
+    previous = {"a": {"WAIT": 1.0, "COMMIT": 0.5}, "b": {"WAIT": 0.0}}
+    current = {"a": {"WAIT": 1.0, "COMMIT": 2.0}, "b": {"WAIT": 0.25}, "c": {"EXPLORE": 0.0}}
+
+    assert table_distance(previous, current) == (1.5, 2)
+    assert table_distance(current, current) == (0.0, 0)
+
+
+def test_training_stops_once_policy_is_stable_and_logs_why():
+    logger = DeterministicLogger()
+    loop = _loop(FadingRewardEnvironment(rewarded_episodes=6), logger, ConvergenceMonitor(window=3))
+
+    loop.train(episodes=100, max_steps_per_episode=20)
+    records = logger.export()
+    tables = [record["policy_snapshot"]["values"] for record in records]
+    last_change = max(i for i in range(1, len(tables)) if table_distance(tables[i - 1], tables[i]) != (0.0, 0))
+
+    # The policy keeps changing while rewards arrive; training runs on
+    # through those episodes and stops a full window after the last change
+    assert last_change == 5
+    assert loop.stop_decision["episode_id"] == last_change + 3
+    assert records[-1]["early_stop"] == loop.stop_decision
+    assert loop.stop_decision["episode_id"] == records[-1]["episode_id"]
+    assert loop.stop_decision["stable_episodes"] == 3
+    assert all("early_stop" not in record for record in records[:-1])
+
+    # Same inputs, same stopping point
+    rerun = DeterministicLogger()
+    _loop(FadingRewardEnvironment(rewarded_episodes=6), rerun, ConvergenceMonitor(window=3)).train(100, 20)
+    assert rerun.export() == records
+
+
+def test_stopped_log_replays_exactly():
+    env = SyntheticEnvironment(8, 20)
+    logger = DeterministicLogger()
+    _loop(env, logger, ConvergenceMonitor(window=2)).train(episodes=50, max_steps_per_episode=20)
+
+    records = logger.export()
+    assert "early_stop" in records[-1]
+
+    # Re-execute every episode with the policy each one was acted with
+    policy = SyntheticPolicy()
+    for record in records:
+        state = env.reset()
+        replayed = []
+        for logged in record["episode_trace"]:
+            action = logged["action"] if logged["mode"] == "EXPLORE" else policy.select_action(state)
+            next_state, reward, _, _ = env.step(action)
+            replayed.append({"state": state, "action": action, "reward": reward, "next_state": next_state})
+            state = next_state
+        assert first_difference(record["episode_trace"], replayed) is None
+        policy.restore(record["policy_snapshot"])
+
+
+def test_online_mode_stops_too():
+    logger = DeterministicLogger()
+    loop = _loop(SyntheticEnvironment(8, 20), logger, ConvergenceMonitor(window=3))
+
+    loop.train_online(episodes=100, max_steps_per_episode=20, chunk_size=8)
+
+    final = [record for record in logger.export() if record["final"]]
+    assert len(final) < 100
+    assert final[-1]["early_stop"]["reason"] == "converged"
+
+
+def test_changing_policy_runs_every_episode():
+    env = StressEnvironment(n_states=16, episode_length=20)
+    env.set_reward_mode("contradictory")
+    logger = DeterministicLogger()
+    loop = _loop(env, logger, ConvergenceMonitor(window=3))
+
+    loop.train(episodes=30, max_steps_per_episode=20)
+
+    assert len(logger.export()) == 30
+    assert loop.stop_decision is None
+
+
+def test_snapshot_without_values_table_is_rejected():
+    class CountingPolicy(SyntheticPolicy):
+        def snapshot(self):
+            return {"action_values": {"WAIT": len(self.visits)}}
+
+    loop = LearningLoop(SyntheticEnvironment(8, 20), CountingPolicy(), Learner(), ExplorationStrategy(),
+                        DeterministicLogger(), convergence_monitor=ConvergenceMonitor(window=1))
+
+    with pytest.raises(ValueError, match="values"):
+        loop.train(episodes=5, max_steps_per_episode=20)
+
+
+def test_window_must_be_positive():
+    with pytest.raises(ValueError):
+        ConvergenceMonitor(window=0)
@@ -0,0 +1,114 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from learning.exploration import CountBasedExploration, ExplorationStrategy
+from learning.learner import Learner
+from learning.learning_loop import LearningLoop
+from learning.state_encoding import CategoricalBins, StateEncoder, UniformBins
+from utils.logger import DeterministicLogger
+
+STATE = {"current_step": 0, "observed_signal": 0.5, "previous_action": "WAIT", "accumulated_reward": 0.0}
+
+
+def _encoder(n_states):
+    return StateEncoder({"observed_signal": UniformBins(0.0, 1.0, n_states), "previous_action": CategoricalBins()})
+
+
+def _step(strategy, step, state=STATE, exploit_action="WAIT"):
+    """One decision as EpisodeRunner makes it; returns the mode and action."""
+    mode = strategy.decide(state, step)
+    action = strategy.explore_action(state) if mode == "EXPLORE" else exploit_action
+    strategy.record_action(state, action)
+    return mode, action
+
+
+def _steps_to_reward(exploration, n_states, target=1.0, max_episodes=200):
+    """Environment steps until one episode earns at least target."""
+    env = SyntheticEnvironment(n_states, 2 * n_states)
+    logger = DeterministicLogger()
+    loop = LearningLoop(env, SyntheticPolicy(), Learner(), exploration, logger)
+    steps = 0
+    for _ in range(max_episodes):
+        loop.train(episodes=1, max_steps_per_episode=2 * n_states)
+        trace = logger.records[-1]["episode_trace"]
+        steps += len(trace)
+        if sum(transition["reward"] for transition in trace) >= target:
+            return steps
+    return None
+
+
+def test_tries_least_tried_action_then_exploits():
+    strategy = CountBasedExploration(exploration_bonus=0.0)
+
+    chosen = []
+    for step in range(4):
+        mode, action = _step(strategy, step)
+        chosen.append(action if mode == "EXPLORE" else mode)
+
+    assert chosen == ["WAIT", "EXPLORE", "COMMIT", "EXPLOIT"]
+
+
+def test_exploit_steps_are_counted():
+    strategy = CountBasedExploration(exploration_bonus=1.0)
+    for step in range(200):
+        _step(strategy, step, exploit_action="COMMIT")
+
+    counts = strategy.checkpoint()["action_counts"][0][1]
+    assert sum(counts) == 200
+    # Exploiting COMMIT makes it the most tried; the others are retried rarely
+    assert counts[2] == max(counts)
+    assert strategy.explore_action(STATE) != "COMMIT"
+
+
+def test_runner_reports_every_executed_action():
+    strategy = CountBasedExploration()
+    logger = DeterministicLogger()
+    LearningLoop(SyntheticEnvironment(8, 20, typed=True), SyntheticPolicy(typed=True), Learner(), strategy,
+                 logger).train(episodes=3, max_steps_per_episode=20)
+
+    assert sum(sum(counts) for counts in strategy.action_counts.values()) == 60
+
+
+def test_retries_thin_out_logarithmically():
+    strategy = CountBasedExploration(exploration_bonus=1.0)
+    for step in range(1000):
+        _step(strategy, step)
+
+    # Exploiting keeps WAIT ahead; the others are tried about ln(1000) ~ 7 times
+    wait, explore, commit = strategy.checkpoint()["action_counts"][0][1]
+    assert wait == 1000 - explore - commit
+    assert 6 <= explore <= 8 and 6 <= commit <= 8
+
+
+def test_reaches_reward_in_fewer_steps_than_fixed_exploration():
+    for n_states in (8, 16):
+        count_based = _steps_to_reward(CountBasedExploration(state_encoder=_encoder(n_states)), n_states)
+        fixed = _steps_to_reward(ExplorationStrategy(state_encoder=_encoder(n_states)), n_states)
+
+        assert count_based is not None
+        assert fixed is None or count_based < fixed
+
+
+def test_checkpoint_round_trips_through_json():
+    strategy = CountBasedExploration(state_encoder=_encoder(8))
+    for step in range(5):
+        _step(strategy, step)
+
+    restored = CountBasedExploration(state_encoder=_encoder(8))
+    restored.restore(json.loads(json.dumps(strategy.checkpoint())))
+
+    assert restored.checkpoint() == strategy.checkpoint()
+    assert restored.decide(STATE, 5) == strategy.decide(STATE, 5)
+    assert restored.explore_action(STATE) == strategy.explore_action(STATE)
+
+
+def test_bonus_must_be_non_negative():
+    with pytest.raises(ValueError):
+        CountBasedExploration(exploration_bonus=-1.0)
@@ -0,0 +1,164 @@
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from execution.decision import DecisionEngine
+from execution.executor import Executor
+
+
+class SlowPolicy(SyntheticPolicy):
+    def __init__(self, delay_seconds):
+        super().__init__()
+        self.delay_seconds = delay_seconds
+
+    def select_action(self, state):
+        time.sleep(self.delay_seconds)
+        return "COMMIT"
+
+
+STATE = SyntheticEnvironment(8, 10).reset()
+
+
+def test_without_deadline_decisions_are_unchanged():
+    engine = DecisionEngine()
+
+    assert engine.decide(SyntheticPolicy(), STATE) == {"action": "WAIT", "confidence": 0.0}
+    assert engine.slo_report()["deadline_decisions"] == 0
+
+
+def test_late_lookup_returns_marked_fallback_on_time():
+    engine = DecisionEngine(workers=2)
+
+    start = time.perf_counter()
+    decision = engine.decide(SlowPolicy(0.5), STATE, deadline_seconds=0.02)
+    elapsed = time.perf_counter() - start
+
+    assert decision == {"action": "WAIT", "confidence": 0.0, "fallback": True}
+    assert elapsed < 0.25
+    assert engine.slo_report() == {"deadline_decisions": 1, "slo_misses": 1, "miss_rate": 1.0}
+    engine.close()
+
+
+def test_lookup_within_budget_is_used():
+    engine = DecisionEngine(deadline_seconds=1.0)
+
+    decision = engine.decide(SlowPolicy(0.0), STATE)
+
+    assert decision == {"action": "COMMIT", "confidence": 0.0, "fallback": False}
+    assert engine.slo_report()["slo_misses"] == 0
+    engine.close()
+
+
+def test_engine_deadline_applies_through_executor():
+    engine = DecisionEngine(deadline_seconds=0.02, fallback_action="EXPLORE", workers=4)
+    executor = Executor(SyntheticEnvironment(8, 10), engine, SlowPolicy(0.2))
+
+    result = executor.run_step(STATE)
+
+    assert result["decision"]["fallback"] is True
+    assert result["decision"]["action"] == "EXPLORE"
+    engine.close()
+
+
+def test_fallback_is_a_copy():
+    engine = DecisionEngine(workers=1)
+    first = engine.decide(SlowPolicy(0.2), STATE, deadline_seconds=0.01)
+    first["action"] = "COMMIT"
+
+    assert engine.fallback["action"] == "WAIT"
+    engine.close()
+
+
+def test_busy_workers_do_not_delay_later_decisions():
+    engine = DecisionEngine(deadline_seconds=0.02, workers=1)
+    engine.decide(SlowPolicy(0.5), STATE)
+
+    # The only worker is still on the abandoned lookup: answer at once
+    start = time.perf_counter()
+    decision = engine.decide(SlowPolicy(0.0), STATE)
+    elapsed = time.perf_counter() - start
+
+    assert decision["fallback"] is True
+    assert elapsed < 0.02
+    assert engine.slo_report()["slo_misses"] == 2
+
+    # Once it finishes, lookups run again
+    time.sleep(0.6)
+    assert engine.decide(SlowPolicy(0.0), STATE)["fallback"] is False
+    engine.close()
+
+
+def test_back_to_back_decisions_within_budget_never_fall_back():
+    engine = DecisionEngine(deadline_seconds=1.0, workers=1)
+    policy = SyntheticPolicy()
+    interval = sys.getswitchinterval()
+    # Frequent thread switches widen any gap between a lookup finishing
+    # and its worker counting as idle
+    sys.setswitchinterval(1e-6)
+    try:
+        decisions = [engine.decide(policy, STATE) for _ in range(2000)]
+    finally:
+        sys.setswitchinterval(interval)
+    engine.close()
+
+    assert engine.slo_report()["slo_misses"] == 0
+    assert not any(decision["fallback"] for decision in decisions)
+
+
+def test_stuck_lookup_does_not_block_interpreter_exit():
+    script = (
+        "import sys, time; sys.path.insert(0, {root!r})\n"
+        "from execution.decision import DecisionEngine\n"
+        "class Stuck:\n"
+        "    def select_action(self, state): time.sleep(30)\n"
+        "    def get_confidence(self, state): return 0.0\n"
+        "print(DecisionEngine(deadline_seconds=0.01).decide(Stuck(), None)['fallback'])\n"
+    ).format(root=str(PROJECT_ROOT))
+
+    start = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, timeout=20)
+
+    assert completed.stdout.strip() == "True"
+    assert time.perf_counter() - start < 10
+
+
+def test_concurrent_decisions_are_all_counted():
+    engine = DecisionEngine(deadline_seconds=1.0, workers=4)
+    policy = SlowPolicy(0.001)
+
+    def decide_many():
+        for _ in range(25):
+            engine.decide(policy, STATE)
+
+    threads = [threading.Thread(target=decide_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert engine.slo_report()["deadline_decisions"] == 200
+    engine.close()
+
+
+def test_lookup_errors_propagate():
+    class BrokenPolicy(SyntheticPolicy):
+        def select_action(self, state):
+            raise KeyError("missing")
+
+    with pytest.raises(KeyError):
+        DecisionEngine(deadline_seconds=1.0).decide(BrokenPolicy(), STATE)
+
+
+def test_deadline_must_be_positive():
+    with pytest.raises(ValueError):
+        DecisionEngine(deadline_seconds=0)
+    with pytest.raises(ValueError):
+        DecisionEngine().decide(SyntheticPolicy(), STATE, deadline_seconds=-1.0)
@@ -0,0 +1,78 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from learning.checkpoints import CheckpointStore
+from learning.divergence import DivergenceBisector, bisect_divergence
+from learning.exploration import ExplorationStrategy
+from learning.learner import Learner
+from learning.learning_loop import LearningLoop
+from run import run_replay
+from utils.logger import DeterministicLogger, JsonLinesLogger
+
+EPISODES = 64
+
+
+class RegressedPolicy(SyntheticPolicy):
+    """Stands in for a build whose tie-breaking changed once the table filled up."""
+
+    def select_action(self, state):
+        if sum(self.visits.values()) < 300:
+            return super().select_action(state)
+        values = self.values.get(self._key(state), {})
+        return max(("COMMIT", "EXPLORE", "WAIT"), key=lambda action: values.get(action, 0.0))
+
+
+def _loop(policy, store=None, every=None):
+    return LearningLoop(SyntheticEnvironment(16, 12), policy, Learner(), ExplorationStrategy(),
+                        DeterministicLogger(), checkpoint_store=store,
+                        checkpoint_every=every)
+
+
+def _record(store=None, every=None):
+    loop = _loop(SyntheticPolicy(), store, every)
+    loop.train(episodes=EPISODES, max_steps_per_episode=12)
+    return loop.replay_logger.export()
+
+
+@pytest.mark.parametrize("use_checkpoints", [False, True])
+def test_bisection_matches_linear_scan_in_log_probes(use_checkpoints):
+    store = CheckpointStore() if use_checkpoints else None
+    records = _record(store, 8 if use_checkpoints else None)
+
+    def make_loop():
+        return _loop(RegressedPolicy())
+
+    linear = DivergenceBisector(make_loop, records, store)
+    expected = next(episode_id for episode_id in range(EPISODES) if linear.probe(episode_id))
+
+    bisector = DivergenceBisector(make_loop, records, store)
+    result = bisector.bisect()
+
+    assert 0 < expected < EPISODES - 1
+    assert result["episode_id"] == expected
+    assert result["expected_action"] != result["actual_action"]
+    assert len(result["probes"]) <= 7
+
+
+def test_identical_build_reports_no_divergence():
+    records = _record()
+
+    assert bisect_divergence(lambda: _loop(SyntheticPolicy()), records) is None
+
+
+def test_cli_bisect_exits_nonzero_on_divergence(tmp_path, capsys):
+    log_path = str(tmp_path / "log.jsonl")
+    LearningLoop(SyntheticEnvironment(), SyntheticPolicy(), Learner(), ExplorationStrategy(),
+                 JsonLinesLogger(log_path)).train(episodes=EPISODES, max_steps_per_episode=12)
+    arguments = ["--bisect", "--log", log_path,
+                 "--environment", "benchmarks.synthetic:SyntheticEnvironment"]
+
+    assert run_replay.main(arguments + ["--policy", "benchmarks.synthetic:SyntheticPolicy"]) == 0
+    assert run_replay.main(arguments + ["--policy", "test_divergence:RegressedPolicy"]) == 1
+    assert "First divergent episode" in capsys.readouterr().out
@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from intelligence.fusion.fusion_rules import FusionError, fuse
+from intelligence.fusion.guards import fuse_batch, fuse_pairs, plan_fusion
+from intelligence.semantics.signals import Provenance, Signal, SignalType
+
+
+def _signal(signal_type, severity=3, confidence=0.8, uncertainty=0.2):
+    return Signal(signal_type, Provenance.SENSOR, severity, confidence, uncertainty)
+
+
+def test_plan_partitions_by_type_and_reports_bad_ranges():
+    batch = [
+        _signal(SignalType.OBSERVATION),
+        _signal(SignalType.ASSERTION),
+        _signal(SignalType.OBSERVATION, confidence=1.5),
+        _signal(SignalType.CONTRADICTION, uncertainty=float("nan")),
+        _signal(SignalType.OBSERVATION, severity=11),
+        _signal(SignalType.OBSERVATION, severity=7),
+        "not a signal",
+    ]
+
+    plan = plan_fusion(batch)
+    report = plan.report()
+
+    assert plan.groups == {SignalType.OBSERVATION: [0, 5], SignalType.ASSERTION: [1]}
+    assert report["reasons"] == {
+        "confidence_out_of_range": 1, "uncertainty_out_of_range": 1,
+        "severity_out_of_range": 1, "not_a_signal": 1,
+    }
+    assert [rejection["index"] for rejection in report["rejections"]] == [2, 3, 4, 6]
+    assert report["rejections"][0]["provenance"] == "Provenance.SENSOR"
+
+
+def test_non_numeric_ranges_are_rejected_not_raised():
+    batch = [
+        _signal(SignalType.OBSERVATION, confidence=None),
+        _signal(SignalType.OBSERVATION, uncertainty="0.2"),
+        _signal(SignalType.OBSERVATION),
+    ]
+
+    plan = plan_fusion(batch)
+
+    assert plan.groups == {SignalType.OBSERVATION: [2]}
+    assert plan.report()["reasons"] == {"confidence_not_numeric": 1, "uncertainty_not_numeric": 1}
+
+
+def test_fuse_batch_matches_sequential_fuse_per_type():
+    batch = [_signal(list(SignalType)[i % 3], severity=i % 11, confidence=(i % 9) / 10) for i in range(30)]
+
+    fused, report = fuse_batch(batch)
+
+    for signal_type in SignalType:
+        group = [signal for signal in batch if signal.signal_type is signal_type]
+        expected = group[0]
+        for signal in group[1:]:
+            expected = fuse(expected, signal)
+        assert fused[signal_type] == expected
+    assert report["rejected"] == 0 and report["accepted"] == 30
+
+
+def test_fuse_pairs_rejects_instead_of_raising():
+    observation, assertion = _signal(SignalType.OBSERVATION), _signal(SignalType.ASSERTION)
+    pairs = [(observation, observation), (observation, assertion), (assertion, _signal(SignalType.ASSERTION, severity=-1))]
+
+    results, report = fuse_pairs(pairs)
+
+    assert results[0] == fuse(observation, observation) and results[1:] == [None, None]
+    assert [(r["reason"], r["side"]) for r in report["rejections"]] == [
+        ("incompatible_types", "pair"), ("severity_out_of_range", "b"),
+    ]
+    with pytest.raises(FusionError):
+        fuse(observation, assertion)
@@ -0,0 +1,93 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from learning.instrumentation import Instrumentation, STAGES, percentile
+from learning.learning_loop import LearningLoop
+from learning.learner import Learner
+from learning.exploration import ExplorationStrategy
+from utils.logger import DeterministicLogger
+
+
+class CountingEnv:
+    def reset(self):
+        self.step_count = 0
+        return {"current_step": 0, "observed_signal": 1.0, "previous_action": "WAIT", "accumulated_reward": 0.0}
+
+    def step(self, action):
+        self.step_count += 1
+        reward = 1.0 if action == "COMMIT" else 0.0
+        next_state = {
+            "current_step": self.step_count,
+            "observed_signal": 1.0,
+            "previous_action": action,
+            "accumulated_reward": 0.0,
+        }
+        return next_state, reward, self.step_count >= 4, {}
+
+
+class TablePolicy:
+    def __init__(self):
+        self.totals = {}
+
+    def select_action(self, state):
+        key = str(sorted(state.items()))
+        values = self.totals.get(key, {})
+        return max(["WAIT", "EXPLORE", "COMMIT"], key=lambda a: values.get(a, 0.0))
+
+    def update(self, state, action, reward):
+        values = self.totals.setdefault(str(sorted(state.items())), {})
+        values[action] = values.get(action, 0.0) + reward
+
+    def snapshot(self):
+        return {key: dict(values) for key, values in self.totals.items()}
+
+
+class RecordingHook:
+    def __init__(self):
+        self.records = []
+
+    def on_episode(self, record):
+        self.records.append(record)
+
+
+def _train(instrumentation=None):
+    logger = DeterministicLogger()
+    loop = LearningLoop(
+        CountingEnv(), TablePolicy(), Learner(), ExplorationStrategy(), logger,
+        instrumentation=instrumentation
+    )
+    loop.train(episodes=5, max_steps_per_episode=10)
+    return logger.export()
+
+
+def test_instrumentation_does_not_change_outputs():
+    assert _train(Instrumentation()) == _train()
+
+
+def test_report_counts_every_stage_call():
+    hook = RecordingHook()
+    instrumentation = Instrumentation(hooks=[hook])
+    _train(instrumentation)
+
+    report = instrumentation.report()
+
+    assert report["episodes"] == 5
+    assert report["steps"] == 20
+    assert report["stages"]["environment.step"]["calls"] == 20
+    assert report["stages"]["replay_logger.log"]["calls"] == 5
+    assert set(report["stages"]) == set(STAGES)
+    assert [r["episode_id"] for r in hook.records] == [0, 1, 2, 3, 4]
+
+
+def test_percentile_is_nearest_rank():
+    assert percentile([1, 2, 3, 4, 5], 0.5) == 3
+    assert percentile(list(range(1, 8)), 0.9) == 7
+    assert percentile(list(range(1, 8)), 0.5) == 4
+    assert percentile(list(range(1, 11)), 0.7) == 7
+    assert percentile(list(range(1, 101)), 0.99) == 99
+    assert percentile([4], 0.0) == 4
+    assert percentile([1, 2, 3], 1.0) == 3
+    assert percentile([], 0.5) == 0.0
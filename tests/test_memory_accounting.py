@@ -0,0 +1,55 @@
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from explainability.traces import DecisionTrace
+from learning.exploration import ExplorationStrategy
+from learning.instrumentation import AllocationProfiler, Instrumentation
+from learning.learner import Learner
+from learning.learning_loop import LearningLoop
+from uncertainty.uncertainty import UncertaintyModel
+from utils.logger import DeterministicLogger
+from utils.memory import MemoryAccountant, deep_sizeof
+
+
+def test_deep_sizeof_counts_nested_and_shared_once():
+    shared = ["x" * 1000]
+    assert deep_sizeof({"a": shared, "b": shared}) < deep_sizeof({"a": shared, "b": ["y" * 1000]})
+    assert deep_sizeof([shared]) > 1000
+
+
+def test_accountant_reports_growth_slopes_as_json():
+    accountant = MemoryAccountant(every_episodes=2)
+    loop = LearningLoop(
+        SyntheticEnvironment(16, 20), SyntheticPolicy(), Learner(), ExplorationStrategy(),
+        DeterministicLogger(), instrumentation=Instrumentation(hooks=[accountant])
+    )
+    accountant.register_learning_loop(loop, trace=DecisionTrace(), uncertainty_model=UncertaintyModel())
+
+    loop.train(episodes=10, max_steps_per_episode=20)
+    report = json.loads(json.dumps(accountant.report()))
+
+    assert len(report["samples"]) == 5
+    assert report["samples"][-1]["components"]["replay_logger.records"]["elements"] == 10
+    assert report["slopes"]["replay_logger.records"]["bytes_per_step"] > 0
+    assert report["slopes"]["decision_trace.trace"]["bytes_per_step"] == 0
+
+
+def test_allocation_profiler_attributes_stage_bytes():
+    profiler = AllocationProfiler()
+    loop = LearningLoop(
+        SyntheticEnvironment(16, 20), SyntheticPolicy(), Learner(), ExplorationStrategy(),
+        DeterministicLogger(), instrumentation=profiler
+    )
+    try:
+        loop.train(episodes=3, max_steps_per_episode=20)
+    finally:
+        profiler.stop()
+
+    report = profiler.report()
+    assert len(report["allocations"]["episodes"]) == 3
+    assert report["allocations"]["stage_bytes"]["policy.snapshot"] > 0
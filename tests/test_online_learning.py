@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from learning.exploration import ExplorationStrategy
+from learning.learner import Learner
+from learning.learning_loop import LearningLoop
+from learning.replay import join_frames
+from stress_tests.scale import StressEnvironment
+from utils.logger import DeterministicLogger
+
+
+def _loop(logger):
+    return LearningLoop(
+        SyntheticEnvironment(8, 30), SyntheticPolicy(), Learner(), ExplorationStrategy(), logger
+    )
+
+
+def test_update_policy_is_a_fold_of_update_transition():
+    logger = DeterministicLogger()
+    batch = _loop(logger)
+    batch.train(episodes=4, max_steps_per_episode=30)
+
+    policy = SyntheticPolicy()
+    learner = Learner()
+    for record in logger.export():
+        for transition in record["episode_trace"]:
+            learner.update_transition(policy, transition)
+
+    assert policy.snapshot() == batch.policy.snapshot()
+
+
+def test_train_online_matches_train_when_trajectories_match():
+    def loop(logger):
+        # Always exploring picks the same actions whatever the policy has
+        # learned, so both modes see the same transitions; the rewards
+        # alternate sign, so the policy table is far from trivial
+        environment = StressEnvironment(n_states=8, episode_length=30)
+        environment.set_reward_mode("contradictory")
+        return LearningLoop(environment, SyntheticPolicy(), Learner(),
+                            ExplorationStrategy(min_visits_required=10 ** 9), logger)
+
+    batch_logger, online_logger = DeterministicLogger(), DeterministicLogger()
+    batch, online = loop(batch_logger), loop(online_logger)
+    batch.train(episodes=4, max_steps_per_episode=30)
+    online.train_online(episodes=4, max_steps_per_episode=30, chunk_size=7)
+
+    batch_records, online_records = batch_logger.export(), join_frames(online_logger.export())
+    assert [r["episode_trace"] for r in online_records] == [r["episode_trace"] for r in batch_records]
+    assert any(value != 0.0 for values in batch.policy.values.values() for value in values.values())
+    assert online.policy.snapshot() == batch.policy.snapshot()
+    assert [r["policy_snapshot"] for r in online_records] == [r["policy_snapshot"] for r in batch_records]
+
+
+def test_online_frames_are_bounded_and_reassemble():
+    logger = DeterministicLogger()
+    loop = _loop(logger)
+    loop.train_online(episodes=3, max_steps_per_episode=30, chunk_size=7)
+
+    records = logger.export()
+    assert all(len(r["episode_trace"]) <= 7 for r in records)
+    assert [r["frame"] for r in records if r["episode_id"] == 0] == [0, 1, 2, 3, 4]
+
+    episodes = join_frames(records)
+    assert [len(e["episode_trace"]) for e in episodes] == [30, 30, 30]
+    assert episodes[-1]["policy_snapshot"] == loop.policy.snapshot()
+
+    rerun = DeterministicLogger()
+    _loop(rerun).train_online(episodes=3, max_steps_per_episode=30, chunk_size=7)
+    assert rerun.export() == records
@@ -0,0 +1,80 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import LatencyEnvironment, SyntheticEnvironment, SyntheticPolicy
+from execution.decision import DecisionEngine
+from execution.executor import Executor
+from run import run_parallel_execution
+
+
+class RecordingEnvironment(SyntheticEnvironment):
+    def __init__(self, n_states, episode_length):
+        super().__init__(n_states, episode_length)
+        self.steps = []
+
+    def step(self, action):
+        next_state, reward, done, info = super().step(action)
+        self.steps.append((action, reward, next_state))
+        return next_state, reward, done, info
+
+
+def _environments():
+    return [RecordingEnvironment(n_states, length) for n_states, length in ((4, 10), (8, 20), (16, 30))]
+
+
+def test_each_environment_matches_a_sequential_run():
+    environments = _environments()
+    sequential = _environments()
+    policy = SyntheticPolicy()
+
+    report = run_parallel_execution.run(environments, policy, max_steps=25)
+    expected = [
+        run_parallel_execution.run_environment(Executor(environment, DecisionEngine(), policy), 25)
+        for environment in sequential
+    ]
+
+    for result, single, environment, alone in zip(report["environments"], expected, environments, sequential):
+        assert environment.steps == alone.steps
+        assert {name: result[name] for name in single} == single
+    assert [r["environment"] for r in report["environments"]] == [0, 1, 2]
+    assert [r["steps"] for r in report["environments"]] == [10, 20, 25]
+    assert [r["capped"] for r in report["environments"]] == [False, False, True]
+    assert report["steps"] == 55
+    assert report["steps_per_second"] > 0
+
+
+def test_per_environment_caps():
+    environments = [SyntheticEnvironment(8, 50) for _ in range(3)]
+
+    report = run_parallel_execution.run(environments, SyntheticPolicy(), max_steps=[5, 10, 15])
+
+    assert [r["steps"] for r in report["environments"]] == [5, 10, 15]
+    with pytest.raises(ValueError):
+        run_parallel_execution.run(environments, SyntheticPolicy(), max_steps=[5, 10])
+
+
+def test_decision_engine_is_shared_by_all_environments():
+    engine = DecisionEngine(deadline_seconds=1.0, workers=4)
+    environments = [SyntheticEnvironment(8, 10) for _ in range(4)]
+
+    report = run_parallel_execution.run(environments, SyntheticPolicy(), decision_engine=engine)
+    engine.close()
+
+    assert report["steps"] == 40
+    assert engine.slo_report()["deadline_decisions"] == 40
+
+
+def test_slow_environments_overlap():
+    def environments():
+        return [LatencyEnvironment(SyntheticEnvironment(8, 10), 0.01) for _ in range(8)]
+
+    sequential = run_parallel_execution.run(environments(), SyntheticPolicy(), workers=1)
+    concurrent = run_parallel_execution.run(environments(), SyntheticPolicy())
+
+    assert concurrent["steps"] == sequential["steps"] == 80
+    assert concurrent["steps_per_second"] > 3 * sequential["steps_per_second"]
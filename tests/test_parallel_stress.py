@@ -0,0 +1,91 @@
+import sys
+import time
+from multiprocessing import get_all_start_methods
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from stress_tests import parallel
+from stress_tests.parallel import run_tier_parallel
+from stress_tests.scale import MB, ScaleTier, run_scenario, run_tier
+
+TIER = ScaleTier("unit", total_steps=1_000, max_steps_per_episode=50,
+                 time_budget_seconds=60.0, memory_budget_bytes=64 * MB,
+                 retain_logs=False, samples=2)
+
+
+def test_parallel_report_matches_sequential_in_requested_order():
+    order = ["partial_observability", "adversarial_rewards", "contradictory_feedback"]
+
+    parallel = run_tier_parallel(TIER, order)
+    sequential = run_tier(TIER, order)
+
+    assert parallel["passed"], [r["violations"] for r in parallel["scenarios"]]
+    assert [r["scenario"] for r in parallel["scenarios"]] == order
+    assert all(r["status"] == "completed" for r in parallel["scenarios"])
+    assert [r["log_digest"] for r in parallel["scenarios"]] == [
+        r["log_digest"] for r in sequential["scenarios"]
+    ]
+    assert parallel["wall_seconds"] > 0
+
+
+def _address_space_bytes():
+    with open("/proc/self/status", encoding="utf-8") as handle:
+        for line in handle:
+            if line.startswith("VmSize:"):
+                return int(line.split()[1]) * 1024
+    pytest.skip("address-space size unavailable")
+
+
+def _misbehaving(bad_scenario, behaviour):
+    """run_scenario stand-in where one scenario hangs or over-allocates."""
+    def run(tier, scenario):
+        if scenario == bad_scenario:
+            if behaviour == "hang":
+                time.sleep(600)
+            bytearray(4 * 1024 * MB)
+        return run_scenario(tier, scenario)
+    return run
+
+
+# Forked workers inherit the patched module, so one scenario can misbehave
+fork_only = pytest.mark.skipif("fork" not in get_all_start_methods(), reason="needs the fork start method")
+
+
+@fork_only
+def test_timeout_fails_only_that_scenario(monkeypatch):
+    monkeypatch.setattr(parallel, "run_scenario", _misbehaving("adversarial_rewards", "hang"))
+    order = ["adversarial_rewards", "partial_observability", "contradictory_feedback"]
+
+    report = run_tier_parallel(TIER, order, timeout_seconds=3.0, start_method="fork")
+
+    hung, *others = report["scenarios"]
+    assert not report["passed"]
+    assert hung["status"] == "timeout"
+    assert "timed out" in hung["violations"][0]
+    assert [r["status"] for r in others] == ["completed", "completed"]
+    assert all(r["passed"] for r in others)
+
+
+@fork_only
+def test_memory_cap_fails_only_that_scenario(monkeypatch):
+    pytest.importorskip("resource")
+    monkeypatch.setattr(parallel, "run_scenario", _misbehaving("partial_observability", "allocate"))
+    cap = _address_space_bytes() + 512 * MB
+
+    report = run_tier_parallel(TIER, ["partial_observability", "contradictory_feedback"],
+                               memory_cap_bytes=cap, start_method="fork")
+
+    capped, other = report["scenarios"]
+    assert capped["status"] == "memory"
+    assert capped["violations"] == ["exceeded memory cap"]
+    assert other["status"] == "completed" and other["passed"]
+
+
+def test_workers_must_be_positive():
+    for workers in (0, -1):
+        with pytest.raises(ValueError):
+            run_tier_parallel(TIER, workers=workers)
@@ -0,0 +1,83 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from intelligence.fusion.fusion_rules import FusionError, fuse
+from intelligence.semantics.signals import Provenance, Signal, SignalType
+from intelligence.uncertainty.propagation import PropagationGraph
+
+
+def _signal(i, signal_type=SignalType.OBSERVATION):
+    return Signal(signal_type, Provenance.SENSOR, i % 11, 1.0 - (i % 10) / 20, (i % 9) / 10)
+
+
+def _regions(graph, regions=8, leaves=4):
+    """regions independent subtrees under one root."""
+    for r in range(regions):
+        for leaf in range(leaves):
+            graph.add_signal(f"r{r}.s{leaf}", _signal(r * leaves + leaf))
+        graph.add_fusion(f"r{r}.a", [f"r{r}.s0", f"r{r}.s1"])
+        graph.add_fusion(f"r{r}.b", [f"r{r}.s2", f"r{r}.s3"])
+        graph.add_fusion(f"r{r}", [f"r{r}.a", f"r{r}.b"])
+    graph.add_fusion("root", [f"r{r}" for r in range(regions)])
+
+
+def test_update_recomputes_only_the_affected_path():
+    graph = PropagationGraph()
+    _regions(graph)
+    graph.get("root")
+    assert graph.recomputations == 8 * 3 + 1
+
+    graph.recomputations = 0
+    assert graph.update("r5.s2", _signal(99)) == 3
+    assert graph.is_dirty("r5.b") and not graph.is_dirty("r5.a") and not graph.is_dirty("r4")
+
+    # A second update under a dirty path marks nothing new
+    assert graph.update("r5.s3", _signal(98)) == 0
+
+    root = graph.get("root")
+    assert graph.recomputations == 3
+
+    fresh = PropagationGraph()
+    _regions(fresh)
+    fresh.update("r5.s2", _signal(99))
+    fresh.update("r5.s3", _signal(98))
+    assert fresh.get("root") == root
+
+
+def test_reads_are_lazy_and_share_diamond_inputs():
+    graph = PropagationGraph()
+    for i in range(3):
+        graph.add_signal(f"s{i}", _signal(i, SignalType.CONTRADICTION))
+    graph.add_fusion("left", ["s0", "s1"])
+    graph.add_fusion("right", ["s1", "s2"])
+    graph.add_fusion("top", ["left", "right"])
+
+    assert graph.get("left") == fuse(graph.get("s0"), graph.get("s1"))
+    assert graph.recomputations == 1 and graph.is_dirty("top")
+
+    top = graph.get("top")
+    assert graph.recomputations == 3
+    assert top.uncertainty >= graph.get("left").uncertainty
+
+
+def test_incompatible_update_fails_on_read_and_stays_dirty():
+    graph = PropagationGraph()
+    graph.add_signal("a", _signal(1))
+    graph.add_signal("b", _signal(2))
+    graph.add_fusion("ab", ["a", "b"])
+    graph.get("ab")
+
+    graph.update("b", _signal(2, SignalType.ASSERTION))
+    with pytest.raises(FusionError):
+        graph.get("ab")
+    assert graph.is_dirty("ab")
+
+    with pytest.raises(ValueError, match="only leaf"):
+        graph.update("ab", _signal(3))
+    with pytest.raises(ValueError, match="Unknown input"):
+        graph.add_fusion("bad", ["a", "missing"])
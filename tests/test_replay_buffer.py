@@ -0,0 +1,128 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+np = pytest.importorskip("numpy")
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from learning.exploration import ExplorationStrategy
+from learning.learning_loop import LearningLoop
+from learning.replay_buffer import ReplayBuffer, ReplayLearner, StateInterner, SumTree, reward_errors
+from utils.logger import DeterministicLogger
+
+
+def _filled(capacity=8, added=12, seed=7):
+    buffer = ReplayBuffer(capacity, seed=seed)
+    for i in range(added):
+        buffer.add(i, "WAIT", float(i), i + 1, False)
+    return buffer
+
+
+def test_ring_overwrites_oldest():
+    buffer = _filled()
+    assert len(buffer) == 8
+    assert sorted(buffer.state_id.tolist()) == list(range(4, 12))
+
+
+def test_overwritten_states_are_released():
+    buffer, interner = ReplayBuffer(4, seed=0), StateInterner()
+    trace = [{"state": {"step": i}, "action": "WAIT", "reward": 0.0, "next_state": {"step": i + 1}}
+             for i in range(20)]
+
+    buffer.add_trace(trace, interner)
+
+    # Slots hold steps 16..19 and their successors 17..20
+    assert len(interner) == 5
+    assert sorted(interner.lookup(i)["step"] for i in set(buffer.state_id.tolist())) == [16, 17, 18, 19]
+    assert len(interner.states) <= 7
+
+
+def test_seed_log_is_capped():
+    buffer = ReplayBuffer(8, seed=1, seed_log_size=3)
+    buffer.add(0, "WAIT", 0.0, 1, False)
+    for _ in range(10):
+        buffer.sample_uniform(2)
+
+    assert [entry["draw"] for entry in buffer.seed_log] == [7, 8, 9]
+
+
+def test_sum_tree_find_respects_priorities():
+    tree = SumTree(4)
+    tree.update([0, 1, 2, 3], [1.0, 0.0, 3.0, 0.0])
+    assert tree.total == 4.0
+    assert tree.find([0.5, 1.5, 3.9]).tolist() == [0, 2, 2]
+
+
+def test_draws_reproducible_from_seed_stream():
+    a, b = _filled(), _filled()
+    for buffer in (a, b):
+        buffer.update_priorities([0, 1, 2], [5.0, 0.0, 1.0])
+
+    assert a.sample_prioritized(16)["indices"].tolist() == b.sample_prioritized(16)["indices"].tolist()
+    assert a.sample_uniform(16)["indices"].tolist() == b.sample_uniform(16)["indices"].tolist()
+    assert [entry["draw"] for entry in a.seed_log] == [0, 1]
+
+
+def test_replay_learner_is_deterministic():
+    def run():
+        policy = SyntheticPolicy()
+        learner = ReplayLearner(ReplayBuffer(256, seed=3), batch_size=16, replay_batches=2, prioritized=True)
+        LearningLoop(SyntheticEnvironment(8, 20), policy, learner, ExplorationStrategy(),
+                     DeterministicLogger()).train(episodes=5, max_steps_per_episode=20)
+        return policy.snapshot()
+
+    assert run() == run()
+
+
+def test_replayed_transitions_get_td_error_priorities():
+    buffer = ReplayBuffer(64, seed=5, alpha=1.0, epsilon=0.0)
+    learner = ReplayLearner(buffer, batch_size=16, prioritized=True)
+    states = [{"observed_signal": i / 10, "previous_action": "WAIT"} for i in range(7)]
+    trace = [{"state": states[i], "action": "WAIT", "reward": (i + 1) / 10, "next_state": states[i + 1]}
+             for i in range(6)]
+
+    learner.update_policy(SyntheticPolicy(), trace)
+
+    # New transitions enter at max priority 1.0; replayed ones drop to |error|
+    priorities = buffer.tree.get(range(6)).tolist()
+    assert any(priority != 1.0 for priority in priorities)
+    for slot, priority in enumerate(priorities):
+        assert priority in (1.0, buffer.reward[slot])
+
+
+def _mostly_zero_trace(length=100, rewarded=5):
+    states = [{"observed_signal": i / length, "previous_action": "WAIT"} for i in range(length + 1)]
+    return [{"state": states[i], "action": "WAIT", "reward": 1.0 if i < rewarded else 0.0,
+             "next_state": states[i + 1]} for i in range(length)]
+
+
+def test_zero_error_transitions_keep_a_share_of_prioritized_draws():
+    def zero_share(min_priority):
+        buffer = ReplayBuffer(128, seed=11)
+        learner = ReplayLearner(buffer, batch_size=100, replay_batches=20, prioritized=True,
+                                min_priority=min_priority)
+        learner.update_policy(SyntheticPolicy(), _mostly_zero_trace())
+        rewards = buffer.reward[buffer.sample_prioritized(2000)["indices"]]
+        return float((rewards == 0.0).mean())
+
+    # 95% of the trace earns nothing: with the floor those steps are still
+    # replayed most of the time, while the rewarded 5% are oversampled
+    floored = zero_share(0.1)
+    assert 0.5 < floored < 0.95
+    # Without it they all but vanish from replay
+    assert zero_share(0.0) < 0.05
+
+
+def test_error_fn_sets_the_priority_source():
+    buffer = ReplayBuffer(128, seed=11, alpha=1.0, epsilon=0.0)
+    learner = ReplayLearner(buffer, batch_size=100, prioritized=True, min_priority=0.0,
+                            error_fn=lambda policy, batch: 0.5 - reward_errors(policy, batch))
+    learner.update_policy(SyntheticPolicy(), _mostly_zero_trace())
+
+    priorities = set(buffer.tree.get(range(100)).tolist())
+    assert priorities <= {1.0, 0.5}
+    assert 0.5 in priorities
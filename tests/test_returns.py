@@ -0,0 +1,72 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+np = pytest.importorskip("numpy")
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from learning.exploration import ExplorationStrategy
+from learning.learning_loop import LearningLoop
+from learning.returns import (
+    ReturnLearner, discounted_reverse_cumsum, lambda_returns, n_step_returns, pad_traces
+)
+from utils.logger import DeterministicLogger
+
+
+def _reference_lambda(rewards, values, gamma, lam):
+    out = [0.0] * len(rewards)
+    following = 0.0
+    for t in reversed(range(len(rewards))):
+        next_value = values[t + 1] if t + 1 < len(rewards) else 0.0
+        following = rewards[t] + gamma * ((1 - lam) * next_value + lam * following)
+        out[t] = following
+    return out
+
+
+def _reference_n_step(rewards, values, gamma, n):
+    out = []
+    for t in range(len(rewards)):
+        g = sum(gamma ** k * rewards[t + k] for k in range(n) if t + k < len(rewards))
+        if t + n < len(rewards):
+            g += gamma ** n * values[t + n]
+        out.append(g)
+    return out
+
+
+def test_matches_reference_recursions():
+    rewards = [1.0, -2.0, 0.5, 3.0, 0.0, 1.5, -1.0]
+    values = [0.3, 0.1, -0.4, 0.9, 0.0, 0.2, 0.5]
+
+    assert np.allclose(lambda_returns([rewards], 0.9, 0.7, [values])[0], _reference_lambda(rewards, values, 0.9, 0.7))
+    assert np.allclose(n_step_returns([rewards], 0.9, 3, [values])[0], _reference_n_step(rewards, values, 0.9, 3))
+
+
+def test_long_traces_stay_finite_across_blocks():
+    rewards = np.ones((2, 20_000))
+    returns = discounted_reverse_cumsum(rewards, 0.5)
+
+    assert np.all(np.isfinite(returns))
+    assert np.allclose(returns[:, :100], 2.0)
+    assert returns[0, -1] == 1.0
+
+
+def test_padded_batch_respects_episode_ends():
+    traces = [[{"reward": 1.0}] * 3, [{"reward": 2.0}] * 1]
+    rewards, mask = pad_traces(traces)
+    returns = lambda_returns(rewards, 0.5, 1.0, mask=mask)
+
+    assert returns.tolist() == [[1.75, 1.5, 1.0], [2.0, 0.0, 0.0]]
+
+
+def test_return_learner_is_deterministic():
+    def run():
+        policy = SyntheticPolicy()
+        LearningLoop(SyntheticEnvironment(8, 20), policy, ReturnLearner(gamma=0.9, n=4),
+                     ExplorationStrategy(), DeterministicLogger()).train(episodes=4, max_steps_per_episode=20)
+        return policy.snapshot()
+
+    assert run() == run()
@@ -0,0 +1,103 @@
+import sys
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+pytest.importorskip("numpy")
+
+from intelligence.fusion.fusion_rules import fuse
+from intelligence.guarantees.invariants import InvariantMonitor, InvariantViolation, sample_mask
+from intelligence.semantics.signals import Provenance, Signal, SignalType
+
+
+def _signals(count, signal_type=SignalType.OBSERVATION):
+    provenances = list(Provenance)
+    return [
+        Signal(signal_type, provenances[i % 3], i % 11, (i % 10) / 10, (i % 7) / 7)
+        for i in range(count)
+    ]
+
+
+def overconfident_fuse(a, b):
+    # Breaks "confidence never increases" whenever the inputs differ
+    return replace(fuse(a, b), confidence=max(a.confidence, b.confidence))
+
+
+def test_live_fusion_passes_every_invariant():
+    monitor = InvariantMonitor(rate=1.0, batch_size=64, fuse_fn=fuse)
+    checked_fuse = monitor.monitored(fuse, source="test")
+    for signal_type in SignalType:
+        signals = _signals(200, signal_type)
+        for a, b in zip(signals, signals[1:]):
+            checked_fuse(a, b)
+
+    report = monitor.report()
+    assert report["checked"] == report["observed"] == 597
+    assert report["violations"] == [] and sum(report["counts"].values()) == 0
+
+
+def test_violations_carry_provenance_and_sampling_is_bounded():
+    monitor = InvariantMonitor(rate=0.1, batch_size=16)
+    checked_fuse = monitor.monitored(overconfident_fuse, source="ingest")
+    signals = _signals(1001)
+    for a, b in zip(signals, signals[1:]):
+        checked_fuse(a, b)
+
+    report = monitor.report()
+    violation = report["violations"][0]
+
+    assert report["observed"] == 1000 and report["checked"] == 100
+    assert report["counts"]["confidence_never_increases"] == 100
+    assert violation["source"] == "ingest"
+    assert violation["output_provenance"] == "+".join(violation["input_provenance"])
+    assert violation["record"] == 9
+
+
+def test_batch_and_single_observation_sample_the_same_records():
+    signals = _signals(301)
+    records = [((a, b), overconfident_fuse(a, b), i) for i, (a, b) in enumerate(zip(signals, signals[1:]))]
+
+    single, batched = InvariantMonitor(rate=0.03), InvariantMonitor(rate=0.03)
+    for inputs, output, source in records:
+        single.observe(inputs, output, source)
+    batched.observe_batch(records[:130])
+    batched.observe_batch(records[130:])
+
+    assert single.report() == batched.report()
+
+
+@pytest.mark.parametrize("rate", [0.001, 0.03, 0.1, 0.37, 1 / 3, 0.999, 1.0])
+def test_next_sampled_record_matches_sample_mask(rate):
+    # Long enough that every queried index has a sampled record after it
+    sampled = sample_mask(0, 6000, rate).nonzero()[0].tolist()
+    monitor = InvariantMonitor(rate=rate)
+
+    for index in range(0, 4000, 7):
+        expected = next(n for n in sampled if n >= index)
+        assert monitor._first_sample_from(index) == expected
+
+
+def test_strict_mode_raises_and_contradictions_must_add_uncertainty():
+    monitor = InvariantMonitor(rate=1.0, strict=True)
+    a, b = _signals(3, SignalType.CONTRADICTION)[1:]
+    flat = replace(fuse(a, b), uncertainty=max(a.uncertainty, b.uncertainty))
+
+    with pytest.raises(InvariantViolation, match="contradiction_increases_uncertainty"):
+        monitor.observe((a, b), flat)
+
+
+def test_strict_mode_raises_at_the_offending_fusion():
+    monitor = InvariantMonitor(rate=1.0, batch_size=1024, strict=True)
+    fuse_checked = monitor.monitored(overconfident_fuse)
+    same = _signals(1)[0]
+    a, b = _signals(3)[1:]
+
+    for _ in range(5):
+        fuse_checked(same, same)
+    with pytest.raises(InvariantViolation, match="record 5"):
+        fuse_checked(a, b)
+    assert monitor.observed == monitor.checked == 6
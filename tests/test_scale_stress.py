@@ -0,0 +1,49 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from stress_tests.scale import MB, ScaleTier, run_tier
+
+
+def test_small_tier_runs_every_scenario_within_budget():
+    tier = ScaleTier("unit", total_steps=3_000, max_steps_per_episode=50,
+                     time_budget_seconds=60.0, memory_budget_bytes=64 * MB,
+                     retain_logs=False, samples=3)
+
+    report = run_tier(tier)
+
+    assert report["passed"], [r["violations"] for r in report["scenarios"]]
+    for result in report["scenarios"]:
+        assert len(result["growth"]) == 3
+        assert result["determinism"] == "prefix"
+        last = result["growth"][-1]
+        assert last["exploration_visit_keys"] > 0
+        # Unretained logs still report how much was logged
+        assert last["replay_log_retained_records"] == 0
+        assert last["replay_log_transitions"] >= last["replay_log_records"] > 0
+        assert last["decision_trace_entries"] == result["episodes"]
+
+
+def test_runs_shorter_than_the_prefix_check_the_whole_log():
+    tier = ScaleTier("short", total_steps=500, max_steps_per_episode=50,
+                     time_budget_seconds=60.0, memory_budget_bytes=64 * MB,
+                     retain_logs=True, samples=2)
+
+    result = run_tier(tier, ["contradictory_feedback"])["scenarios"][0]
+
+    assert result["episodes"] == 10
+    assert result["determinism"] == "full_log"
+    assert result["passed"], result["violations"]
+
+
+def test_budget_violation_is_reported():
+    tier = ScaleTier("tight", total_steps=1_000, max_steps_per_episode=50,
+                     time_budget_seconds=60.0, memory_budget_bytes=1,
+                     retain_logs=True)
+
+    report = run_tier(tier, ["partial_observability"])
+
+    assert not report["passed"]
+    assert "peak memory" in report["scenarios"][0]["violations"][0]
@@ -0,0 +1,122 @@
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from intelligence.semantics.ingest import SignalReader, read_signals
+from intelligence.semantics.signals import Provenance, Signal, SignalType
+
+
+def _line(signal_type="observation", provenance="sensor", severity=3, confidence=0.8, uncertainty=0.2):
+    return json.dumps({
+        "signal_type": signal_type, "provenance": provenance, "severity": severity,
+        "confidence": confidence, "uncertainty": uncertainty
+    })
+
+
+def test_valid_records_become_signals(tmp_path):
+    path = tmp_path / "signals.jsonl"
+    path.write_text("\n".join([
+        _line(),
+        _line("CONTRADICTION", "SYSTEM", severity=9, confidence=0.3, uncertainty=0.7),
+        "",
+        _line("assertion", "human", severity=0, confidence=1, uncertainty=0),
+    ]) + "\n")
+
+    signals = list(read_signals(str(path)))
+
+    assert signals == [
+        Signal(SignalType.OBSERVATION, Provenance.SENSOR, 3, 0.8, 0.2),
+        Signal(SignalType.CONTRADICTION, Provenance.SYSTEM, 9, 0.3, 0.7),
+        Signal(SignalType.ASSERTION, Provenance.HUMAN, 0, 1.0, 0.0),
+    ]
+
+
+def test_invalid_records_are_reported_with_line_numbers():
+    lines = [
+        _line(),
+        "{not json",
+        _line(signal_type="rumour"),
+        _line(severity=11),
+        _line(confidence=float("nan")),
+        "[1, 2]",
+        _line(severity=2.5),
+        _line(uncertainty=-0.1),
+        _line(severity=10 ** 30),
+        _line(severity=7),
+    ]
+    reader = SignalReader(io.StringIO("\n".join(lines)))
+
+    signals = list(reader.iter_signals())
+    report = reader.report()
+
+    assert [signal.severity for signal in signals] == [3, 7]
+    assert report["records"] == 10
+    assert report["accepted"] == 2
+    assert report["rejected"] == 8
+    assert report["rejections"] == [
+        {"line": 2, "reason": "invalid_json"},
+        {"line": 6, "reason": "not_an_object"},
+        {"line": 3, "reason": "invalid_fields"},
+        {"line": 7, "reason": "invalid_fields"},
+        {"line": 9, "reason": "severity_out_of_range"},
+        {"line": 4, "reason": "severity_out_of_range"},
+        {"line": 5, "reason": "confidence_out_of_range"},
+        {"line": 8, "reason": "uncertainty_out_of_range"},
+    ]
+
+
+def test_malformed_lines_cannot_combine_into_records():
+    # Joined with a comma, these two halves would parse as one object
+    text = '{"signal_type": "observation", "provenance": "sensor"\n'
+    text += '"severity": 3, "confidence": 0.8, "uncertainty": 0.2}\n'
+    reader = SignalReader(io.StringIO(text + _line() + "\n"))
+
+    signals = list(reader.iter_signals())
+
+    assert len(signals) == 1
+    assert reader.report()["rejections"] == [
+        {"line": 1, "reason": "invalid_json"}, {"line": 2, "reason": "invalid_json"}
+    ]
+
+
+def test_chunk_size_does_not_change_the_result():
+    lines = [_line(severity=i % 12, confidence=(i % 10) / 9) for i in range(50)]
+    text = "\n".join(lines) + "\n"
+
+    results = []
+    for chunk_size in (1, 7, 50, 4096):
+        reader = SignalReader(io.StringIO(text), chunk_size=chunk_size)
+        signals = list(reader.iter_signals())
+        results.append((signals, sorted(r["line"] for r in reader.report()["rejections"])))
+
+    assert all(result == results[0] for result in results)
+    assert len(results[0][0]) == 46
+
+
+def test_batches_are_columnar_and_bounded_by_chunk():
+    text = "\n".join(_line(severity=i % 11) for i in range(10))
+    batches = list(SignalReader(io.StringIO(text), chunk_size=4).iter_batches())
+
+    assert [len(batch) for batch in batches] == [4, 4, 2]
+    assert list(batches[1].columns["line"]) == [5, 6, 7, 8]
+    assert list(batches[1].columns["severity"]) == [4, 5, 6, 7]
+
+
+def test_rejection_reports_are_capped_but_counted():
+    text = "\n".join("oops" for _ in range(20))
+    reader = SignalReader(io.StringIO(text), max_rejections=5)
+
+    assert list(reader.iter_signals()) == []
+    assert reader.report()["rejected"] == 20
+    assert len(reader.report()["rejections"]) == 5
+
+
+def test_chunk_size_must_be_positive():
+    with pytest.raises(ValueError):
+        SignalReader(io.StringIO(""), chunk_size=0)
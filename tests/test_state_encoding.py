@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticEnvironment
+from learning.exploration import ExplorationStrategy
+from learning.learner import Learner
+from learning.learning_loop import LearningLoop
+from learning.state_encoding import (
+    EncodedTablePolicy, QuantileBins, StateEncoder, TileCoder, UniformBins, default_binners
+)
+from utils.logger import DeterministicLogger
+
+
+def _state(signal, reward=0.0, action="WAIT"):
+    return {"current_step": 3, "observed_signal": signal, "previous_action": action, "accumulated_reward": reward}
+
+
+def test_bins_clamp_and_quantiles_split_evenly():
+    bins = UniformBins(0.0, 1.0, 4)
+    assert [bins.index(v) for v in (-5.0, 0.0, 0.3, 0.99, 1.0, 7.0)] == [0, 0, 1, 3, 3, 3]
+
+    quantiles = QuantileBins.fit(list(range(100)), 4)
+    assert quantiles.edges == [25, 50, 75]
+    assert [quantiles.index(v) for v in (0, 25, 60, 99)] == [0, 1, 2, 3]
+
+
+def test_encoder_ids_bounded_and_ignore_step():
+    encoder = StateEncoder(default_binners(bins=4))
+    ids = {encoder.encode(_state(s / 97, r, a)) for s in range(97) for r in (-9.0, 0.0, 9.0)
+           for a in ("WAIT", "COMMIT")}
+
+    assert ids <= set(range(encoder.size))
+    assert encoder.encode(_state(0.5)) == encoder.encode(dict(_state(0.5), current_step=900))
+
+
+def test_tile_coder_overlaps_neighbours():
+    coder = TileCoder({"observed_signal": UniformBins(0.0, 1.0, 4)}, tilings=4)
+    near = set(coder.features(_state(0.30))) & set(coder.features(_state(0.33)))
+    far = set(coder.features(_state(0.30))) & set(coder.features(_state(0.90)))
+
+    assert len(coder.features(_state(0.3))) == 4
+    assert 0 < len(near) <= 4 and not far
+    assert max(coder.features(_state(1.0))) < coder.size
+
+
+def test_exploration_counter_bounded_by_encoder():
+    encoder = StateEncoder(default_binners(bins=4))
+    exploration = ExplorationStrategy(state_encoder=encoder)
+    policy = EncodedTablePolicy(encoder)
+    LearningLoop(SyntheticEnvironment(64, 50), policy, Learner(), exploration,
+                 DeterministicLogger()).train(episodes=20, max_steps_per_episode=50)
+
+    assert len(exploration.state_visit_counter) <= encoder.size
+    assert len(policy.values) <= encoder.size
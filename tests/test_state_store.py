@@ -0,0 +1,100 @@
+import os
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from explainability.explain import Explainer
+from explainability.trace_store import TraceStore
+from learning.checkpoints import CheckpointStore
+from learning.exploration import ExplorationStrategy
+from learning.learner import Learner
+from learning.learning_loop import LearningLoop
+from run import run_replay
+from utils.logger import DeterministicLogger, JsonLinesLogger
+from utils.state_store import StateRefLogger, StateStore
+
+
+def _train(logger, checkpoints=None):
+    loop = LearningLoop(SyntheticEnvironment(16, 20), SyntheticPolicy(), Learner(), ExplorationStrategy(),
+                        logger, checkpoint_store=checkpoints,
+                        checkpoint_every=10 if checkpoints is not None else None)
+    loop.train(episodes=40, max_steps_per_episode=20)
+
+
+def test_shared_store_deduplicates_log_and_checkpoints(tmp_path):
+    plain_log, plain_checkpoints = tmp_path / "plain.jsonl", tmp_path / "plain_ckpt.jsonl"
+    _train(JsonLinesLogger(str(plain_log)), CheckpointStore(str(plain_checkpoints)))
+
+    states = StateStore(str(tmp_path / "states"))
+    log_path, checkpoint_path = tmp_path / "log.jsonl", tmp_path / "ckpt.jsonl"
+    logger = StateRefLogger(JsonLinesLogger(str(log_path)), states)
+    _train(logger, CheckpointStore(str(checkpoint_path), states))
+    states.close()
+
+    compacted = os.path.getsize(log_path) + os.path.getsize(checkpoint_path) + sum(
+        entry.stat().st_size for entry in (tmp_path / "states").iterdir()
+    )
+    assert compacted < 0.7 * (os.path.getsize(plain_log) + os.path.getsize(plain_checkpoints))
+    assert logger.export() == JsonLinesLogger(str(plain_log)).export()
+
+    exit_code = run_replay.main([
+        "--log", str(log_path), "--checkpoints", str(checkpoint_path),
+        "--states", str(tmp_path / "states"),
+        "--environment", "benchmarks.synthetic:SyntheticEnvironment",
+        "--policy", "benchmarks.synthetic:SyntheticPolicy",
+        "--start", "25", "--end", "27", "--max-steps", "20",
+    ])
+    assert exit_code == 0
+
+
+def test_ids_are_content_derived_and_torn_entries_ignored(tmp_path):
+    memory = StateStore()
+    stored = StateStore(str(tmp_path))
+    state = {"current_step": 1, "observed_signal": 0.5, "previous_action": "WAIT", "accumulated_reward": 0.0}
+
+    state_id = stored.put(state)
+    assert memory.put(dict(reversed(list(state.items())))) == state_id
+    assert stored.put({**state, "current_step": 1.0}) != state_id
+    stored.close()
+
+    with open(tmp_path / StateStore.INDEX_FILE, "ab") as handle:
+        handle.write(b"\x00" * 5)
+
+    reopened = StateStore(str(tmp_path))
+    assert len(reopened) == 2
+    assert reopened.get(state_id) == state
+    assert reopened.put({"new": True}) in reopened
+    reopened.close()
+    assert len(StateStore(str(tmp_path))) == 3
+
+
+def test_signed_zeros_get_their_own_ids_and_cache_is_bounded():
+    store = StateStore(max_cached_ids=2)
+    state = {"current_step": 0, "observed_signal": 0.0, "previous_action": "WAIT", "accumulated_reward": 0.0}
+    negative = {**state, "accumulated_reward": -0.0}
+
+    positive_id = store.put(state)
+    negative_id = store.put(negative)
+    assert negative_id != positive_id
+    assert store.put(0.0) != store.put(-0.0)
+    assert str(store.get(negative_id)["accumulated_reward"]) == "-0.0"
+    assert store.put(dict(state)) == positive_id
+    assert len(store._ids) == 2
+
+
+def test_trace_store_payloads_refer_to_shared_states(tmp_path):
+    states = StateStore()
+    store = TraceStore(str(tmp_path / "trace"), chunk_size=4, state_store=states)
+    state = {"current_step": 3, "observed_signal": 1.0, "previous_action": "WAIT", "accumulated_reward": 0.0}
+    explanation = Explainer().explain_decision(state, "COMMIT", 0.5, {"unseen_state_count": 0})
+
+    for _ in range(10):
+        store.append(explanation)
+    store.flush()
+
+    assert len(states) == 1
+    assert list(store.query(action="COMMIT")) == [explanation] * 10
+    assert '"state"' not in (tmp_path / "trace" / "chunk_000000.jsonl").read_text()
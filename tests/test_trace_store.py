@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from explainability.explain import Explainer
+from explainability.trace_store import TraceStore
+from explainability.traces import DecisionTrace
+
+
+def _explanation(step, action, confidence):
+    state = {
+        "current_step": step,
+        "observed_signal": 1.0,
+        "previous_action": "WAIT",
+        "accumulated_reward": 0.0,
+    }
+    return Explainer().explain_decision(state, action, confidence, {"unseen_state_count": 0})
+
+
+def _fill(trace):
+    actions = ["WAIT", "EXPLORE", "COMMIT"]
+    for step in range(25):
+        trace.record(_explanation(step, actions[step % 3], step / 25))
+
+
+def test_store_query_matches_in_memory_trace(tmp_path):
+    memory = DecisionTrace()
+    stored = DecisionTrace(store=TraceStore(str(tmp_path), chunk_size=4))
+    _fill(memory)
+    _fill(stored)
+
+    filters = {"action": "COMMIT", "confidence_range": (0.2, 0.8), "step_range": (0, 20)}
+
+    assert stored.query(**filters) == memory.query(**filters)
+    assert stored.export() == memory.export()
+
+
+def test_store_reopens_sealed_chunks(tmp_path):
+    trace = DecisionTrace(store=TraceStore(str(tmp_path), chunk_size=10))
+    _fill(trace)
+    trace.close()
+
+    reopened = TraceStore(str(tmp_path))
+
+    assert len(reopened) == 25
+    assert [c["rows"] for c in reopened.chunks] == [10, 10, 5]
+    assert [e["state"]["current_step"] for e in reopened.query(step_range=(22, 30))] == [22, 23, 24]
+
+
+def test_numpy_column_views(tmp_path):
+    np = pytest.importorskip("numpy")
+    store = TraceStore(str(tmp_path), chunk_size=10)
+    trace = DecisionTrace(store=store)
+    _fill(trace)
+    trace.close()
+
+    columns = store.to_numpy()
+
+    assert np.array_equal(columns["step"], np.arange(25))
+    assert columns["action"].tolist() == [i % 3 for i in range(25)]
@@ -0,0 +1,107 @@
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.synthetic import SyntheticEnvironment, SyntheticPolicy
+from core.action import Action, validate_action
+from core.state import State, to_json_value, validate_state
+from learning.checkpoints import CheckpointStore, replay_range
+from learning.exploration import ExplorationStrategy
+from learning.learner import Learner
+from learning.learning_loop import LearningLoop
+from learning.replay import ReplayEngine
+from utils.logger import DeterministicLogger, JsonLinesLogger
+from utils.state_store import StateRefLogger, StateStore
+
+
+def test_state_validates_once_and_reads_like_the_dict_form():
+    state = State(3, 0.25, "COMMIT", -1.5)
+    legacy = {"current_step": 3, "observed_signal": 0.25, "previous_action": "COMMIT", "accumulated_reward": -1.5}
+
+    assert state.previous_action is Action.COMMIT
+    assert state["previous_action"] == "COMMIT"
+    assert dict(state) == legacy and state == legacy and legacy == state
+    assert state.get("missing", 7) == 7 and "observed_signal" in state
+    assert State.from_dict(legacy) == state and hash(State.from_dict(legacy)) == hash(state)
+    validate_state(state)
+    validate_action(Action.WAIT)
+
+    with pytest.raises(ValueError, match="current_step"):
+        State(-1, 0.0, "WAIT", 0.0)
+    with pytest.raises(ValueError, match="Invalid action"):
+        State(0, 0.0, "JUMP", 0.0)
+    with pytest.raises(ValueError, match="accumulated_reward"):
+        State(0, 0.0, Action.WAIT, 11.0)
+
+
+def test_typed_run_matches_dict_run():
+    def train(typed):
+        logger = DeterministicLogger()
+        loop = LearningLoop(SyntheticEnvironment(16, 30, typed=typed), SyntheticPolicy(typed=typed),
+                            Learner(), ExplorationStrategy(), logger)
+        loop.train(episodes=20, max_steps_per_episode=30)
+        return logger.export(), loop.exploration
+
+    legacy, legacy_exploration = train(typed=False)
+    typed, typed_exploration = train(typed=True)
+
+    assert [record["policy_snapshot"] for record in typed] == [record["policy_snapshot"] for record in legacy]
+    for typed_record, legacy_record in zip(typed, legacy):
+        assert [(t["state"], str(t["action"]), t["reward"]) for t in typed_record["episode_trace"]] == \
+            [(t["state"], t["action"], t["reward"]) for t in legacy_record["episode_trace"]]
+
+    # Visit counts survive a JSON round trip of the State-keyed counter
+    restored = ExplorationStrategy()
+    restored.restore(json.loads(json.dumps(typed_exploration.checkpoint())))
+    assert restored.state_visit_counter == typed_exploration.state_visit_counter
+    assert sorted(typed_exploration.state_visit_counter.values()) == \
+        sorted(legacy_exploration.state_visit_counter.values())
+
+
+def test_state_serializes_with_field_names():
+    state = State(3, 0.25, "COMMIT", -1.5)
+
+    assert json.loads(json.dumps(to_json_value({"state": state}))) == {"state": state.to_dict()}
+
+
+@pytest.mark.parametrize("with_state_store", [False, True])
+def test_typed_run_logged_as_json_reloads_and_replays(tmp_path, with_state_store):
+    env = SyntheticEnvironment(8, 20, typed=True)
+    logger = JsonLinesLogger(str(tmp_path / "log.jsonl"))
+    store = StateStore(str(tmp_path / "states")) if with_state_store else None
+    LearningLoop(
+        env, SyntheticPolicy(typed=True), Learner(), ExplorationStrategy(),
+        StateRefLogger(logger, store) if store is not None else logger
+    ).train(episodes=6, max_steps_per_episode=20)
+
+    records = StateRefLogger(logger, store).export() if store is not None else logger.export()
+    assert records[0]["episode_trace"][0]["state"]["previous_action"] == "WAIT"
+
+    policy = SyntheticPolicy(typed=True)
+    engine = ReplayEngine(env, policy)
+    for record in records:
+        engine.replay(record)
+        policy.restore(record["policy_snapshot"])
+
+
+def test_typed_checkpoints_restore_state_keys(tmp_path):
+    def make_loop(logger, store=None):
+        return LearningLoop(
+            SyntheticEnvironment(8, 20, typed=True), SyntheticPolicy(typed=True), Learner(),
+            ExplorationStrategy(), logger, checkpoint_store=store, checkpoint_every=3 if store is not None else None
+        )
+
+    logger = JsonLinesLogger(str(tmp_path / "log.jsonl"))
+    path = str(tmp_path / "ckpt.jsonl")
+    original = make_loop(logger, CheckpointStore(path))
+    original.train(episodes=9, max_steps_per_episode=20)
+
+    resumed = make_loop(DeterministicLogger())
+    replay_range(resumed, CheckpointStore(path), logger.export(), 4, 8)
+
+    assert all(key.__class__ is State for key in resumed.exploration.state_visit_counter)
@@ -0,0 +1,121 @@
+"""
+contradictions.py
+
+Online detection of contradictory feedback.
+This module:
+- Keeps O(1)-update reward statistics per (state, action):
+  count, min, max, last reward sign and sign changes
+- Flags a contradiction whenever a pair's reward changes sign
+- Emits a SignalType.CONTRADICTION signal for every sign change
+- Records each newly contradicted pair in an UncertaintyModel
+
+Rewards of zero carry no sign and never contradict. State keys follow
+ExplorationStrategy: with a state_encoder the statistics are bounded by
+the encoder size, otherwise one entry is kept per distinct state. An
+encoder that leaves out accumulated_reward is usually what "identical
+states" means here; the raw state almost never repeats.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from core.state import State
+from intelligence.semantics.signals import Provenance, Signal, SignalType
+from uncertainty.confidence import ConfidenceEngine
+
+# Positions in a per-pair statistics list
+COUNT, MIN, MAX, SIGN, SIGN_CHANGES = range(5)
+
+
+class ContradictionDetector:
+    def __init__(self, uncertainty_model=None, state_encoder=None, max_signals: int = 1000):
+        """
+        uncertainty_model: optional UncertaintyModel told about each pair's first contradiction
+        state_encoder: optional learning.state_encoding encoder bounding the statistics
+        max_signals: contradiction signals kept (counts are always exact)
+        """
+        self.uncertainty_model = uncertainty_model
+        self.state_encoder = state_encoder
+        self.max_signals = max_signals
+
+        self.stats: Dict[Any, List[Any]] = {}
+        self.transitions = 0
+        self.contradictions = 0
+        self.contradicted_pairs = 0
+        self.signals: List[Signal] = []
+
+    def observe(self, state, action, reward: float) -> Optional[Signal]:
+        """Update one pair; return a CONTRADICTION signal if its reward changed sign."""
+        self.transitions += 1
+        sign = (reward > 0) - (reward < 0)
+        key = (self._state_key(state), action)
+        stats = self.stats.get(key)
+
+        if stats is None:
+            self.stats[key] = [1, reward, reward, sign, 0]
+            return None
+
+        stats[COUNT] += 1
+        if reward < stats[MIN]:
+            stats[MIN] = reward
+        elif reward > stats[MAX]:
+            stats[MAX] = reward
+
+        if not sign:
+            return None
+        previous = stats[SIGN]
+        stats[SIGN] = sign
+        if previous == sign or not previous:
+            return None
+
+        stats[SIGN_CHANGES] += 1
+        if stats[SIGN_CHANGES] == 1:
+            self.contradicted_pairs += 1
+            if self.uncertainty_model is not None:
+                self.uncertainty_model.record_contradiction(state)
+        return self._contradiction(stats)
+
+    def observe_transition(self, transition: Dict[str, Any]) -> Optional[Signal]:
+        return self.observe(transition["state"], transition["action"], transition["reward"])
+
+    def pair_stats(self, state, action) -> Optional[Dict[str, Any]]:
+        stats = self.stats.get((self._state_key(state), action))
+        if stats is None:
+            return None
+        return {
+            "count": stats[COUNT],
+            "min": stats[MIN],
+            "max": stats[MAX],
+            "sign_changes": stats[SIGN_CHANGES]
+        }
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "transitions": self.transitions,
+            "tracked_pairs": len(self.stats),
+            "contradicted_pairs": self.contradicted_pairs,
+            "contradictions": self.contradictions,
+            "signals": len(self.signals)
+        }
+
+    def _contradiction(self, stats: List[Any]) -> Signal:
+        self.contradictions += 1
+
+        # Evidence grows with visits; uncertainty is the share of
+        # consecutive observations that disagreed
+        signal = Signal(
+            signal_type=SignalType.CONTRADICTION,
+            provenance=Provenance.SYSTEM,
+            severity=min(stats[SIGN_CHANGES], 10),
+            confidence=min(stats[COUNT] / ConfidenceEngine.MAX_VISITS_FOR_FULL_CONFIDENCE, 1.0),
+            uncertainty=stats[SIGN_CHANGES] / (stats[COUNT] - 1)
+        )
+        if len(self.signals) < self.max_signals:
+            self.signals.append(signal)
+        return signal
+
+    def _state_key(self, state):
+        if self.state_encoder is not None:
+            return self.state_encoder.encode(state)
+        if state.__class__ is State:
+            return state
+        return str(state)
@@ -12,6 +12,8 @@ class UncertaintyModel:
     def __init__(self):
         self.unseen_states = set()
         self.partial_observations = 0
+        self.contradictions = 0
+        self.contradicted_states = set()
 
     def register_state(self, state: Dict[str, Any]):
         key = self._safe_state_key(state)
@@ -25,10 +27,17 @@ class UncertaintyModel:
     def record_partial_observation(self):
         self.partial_observations += 1
 
+    def record_contradiction(self, state: Dict[str, Any]):
+        """Conflicting feedback for this state; see uncertainty.contradictions."""
+        self.contradictions += 1
+        self.contradicted_states.add(self._safe_state_key(state))
+
     def snapshot(self) -> dict:
         return {
             "unseen_state_count": len(self.unseen_states),
-            "partial_observation_count": self.partial_observations
+            "partial_observation_count": self.partial_observations,
+            "contradiction_count": self.contradictions,
+            "contradicted_state_count": len(self.contradicted_states)
         }
     
     def _safe_state_key(self, state: Dict[str, Any]) -> str:
@@ -5,8 +5,13 @@ Deterministic logger.
 No timestamps. No randomness.
 """
 
+import json
+import os
+import threading
 from typing import List, Dict, Any
 
+from core.state import to_json_value
+
 class DeterministicLogger:
     def __init__(self):
         self.records: List[Dict[str, Any]] = []
@@ -17,3 +22,165 @@ class DeterministicLogger:
     def export(self) -> List[Dict[str, Any]]:
         # Return copy to prevent external modification
         return self.records.copy()
+
+
+class JsonLinesLogger:
+    """
+    Deterministic logger persisted as one JSON object per line.
+    Keys are sorted so identical records always serialize identically.
+    core.state.State values are written in their dict form.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def log(self, record: Dict[str, Any]) -> None:
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write(json.dumps(to_json_value(record), sort_keys=True) + "\n")
+
+    def log_batch(self, records: List[Dict[str, Any]]) -> None:
+        """Append several records with one open and one write."""
+        if not records:
+            return
+        lines = [json.dumps(to_json_value(record), sort_keys=True) + "\n" for record in records]
+        with open(self.path, "a", encoding="utf-8") as handle:
+            handle.write("".join(lines))
+
+    def flush(self) -> None:
+        """Force written records to stable storage."""
+        with open(self.path, "a", encoding="utf-8") as handle:
+            os.fsync(handle.fileno())
+
+    def export(self) -> List[Dict[str, Any]]:
+        return load_jsonl(self.path)
+
+
+class AsyncLogger:
+    """
+    Wraps a replay logger so records are serialized and written by a
+    background thread, overlapping I/O with episode collection.
+
+    Records are handed over by reference and must not be mutated after
+    log(). The writer swaps out the whole pending buffer at once, so at
+    most 2 * max_pending records are in flight; log() blocks while the
+    pending buffer is full. Records reach the wrapped logger in log()
+    order. flush() returns once every record logged before it has been
+    written and, if the wrapped logger has flush(), made durable.
+    Writer errors are re-raised by the next log(), flush() or close().
+    """
+
+    def __init__(self, logger, max_pending: int = 64):
+        if max_pending <= 0:
+            raise ValueError(f"max_pending must be positive, got {max_pending}")
+
+        self.logger = logger
+        self.max_pending = max_pending
+        self.stalls = 0
+
+        self._pending: List[Dict[str, Any]] = []
+        self._logged = 0
+        self._written = 0
+        self._synced = 0
+        self._sync_target = 0
+        self._error = None
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._drain, name="AsyncLogger", daemon=True)
+        self._thread.start()
+
+    def log(self, record: Dict[str, Any]) -> None:
+        with self._condition:
+            self._raise_writer_error()
+            if self._closed:
+                raise ValueError("Cannot log to a closed AsyncLogger")
+
+            if len(self._pending) >= self.max_pending:
+                # Backpressure: wait for the writer to take the buffer
+                self.stalls += 1
+                while len(self._pending) >= self.max_pending and self._error is None:
+                    self._condition.wait()
+                self._raise_writer_error()
+
+            self._pending.append(record)
+            self._logged += 1
+            self._condition.notify_all()
+
+    def flush(self) -> None:
+        with self._condition:
+            target = self._logged
+            self._sync_target = max(self._sync_target, target)
+            self._condition.notify_all()
+            while self._synced < target and self._error is None:
+                self._condition.wait()
+            self._raise_writer_error()
+
+    def close(self) -> None:
+        with self._condition:
+            if self._closed:
+                self._raise_writer_error()
+                return
+        try:
+            self.flush()
+        finally:
+            with self._condition:
+                self._closed = True
+                self._condition.notify_all()
+            self._thread.join()
+
+    def export(self) -> List[Dict[str, Any]]:
+        self.flush()
+        return self.logger.export()
+
+    def __enter__(self) -> "AsyncLogger":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _raise_writer_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError("AsyncLogger writer failed") from self._error
+
+    def _drain(self) -> None:
+        log_batch = getattr(self.logger, "log_batch", None)
+        sync = getattr(self.logger, "flush", None)
+
+        while True:
+            with self._condition:
+                while not self._pending and self._synced >= self._sync_target and not self._closed:
+                    self._condition.wait()
+                if not self._pending and self._synced >= self._sync_target:
+                    return
+                # Swap buffers: log() keeps filling a fresh list meanwhile
+                batch, self._pending = self._pending, []
+                sync_target = self._sync_target
+                self._condition.notify_all()
+
+            try:
+                if log_batch is not None:
+                    log_batch(batch)
+                else:
+                    for record in batch:
+                        self.logger.log(record)
+                written = self._written + len(batch)
+                durable = written >= sync_target > self._synced
+                if durable and sync is not None:
+                    sync()
+            except BaseException as error:
+                with self._condition:
+                    self._error = error
+                    self._condition.notify_all()
+                return
+
+            with self._condition:
+                self._written = written
+                if durable:
+                    self._synced = written
+                self._condition.notify_all()
+
+
+def load_jsonl(path: str) -> List[Dict[str, Any]]:
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as handle:
+        return [json.loads(line) for line in handle if line.strip()]
@@ -0,0 +1,138 @@
+"""
+memory.py
+
+Per-component memory accounting.
+Reports deep size and element counts for registered components
+and fits a growth slope (bytes per step) for alerting.
+Measures only; never modifies what it measures.
+"""
+
+import sys
+from array import array
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Callable, Dict, List, Optional
+
+# Leaf types: counted with getsizeof, never traversed
+_ATOMIC = (str, bytes, bytearray, int, float, complex, bool, type(None), range, array)
+
+# Code and type objects are shared infrastructure, not component data
+_SKIPPED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+
+def deep_sizeof(obj: Any) -> int:
+    """
+    Total getsizeof of obj and everything reachable from it through
+    containers, instance __dict__ and __slots__. Each object is counted once.
+    """
+    seen = set()
+    total = 0
+    stack = [obj]
+
+    while stack:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SKIPPED):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, _ATOMIC):
+            continue
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+        else:
+            if hasattr(current, "__dict__"):
+                stack.append(vars(current))
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+
+    return total
+
+
+def growth_slope(points: List[Dict[str, Any]], field: str) -> float:
+    """Least-squares slope of points[field] against points['steps']."""
+    if len(points) < 2:
+        return 0.0
+
+    xs = [point["steps"] for point in points]
+    ys = [point[field] for point in points]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    if variance == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+class MemoryAccountant:
+    """
+    Components are registered as zero-argument getters so that
+    rebinding (e.g. logger.records = []) is always picked up.
+
+    Also usable as an instrumentation hook: pass it in
+    Instrumentation(hooks=[...]) to sample every N episodes.
+    """
+
+    def __init__(self, every_episodes: int = 1):
+        self.components: Dict[str, Callable[[], Any]] = {}
+        self.every_episodes = max(1, every_episodes)
+        self.samples: List[Dict[str, Any]] = []
+        self.steps = 0
+        self.episodes = 0
+
+    def register(self, name: str, getter: Callable[[], Any]) -> None:
+        if name in self.components:
+            raise ValueError(f"Component already registered: {name}")
+        self.components[name] = getter
+
+    def register_learning_loop(self, loop, trace=None, uncertainty_model=None) -> None:
+        """Register the long-run structures of a LearningLoop and its peers."""
+        self.register("replay_logger.records", lambda: getattr(loop.replay_logger, "records", None))
+        self.register("exploration.state_visit_counter", lambda: loop.exploration.state_visit_counter)
+        self.register("policy", lambda: loop.policy)
+        if trace is not None:
+            self.register("decision_trace.trace", lambda: trace.trace)
+        if uncertainty_model is not None:
+            self.register("uncertainty.unseen_states", lambda: uncertainty_model.unseen_states)
+
+    def measure(self) -> Dict[str, Dict[str, Optional[int]]]:
+        """Deep bytes and element count per component. Shared objects count in each."""
+        report = {}
+        for name, getter in self.components.items():
+            component = getter()
+            report[name] = {
+                "bytes": deep_sizeof(component),
+                "elements": len(component) if hasattr(component, "__len__") else None
+            }
+        return report
+
+    def sample(self, steps: Optional[int] = None) -> Dict[str, Any]:
+        point = {"steps": self.steps if steps is None else steps, "components": self.measure()}
+        self.samples.append(point)
+        return point
+
+    def on_episode(self, record: Dict[str, Any]) -> None:
+        self.steps += record["steps"]
+        self.episodes += 1
+        if self.episodes % self.every_episodes == 0:
+            self.sample()
+
+    def report(self) -> Dict[str, Any]:
+        """Samples plus per-component growth slopes (bytes and elements per step)."""
+        slopes = {}
+        for name in self.components:
+            points = [
+                {"steps": point["steps"],
+                 "bytes": point["components"][name]["bytes"],
+                 "elements": point["components"][name]["elements"] or 0}
+                for point in self.samples if name in point["components"]
+            ]
+            slopes[name] = {
+                "bytes_per_step": growth_slope(points, "bytes"),
+                "elements_per_step": growth_slope(points, "elements")
+            }
+
+        return {"samples": self.samples, "slopes": slopes}
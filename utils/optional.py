@@ -0,0 +1,21 @@
+"""
+optional.py
+
+Lazy access to optional third-party packages.
+The core system runs on the standard library only;
+bulk-analysis helpers may opt in to NumPy.
+"""
+
+
+def require_numpy(feature: str):
+    """
+    Import and return numpy, or fail with an explicit message
+    naming the feature that needed it.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            f"{feature} requires numpy; install it with 'pip install numpy'"
+        ) from None
+    return numpy
@@ -0,0 +1,240 @@
+"""
+state_store.py
+
+Content-addressed store for states and other repeated JSON values.
+This module:
+- Writes each distinct value once, under an id derived from its content
+- Rewrites log records and traces to refer to state ids, and back
+- Persists as an append-only data file plus a fixed-width index,
+  read through mmap
+
+The id is the first 8 bytes (16 hex digits) of a BLAKE2b digest of the
+value's canonical JSON. The same value always gets the same id, in any
+run, so one store can be shared by the replay log, the decision trace
+store and checkpoints. An index entry is the commit point for its value.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+from core.state import to_json_value
+
+# digest, offset into the data file, length in bytes
+_ENTRY = struct.Struct("<8sQI")
+
+_REFERENCES = (("state", "state_id"), ("next_state", "next_state_id"))
+
+
+def canonical_json(value: Any) -> bytes:
+    # A State gets the same id as the equivalent dict
+    return json.dumps(to_json_value(value), sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def content_id(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _scalar_key(item: Any) -> Tuple:
+    if isinstance(item, tuple):
+        # Nested values may hold floats the outer key cannot see
+        raise TypeError("nested value")
+    if item.__class__ is float:
+        # 0.0 == -0.0 but they serialize differently
+        return (float, repr(item))
+    return (item.__class__, item)
+
+
+def _fast_key(value: Any) -> Optional[Tuple]:
+    """
+    Hashable stand-in for flat dicts, tuples and scalars, so repeated
+    values skip serialization. Types are part of the key: 1, 1.0 and True
+    serialize differently, and floats are keyed by repr so 0.0 and -0.0
+    stay apart. None for values that must be serialized.
+    """
+    try:
+        if isinstance(value, dict):
+            key = ("dict",) + tuple((name, _scalar_key(item)) for name, item in sorted(value.items()))
+        elif isinstance(value, tuple):
+            key = (value.__class__,) + tuple(_scalar_key(item) for item in value)
+        else:
+            key = _scalar_key(value)
+        hash(key)
+        return key
+    except TypeError:
+        return None
+
+
+class StateStore:
+    DATA_FILE = "states.bin"
+    INDEX_FILE = "states.idx"
+
+    def __init__(self, path: Optional[str] = None, max_cached_ids: int = 65_536):
+        """
+        path: optional directory; without one, values are kept in memory
+        max_cached_ids: values remembered for the serialization-free fast
+                        path; the oldest is forgotten first
+        """
+        if max_cached_ids < 0:
+            raise ValueError(f"max_cached_ids must be non-negative, got {max_cached_ids}")
+
+        self.path = path
+        self.max_cached_ids = max_cached_ids
+        self._entries: Dict[str, Tuple[int, int]] = {}
+        self._memory: Dict[str, bytes] = {}
+        self._ids: Dict[Tuple, str] = {}
+        self._map: Optional[mmap.mmap] = None
+        self._data = None
+        self._index = None
+
+        if path is None:
+            return
+
+        os.makedirs(path, exist_ok=True)
+        index_path = os.path.join(path, self.INDEX_FILE)
+        if os.path.exists(index_path):
+            with open(index_path, "rb") as handle:
+                index = handle.read()
+            # A torn trailing entry was never committed
+            for start in range(0, len(index) - _ENTRY.size + 1, _ENTRY.size):
+                digest, offset, length = _ENTRY.unpack_from(index, start)
+                self._entries[digest.hex()] = (offset, length)
+
+        self._data = open(os.path.join(path, self.DATA_FILE), "ab")
+        self._index = open(index_path, "ab")
+        # Continue after the last whole entry if the previous writer was cut off
+        self._index.truncate(len(self._entries) * _ENTRY.size)
+
+    def put(self, value: Any) -> str:
+        """Store value if new; return its content id."""
+        key = _fast_key(value)
+        if key is not None:
+            state_id = self._ids.get(key)
+            if state_id is not None:
+                return state_id
+
+        data = canonical_json(value)
+        state_id = content_id(data)
+
+        if state_id in self._entries or state_id in self._memory:
+            if self._read(state_id) != data:
+                raise ValueError(f"Content id collision for {state_id}")
+        elif self.path is None:
+            self._memory[state_id] = data
+        else:
+            offset = self._data.tell()
+            self._data.write(data)
+            self._index.write(_ENTRY.pack(bytes.fromhex(state_id), offset, len(data)))
+            self._entries[state_id] = (offset, len(data))
+
+        if key is not None and self.max_cached_ids:
+            if len(self._ids) >= self.max_cached_ids:
+                del self._ids[next(iter(self._ids))]
+            self._ids[key] = state_id
+        return state_id
+
+    def get(self, state_id: str) -> Any:
+        """A fresh copy of the stored value."""
+        if state_id not in self._entries and state_id not in self._memory:
+            raise KeyError(f"Unknown state id: {state_id}")
+        return json.loads(self._read(state_id))
+
+    def __contains__(self, state_id: str) -> bool:
+        return state_id in self._entries or state_id in self._memory
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._memory)
+
+    def flush(self) -> None:
+        if self.path is None:
+            return
+        # Data before index: an indexed value is always readable
+        self._data.flush()
+        os.fsync(self._data.fileno())
+        self._index.flush()
+        os.fsync(self._index.fileno())
+
+    def close(self) -> None:
+        """Flush and close the files; stored values remain readable."""
+        if self.path is None or self._data.closed:
+            return
+        self.flush()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._data.close()
+        self._index.close()
+
+    def _read(self, state_id: str) -> bytes:
+        if self.path is None:
+            return self._memory[state_id]
+
+        offset, length = self._entries[state_id]
+        if self._map is None or offset + length > len(self._map):
+            # Values written since the last map are still buffered
+            if not self._data.closed:
+                self._data.flush()
+            if self._map is not None:
+                self._map.close()
+            with open(os.path.join(self.path, self.DATA_FILE), "rb") as handle:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset:offset + length]
+
+
+def compact_trace(trace: List[Dict[str, Any]], store: StateStore) -> List[Dict[str, Any]]:
+    """Copy of trace with state / next_state replaced by state_id / next_state_id."""
+    compacted = []
+    for transition in trace:
+        transition = dict(transition)
+        for field, reference in _REFERENCES:
+            if field in transition:
+                transition[reference] = store.put(transition.pop(field))
+        compacted.append(transition)
+    return compacted
+
+
+def expand_trace(trace: List[Dict[str, Any]], store: StateStore) -> List[Dict[str, Any]]:
+    expanded = []
+    for transition in trace:
+        transition = dict(transition)
+        for field, reference in _REFERENCES:
+            if reference in transition:
+                transition[field] = store.get(transition.pop(reference))
+        expanded.append(transition)
+    return expanded
+
+
+def compact_record(record: Dict[str, Any], store: StateStore) -> Dict[str, Any]:
+    if "episode_trace" not in record:
+        return record
+    return {**record, "episode_trace": compact_trace(record["episode_trace"], store)}
+
+
+def expand_record(record: Dict[str, Any], store: StateStore) -> Dict[str, Any]:
+    if "episode_trace" not in record:
+        return record
+    return {**record, "episode_trace": expand_trace(record["episode_trace"], store)}
+
+
+def expand_records(records: List[Dict[str, Any]], store: StateStore) -> List[Dict[str, Any]]:
+    return [expand_record(record, store) for record in records]
+
+
+class StateRefLogger:
+    """
+    Wraps a replay logger so logged traces refer to states by id.
+    export() returns the records with states restored.
+    """
+
+    def __init__(self, logger, store: StateStore):
+        self.logger = logger
+        self.store = store
+
+    def log(self, record: Dict[str, Any]) -> None:
+        self.logger.log(compact_record(record, self.store))
+
+    def export(self) -> List[Dict[str, Any]]:
+        return expand_records(self.logger.export(), self.store)